@@ -0,0 +1,298 @@
+"""
+Graphical front end for the Car Brand Quiz application.
+"""
+import os
+import time
+import customtkinter as ctk
+from game_logic import GameLogic
+from pages.home_page import HomePage
+from pages.player_input_page import PlayerInputPage
+from pages.game_page import GamePage
+from pages.score_page import ScorePage
+from pages.info_page import InfoPage
+from pages.settings_page import SettingsPage
+from pages.question_manager_page import QuestionManagerPage
+from database_operations import DatabaseOperations
+from utils.asset_scanner import AssetScanner
+from utils.background import BackgroundTasks
+from utils.question_sources import open_question_source
+from utils.resource_cache import ResourceCache
+from utils.change_detector import ChangeDetector
+from utils.decode_worker import DecodeWorker
+from utils.session_journal import SessionJournal
+from utils.db_maintenance import DatabaseMaintenance
+from config import (
+    DEFAULT_WINDOW_SIZE,
+    DEFAULT_WINDOW_POSITION,
+    ASSET_SCAN_DELAY_MS,
+    HOT_RELOAD_INTERVAL_MS,
+    HOT_RELOAD_DIRS,
+    CLUES_DIR,
+    LEADERBOARD_PRUNE_INTERVAL_MS,
+    MAINTENANCE_IDLE_SECONDS,
+    MAINTENANCE_INTERVAL_SECONDS,
+    MAINTENANCE_CHECK_INTERVAL_MS,
+    BACKUP_INTERVAL_SECONDS,
+    QUESTION_SNAPSHOT,
+    CLUE_DECODE_PROCESS
+)
+
+
+class CarBrandQuiz:
+    def __init__(self, pack_path=None, memtracer=None, mount_dirs=()):
+        """
+        Initialize the application.
+
+        Args:
+            pack_path (str, optional): Question pack to play from instead of the database
+            mount_dirs (iterable): Directories of JSON Lines/CSV packs to play as well
+            memtracer (MemoryTracer, optional): Records memory use after every
+                page transition and game
+        """
+        self.pack_path = pack_path
+        self.mount_dirs = list(mount_dirs)
+        self.memtracer = memtracer
+        self.setup_window()
+        self.setup_game()
+        self.create_pages()
+        self.show_home()
+        self.root.after(ASSET_SCAN_DELAY_MS, self.start_asset_scan)
+        self.root.after(ASSET_SCAN_DELAY_MS, self.prune_leaderboards)
+        self.root.after(MAINTENANCE_CHECK_INTERVAL_MS, self.run_idle_maintenance)
+        self.root.after(HOT_RELOAD_INTERVAL_MS, self.check_for_changes)
+
+    def setup_window(self):
+        """Set up the main window."""
+        self.root = ctk.CTk()
+        self.root.title("Car Brand Quiz")
+        self.root.geometry(f"{DEFAULT_WINDOW_SIZE}{DEFAULT_WINDOW_POSITION}")
+        ctk.set_appearance_mode("dark")
+        self.root.resizable(False, False)
+        self.resources = ResourceCache()
+
+        # Any input resets the idle timer used for background maintenance
+        self.last_activity = time.monotonic()
+        for sequence in ('<Any-KeyPress>', '<Any-ButtonPress>', '<Motion>'):
+            self.root.bind_all(sequence, self.note_activity, add='+')
+
+    def setup_game(self):
+        """Initialize game components."""
+        self.db = DatabaseOperations()
+        self.question_source = open_question_source(
+            self.db, self.pack_path, self.mount_dirs, snapshot=QUESTION_SNAPSHOT
+        )
+        self.game_logic = GameLogic()
+        self.tasks = BackgroundTasks(self.root)
+        self.decoder = DecodeWorker(self.root) if CLUE_DECODE_PROCESS else None
+        self.resumable_session = SessionJournal.load()
+        self.journal = SessionJournal()
+        self.maintenance = DatabaseMaintenance()
+        self.last_maintenance = time.monotonic()
+        self.last_backup = self.maintenance.last_backup_time()
+        self.maintenance_running = False
+        self.changes = ChangeDetector(self.db.conn, HOT_RELOAD_DIRS)
+        self.asset_scan_running = False
+        self.asset_scan_again = False
+        self.score = 0
+        self.player_name = None
+        self.current_page = None
+
+    def create_pages(self):
+        """Create all application pages."""
+        self.pages = {
+            'home': HomePage(self.root, self),
+            'player_input': PlayerInputPage(self.root, self),
+            'game': GamePage(self.root, self),
+            'score': ScorePage(self.root, self),
+            'info': InfoPage(self.root, self),
+            'settings': SettingsPage(self.root, self),
+            'questions': QuestionManagerPage(self.root, self)
+        }
+        
+        # Hide all pages initially
+        for page in self.pages.values():
+            page.hide()
+
+    def show_page(self, page_name):
+        """Show specified page and hide current one."""
+        if self.current_page:
+            self.current_page.hide()
+            
+        page = self.pages[page_name]
+        page.reset()
+        page.show()
+        self.current_page = page
+        self.trace_memory(f"page:{page_name}")
+
+    def trace_memory(self, label):
+        """Take a memory checkpoint when running with --memtrace."""
+        if self.memtracer:
+            self.memtracer.checkpoint(
+                label,
+                self.root,
+                pages=self.pages,
+                caches={
+                    'fonts': len(self.resources.fonts),
+                    'images': len(self.resources.images)
+                }
+            )
+
+    # Navigation methods
+    def show_home(self):
+        """Show home page."""
+        self.score = 0
+        self.show_page('home')
+
+    def show_player_input(self):
+        """Show player input page."""
+        self.show_page('player_input')
+
+    def show_game(self):
+        """Show game page."""
+        self.show_page('game')
+
+    def show_high_scores(self):
+        """Show high scores page."""
+        self.show_page('score')
+
+    def show_info(self):
+        """Show info page."""
+        self.show_page('info')
+
+    def show_settings(self):
+        """Show settings page."""
+        self.show_page('settings')
+
+    def show_question_manager(self):
+        """Show question manager page."""
+        self.show_page('questions')
+
+    def start_game(self, player_name, timed=False):
+        """Start game with given player name, optionally against the clock."""
+        self.player_name = player_name
+        self.score = 0
+        self.resumable_session = None
+        self.game_logic.reset_game()
+        self.pages['game'].new_game(timed)
+        self.show_game()
+
+    def resume_game(self):
+        """Continue the game left unfinished by a crash or power loss."""
+        session = self.resumable_session
+        self.resumable_session = None
+        self.player_name = session['player']
+        self.game_logic.restore_statistics(session['statistics'])
+        self.score = self.game_logic.score
+        self.journal.start(
+            session['player'], session['deck'], session['statistics'], session['timed']
+        )
+        self.pages['game'].resume(session['deck'], session['timed'])
+        self.show_game()
+
+    def update_score(self, points):
+        """Update game score."""
+        self.score += points
+        self.pages['game'].update_score_display()
+
+    def start_asset_scan(self):
+        """Check clue images in the background once the window is up."""
+        if self.pack_path:
+            return
+        if self.asset_scan_running:
+            # Files changed mid-scan; look again once it finishes
+            self.asset_scan_again = True
+            return
+        self.asset_scan_running = True
+        AssetScanner.start(self.tasks, self.on_asset_scan_complete, self.on_asset_scan_failed)
+
+    def on_asset_scan_complete(self, flagged):
+        """Keep questions with broken clue images out of the current game."""
+        self.asset_scan_running = False
+        if self.asset_scan_again:
+            self.asset_scan_again = False
+            self.start_asset_scan()
+        if flagged:
+            print(f"{len(flagged)} question(s) have a missing or corrupt clue image")
+        self.pages['game'].drop_questions(flagged)
+
+    def on_asset_scan_failed(self, error):
+        """Report a failed scan; the next change to the clues starts another."""
+        print(f"Error scanning clue assets: {error}")
+        self.asset_scan_running = False
+        self.asset_scan_again = False
+
+    def prune_leaderboards(self):
+        """Drop expired daily and weekly leaderboard buckets, then reschedule."""
+        self.db.prune_leaderboards()
+        self.root.after(LEADERBOARD_PRUNE_INTERVAL_MS, self.prune_leaderboards)
+
+    def check_for_changes(self):
+        """Pick up clue images and database edits made while running, then reschedule."""
+        changes = self.changes.poll()
+        for directory in changes['directories']:
+            self.resources.invalidate(directory)
+            if directory == os.path.abspath(CLUES_DIR):
+                # Re-flags questions as clues come and go; only new or
+                # changed files are opened
+                self.start_asset_scan()
+        if changes['database']:
+            self.reload_questions()
+        self.root.after(HOT_RELOAD_INTERVAL_MS, self.check_for_changes)
+
+    def reload_questions(self):
+        """Refresh everything read from the database after an outside edit."""
+        self.question_source.refresh()
+        self.pages['game'].sync_deck()
+        if self.current_page is self.pages['score']:
+            self.pages['score'].show_leaderboard(self.pages['score'].period)
+        elif self.current_page is self.pages['questions'] and self.pages['questions'].editing_id is None:
+            self.pages['questions'].load_page()
+
+    def note_activity(self, event=None):
+        """Record user input so maintenance waits until the kiosk is idle."""
+        self.last_activity = time.monotonic()
+
+    def run_idle_maintenance(self):
+        """Optimize, vacuum and back up the database in the background while idle."""
+        now = time.monotonic()
+        idle = now - self.last_activity >= MAINTENANCE_IDLE_SECONDS
+        due = now - self.last_maintenance >= MAINTENANCE_INTERVAL_SECONDS
+
+        if idle and due and not self.maintenance_running:
+            backup = time.time() - self.last_backup >= BACKUP_INTERVAL_SECONDS
+            self.maintenance_running = True
+            self.tasks.submit(
+                self.maintenance.run_idle_tasks,
+                backup,
+                callback=self.on_maintenance_complete,
+                error_callback=self.on_maintenance_complete
+            )
+
+        self.root.after(MAINTENANCE_CHECK_INTERVAL_MS, self.run_idle_maintenance)
+
+    def on_maintenance_complete(self, report):
+        """Record when maintenance last ran."""
+        self.maintenance_running = False
+        self.last_maintenance = time.monotonic()
+        if isinstance(report, Exception):
+            print(f"Error during database maintenance: {report}")
+        elif 'backup' in report:
+            self.last_backup = time.time()
+
+    def run(self):
+        """Start the application."""
+        self.root.mainloop()
+        self.pages['game'].flush_answers()
+        self.question_source.close()
+        self.journal.close()
+        if self.decoder:
+            self.decoder.close()
+        if self.memtracer:
+            self.memtracer.close()
+
+        # Databases from before incremental vacuum are converted once; the
+        # VACUUM rewrites the whole file, so it waits until nobody is playing
+        try:
+            self.maintenance.enable_incremental_vacuum()
+        except Exception as e:
+            print(f"Error enabling incremental vacuum: {e}")
@@ -0,0 +1,121 @@
+"""
+Benchmark clue image loading with and without JPEG draft-mode decoding.
+
+Creates a 12 MP JPEG, then loads it at clue size in fresh processes, once
+with a full decode followed by a LANCZOS resize (the old show_clue path) and
+once through ImageHandler.load_clue_image. Reports median latency and peak
+resident memory for each.
+
+Usage:
+    python benchmarks/bench_clue_decode.py [--repeats N] [--size WxH]
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from PIL import Image  # noqa: E402
+from config import CLUE_IMAGE_SIZE  # noqa: E402
+from utils.image_handler import ImageHandler  # noqa: E402
+
+
+def full_decode(path, target_height):
+    """The original show_clue loading path."""
+    original_image = Image.open(path)
+    aspect_ratio = original_image.width / original_image.height
+    target_width = int(target_height * aspect_ratio)
+    return original_image.resize((target_width, target_height), Image.Resampling.LANCZOS)
+
+
+MODES = {
+    'full': full_decode,
+    'draft': ImageHandler.load_clue_image,
+}
+
+
+def make_test_image(path, size):
+    """Write a noisy 12 MP JPEG so the encoder can't compress it away."""
+    noise = Image.effect_noise(size, 64).convert('RGB')
+    gradient = Image.linear_gradient('L').resize(size).convert('RGB')
+    Image.blend(noise, gradient, 0.5).save(path, quality=90)
+
+
+def peak_rss_kb():
+    """
+    Peak resident memory of this process in KiB.
+
+    VmHWM is used where available because ru_maxrss is inherited from the
+    parent across fork and exec, which hides the child's own peak.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_worker(mode, path, repeats):
+    """Time one loading mode in this process and print the results as JSON."""
+    load = MODES[mode]
+    baseline_kb = peak_rss_kb()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        load(path, CLUE_IMAGE_SIZE[1])
+        timings.append((time.perf_counter() - start) * 1000)
+    peak_kb = peak_rss_kb()
+    print(json.dumps({
+        'median_ms': statistics.median(timings),
+        'min_ms': min(timings),
+        'peak_rss_delta_mb': (peak_kb - baseline_kb) / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--size', default='4000x3000', help="Test image size, WxH")
+    parser.add_argument('--worker', nargs=2, metavar=('MODE', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker[0], args.worker[1], args.repeats)
+        return
+
+    size = tuple(int(value) for value in args.size.lower().split('x'))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'clue.jpg')
+        make_test_image(path, size)
+        print(f"Test image: {size[0]}x{size[1]} JPEG, {os.path.getsize(path) / 1e6:.1f} MB on disk")
+        print(f"Target height: {CLUE_IMAGE_SIZE[1]} px, {args.repeats} loads per mode\n")
+
+        results = {}
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, '--repeats', str(args.repeats), '--worker', mode, path],
+                check=True, capture_output=True, text=True
+            ).stdout
+            results[mode] = json.loads(output)
+            print(
+                f"{mode:>6}: median {results[mode]['median_ms']:7.1f} ms, "
+                f"min {results[mode]['min_ms']:7.1f} ms, "
+                f"peak RSS +{results[mode]['peak_rss_delta_mb']:6.1f} MB"
+            )
+
+        speedup = results['full']['median_ms'] / results['draft']['median_ms']
+        print(f"\nDraft decoding is {speedup:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
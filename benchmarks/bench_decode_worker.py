@@ -0,0 +1,108 @@
+"""
+Benchmark how much clue decoding stalls the UI thread.
+
+Writes large noisy PNG and BMP images, then decodes each at clue size while a
+stand-in for the Tk event loop ticks every 4 ms on the main thread, once on a
+worker thread (PIL holds the GIL for parts of it) and once through the
+DecodeWorker process. Reports total decode time and the longest gap between
+ticks; at 60 fps a frame must never wait more than 16.7 ms.
+
+Usage:
+    python benchmarks/bench_decode_worker.py [--size WxH]
+"""
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+import threading
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from PIL import Image  # noqa: E402
+from config import CLUE_IMAGE_SIZE  # noqa: E402
+from utils.decode_worker import DecodeWorker  # noqa: E402
+from utils.image_handler import ImageHandler  # noqa: E402
+
+TICK_SECONDS = 0.004
+
+
+class EventLoop:
+    """Minimal after() scheduler standing in for the Tk main loop."""
+
+    def __init__(self):
+        self.timers = []
+        self.count = 0
+
+    def after(self, ms, func):
+        self.count += 1
+        heapq.heappush(self.timers, (time.perf_counter() + ms / 1000, self.count, func))
+
+    def run_until(self, done):
+        """Tick until done() is true; return the longest gap between ticks in ms."""
+        longest = 0.0
+        last = time.perf_counter()
+        while not done():
+            now = time.perf_counter()
+            longest = max(longest, now - last)
+            last = now
+            while self.timers and self.timers[0][0] <= now:
+                heapq.heappop(self.timers)[2]()
+            time.sleep(TICK_SECONDS)
+        return longest * 1000
+
+
+def decode_on_thread(loop, path):
+    """Decode on a thread of this process, as a thread pool would."""
+    results = []
+    worker = threading.Thread(
+        target=lambda: results.append(ImageHandler.load_clue_image(path, CLUE_IMAGE_SIZE[1]))
+    )
+    worker.start()
+    return loop.run_until(lambda: results)
+
+
+def decode_in_process(loop, decoder, path):
+    """Decode through the worker process."""
+    results = []
+    decoder.decode(path, CLUE_IMAGE_SIZE[1], callback=results.append, error_callback=results.append)
+    return loop.run_until(lambda: results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', default='5000x4000', help="Test image size, WxH")
+    args = parser.parse_args()
+    size = tuple(int(value) for value in args.size.lower().split('x'))
+
+    loop = EventLoop()
+    decoder = DecodeWorker(loop)
+    decoder.start()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image = Image.effect_noise(size, 80).convert('RGB')
+        paths = []
+        for ext in ('png', 'bmp'):
+            path = os.path.join(temp_dir, f'clue.{ext}')
+            image.save(path, **({'compress_level': 1} if ext == 'png' else {}))
+            paths.append(path)
+
+        # Warm up the worker process so its start-up is not measured
+        decode_in_process(loop, decoder, paths[0])
+
+        for path in paths:
+            print(f"{os.path.basename(path)}: {size[0]}x{size[1]}, {os.path.getsize(path) / 1e6:.0f} MB")
+            for mode, run in (('thread', lambda: decode_on_thread(loop, path)),
+                              ('process', lambda: decode_in_process(loop, decoder, path))):
+                start = time.perf_counter()
+                gap_ms = run()
+                total_ms = (time.perf_counter() - start) * 1000
+                print(f"  {mode:>7}: {total_ms:6.0f} ms to decode, longest UI stall {gap_ms:5.1f} ms")
+
+    decoder.close()
+
+
+if __name__ == "__main__":
+    main()
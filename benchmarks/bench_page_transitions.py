@@ -0,0 +1,98 @@
+"""
+Benchmark page transitions with and without the shared UI resource cache.
+
+Builds the application against a copy of the database in fresh processes,
+once with the ResourceCache enabled and once with it disabled (font tuples
+and a logo reopened on every visit, as before the cache), then cycles
+through the pages and reports the time each transition takes to build and
+draw. Needs a display; on a headless machine run it under xvfb-run.
+
+Usage:
+    python benchmarks/bench_page_transitions.py [--rounds N]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import config  # noqa: E402
+
+PAGES = ('home', 'info', 'score', 'player_input', 'game', 'settings')
+MODES = ('uncached', 'cached')
+
+
+def run_worker(mode, data_dir, rounds):
+    """Time page transitions in this process and print the results as JSON."""
+    # Point the app at scratch copies before anything reads the paths
+    config.DB_PATH = os.path.join(data_dir, config.DB_NAME)
+    config.SESSION_JOURNAL_PATH = os.path.join(data_dir, 'session.journal')
+
+    from app import CarBrandQuiz
+
+    app = CarBrandQuiz()
+    app.resources.enabled = mode == 'cached'
+    app.root.update()
+
+    # One untimed pass so first-use costs don't count against either mode
+    for page in PAGES:
+        app.show_page(page)
+    app.root.update()
+
+    timings = []
+    for _ in range(rounds):
+        for page in PAGES:
+            start = time.perf_counter()
+            app.show_page(page)
+            app.root.update()
+            timings.append((time.perf_counter() - start) * 1000)
+
+    app.journal.close()
+    app.root.destroy()
+    timings.sort()
+    print(json.dumps({
+        'median_ms': statistics.median(timings),
+        'p95_ms': timings[int(len(timings) * 0.95) - 1],
+        'transitions': len(timings),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=20, help="Passes through every page")
+    parser.add_argument('--worker', nargs=2, metavar=('MODE', 'DIR'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker[0], args.worker[1], args.rounds)
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        shutil.copy(config.DB_PATH, os.path.join(temp_dir, config.DB_NAME))
+        print(f"{args.rounds} rounds over {len(PAGES)} pages per mode\n")
+
+        results = {}
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, '--rounds', str(args.rounds), '--worker', mode, temp_dir],
+                check=True, capture_output=True, text=True
+            ).stdout
+            results[mode] = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{mode:>8}: median {results[mode]['median_ms']:6.1f} ms, "
+                f"p95 {results[mode]['p95_ms']:6.1f} ms per transition"
+            )
+
+        saved = 1 - results['cached']['median_ms'] / results['uncached']['median_ms']
+        print(f"\nThe resource cache cuts median transition time by {saved:.0%}")
+
+
+if __name__ == "__main__":
+    main()
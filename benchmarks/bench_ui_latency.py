@@ -0,0 +1,299 @@
+"""
+Benchmark how quickly the GUI responds to each user action.
+
+Starts a private Xvfb virtual display (unless --display is given), fills a
+copy of the database with synthetic scores, leaderboard rows and questions,
+and drives CarBrandQuiz from inside its own main loop: every page is visited,
+games are played with clues revealed and answers submitted, and each High
+Scores tab is opened. Actions call the same methods the widgets are bound
+to. Each is timed from the moment it is dispatched until Tk next goes idle,
+i.e. after the resulting redraw, and the report gives p50/p95/p99 per action
+as JSON.
+
+With --baseline, the run is compared with an earlier report and exits with
+status 1 if any action's p95 got slower than the tolerance allows, so it can
+gate changes to show_page, check_answer or the score page.
+
+Usage:
+    python benchmarks/bench_ui_latency.py [--rounds N] [--questions N] [--scores N]
+                                          [-o report.json] [--baseline old.json]
+"""
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict, deque
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import config  # noqa: E402
+
+NAV_PAGES = ('home', 'info', 'settings', 'questions', 'score', 'player_input')
+SCORE_TABS = ('Today', 'This Week', 'All Time')
+SETTLE_MS = 5           # Pause between actions so timers queued by one don't land in the next
+XVFB_SCREEN = '1280x1024x24'
+XVFB_START_TIMEOUT = 10
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples):
+    """Turn per-action timings in ms into count, p50, p95, p99 and max."""
+    report = {}
+    for action, values in sorted(samples.items()):
+        values = sorted(values)
+        report[action] = {
+            'count': len(values),
+            'p50_ms': round(percentile(values, 50), 2),
+            'p95_ms': round(percentile(values, 95), 2),
+            'p99_ms': round(percentile(values, 99), 2),
+            'max_ms': round(values[-1], 2)
+        }
+    return report
+
+
+def fill_database(data_dir, questions, scores):
+    """Copy the database into data_dir and add synthetic questions and scores."""
+    config.DB_PATH = os.path.join(data_dir, config.DB_NAME)
+    shutil.copy(os.path.join(config.DATA_DIR, config.DB_NAME), config.DB_PATH)
+
+    from database_operations import DatabaseOperations, LEADERBOARD_PERIODS
+
+    db = DatabaseOperations()
+    rng = random.Random(0)
+    clues = [row[2] for row in db.select_playable_questions() if row[2]]
+    now = time.time()
+
+    db.cursor.executemany(
+        f'INSERT INTO question (question, {db.image_column}, answer) VALUES (?, ?, ?)',
+        [(f"Synthetic question {i}", clues[i % len(clues)], f"Answer {i}") for i in range(questions)]
+    )
+    players = [(f"Player {i}", rng.randint(0, 300)) for i in range(scores)]
+    db.cursor.executemany('INSERT OR REPLACE INTO score_table (name, score) VALUES (?, ?)', players)
+    db.cursor.executemany(
+        '''
+        INSERT OR REPLACE INTO leaderboard (period, bucket, player, best_score, achieved_at)
+        VALUES (?, ?, ?, ?, ?)
+        ''',
+        [
+            (period, DatabaseOperations.leaderboard_bucket(period, now), name, score, now)
+            for period in LEADERBOARD_PERIODS
+            for name, score in players
+        ]
+    )
+    db.conn.commit()
+    db.conn.close()
+
+
+class LatencyRecorder:
+    """Runs actions one at a time inside the Tk main loop and times each to idle."""
+
+    def __init__(self, root):
+        self.root = root
+        self.steps = deque()
+        self.samples = defaultdict(list)
+
+    def run(self, steps):
+        """Run (name, action) steps in order, then leave the main loop."""
+        self.steps.extend(steps)
+        self.root.after(0, self._next)
+        self.root.mainloop()
+        return self.samples
+
+    def _next(self):
+        if not self.steps:
+            self.root.quit()
+            return
+        name, action = self.steps.popleft()
+        start = time.perf_counter()
+        action()
+        # Idle callbacks run in order, so this one runs after the redraws the action queued
+        self.root.after_idle(self._done, name, start)
+
+    def _done(self, name, start):
+        self.samples[name].append((time.perf_counter() - start) * 1000)
+        self.root.after(SETTLE_MS, self._next)
+
+
+def game_steps(app, answers, rng):
+    """Steps for one game: start it, then reveal clues and answer questions."""
+    page = app.pages['game']
+
+    def answer(correct):
+        question = page.current_question
+        if question is None:
+            return
+        text = str(page.questions[question][2]) if correct else "wrong"
+        page.answer_entry.delete(0, 'end')
+        page.answer_entry.insert(0, text)
+        page.check_answer(question)
+
+    def reveal_clue():
+        if page.current_question is not None and str(page.clue_button.cget('state')) == 'normal':
+            page.clue_button.invoke()
+
+    steps = [('start_game', lambda: app.start_game("Bench"))]
+    for _ in range(answers):
+        for _ in range(rng.choice((0, 0, 1, 2, 3))):
+            steps.append(('show_clue', reveal_clue))
+        correct = rng.random() < 0.7
+        steps.append(('check_answer', lambda correct=correct: answer(correct)))
+    return steps
+
+
+def run_worker(data_dir, rounds, answers):
+    """Drive the app in this process and print the raw timings as JSON."""
+    # Point the app at scratch copies before anything reads the paths
+    config.DB_PATH = os.path.join(data_dir, config.DB_NAME)
+    config.SESSION_JOURNAL_PATH = os.path.join(data_dir, 'session.journal')
+    config.BACKUP_DIR = os.path.join(data_dir, 'backups')
+    config.CLUE_LEVELS_DIR = os.path.join(data_dir, 'clue_levels')
+
+    from app import CarBrandQuiz
+    from utils.image_handler import ImageHandler
+
+    # Clue levels are precomputed at ingest; do the same here so clues show at once
+    for filename in os.listdir(config.CLUES_DIR):
+        if ImageHandler.is_valid_extension(filename):
+            ImageHandler.build_clue_levels(filename)
+
+    app = CarBrandQuiz()
+    rng = random.Random(0)
+    score_page = app.pages['score']
+
+    steps = []
+    for _ in range(rounds):
+        steps += [(f'show_page:{name}', lambda name=name: app.show_page(name)) for name in NAV_PAGES]
+        steps += [
+            (f'score_tab:{tab}', lambda tab=tab: score_page.show_leaderboard(tab))
+            for tab in SCORE_TABS
+        ]
+        steps += game_steps(app, answers, rng)
+        steps.append(('show_page:home', app.show_home))
+
+    # One untimed pass so first-use costs don't count
+    LatencyRecorder(app.root).run(steps[:len(NAV_PAGES)])
+    samples = LatencyRecorder(app.root).run(steps)
+
+    app.pages['game'].flush_answers()
+    app.journal.close()
+    if app.decoder:
+        app.decoder.close()
+    app.root.destroy()
+    print(json.dumps(samples))
+
+
+def start_xvfb():
+    """Start Xvfb on a free display number; return the process and DISPLAY value."""
+    if not shutil.which('Xvfb'):
+        sys.exit("Xvfb not found; install it (e.g. apt install xvfb) or pass --display")
+    number = next(n for n in range(99, 1000) if not os.path.exists(f'/tmp/.X{n}-lock'))
+    process = subprocess.Popen(
+        ['Xvfb', f':{number}', '-screen', '0', XVFB_SCREEN, '-nolisten', 'tcp'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + XVFB_START_TIMEOUT
+    while not os.path.exists(f'/tmp/.X11-unix/X{number}'):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            sys.exit(f"Xvfb failed to start on :{number}")
+        time.sleep(0.05)
+    return process, f':{number}'
+
+
+def compare(report, baseline, tolerance, slack_ms):
+    """
+    List actions whose p95 regressed against a baseline report.
+
+    Returns:
+        list: (action, baseline p95, current p95) tuples
+    """
+    regressions = []
+    for action, stats in report['actions'].items():
+        before = baseline.get('actions', {}).get(action)
+        if before and stats['p95_ms'] > before['p95_ms'] * tolerance + slack_ms:
+            regressions.append((action, before['p95_ms'], stats['p95_ms']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=5, help="Passes through pages and games")
+    parser.add_argument('--answers', type=int, default=20, help="Questions answered per game")
+    parser.add_argument('--questions', type=int, default=5000, help="Synthetic questions added")
+    parser.add_argument('--scores', type=int, default=100000, help="Synthetic players on the leaderboards")
+    parser.add_argument('--display', help="Use this X display instead of starting Xvfb")
+    parser.add_argument('-o', '--output', default='-', help="Report file (default: standard output)")
+    parser.add_argument('--baseline', help="Earlier report to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=1.25,
+                        help="Allowed p95 ratio to the baseline (default: %(default)s)")
+    parser.add_argument('--slack-ms', type=float, default=2.0,
+                        help="Allowed absolute p95 increase on top (default: %(default)s)")
+    parser.add_argument('--worker', metavar='DIR', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.rounds, args.answers)
+        return
+
+    xvfb = None
+    env = dict(os.environ)
+    if args.display:
+        env['DISPLAY'] = args.display
+    else:
+        xvfb, env['DISPLAY'] = start_xvfb()
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fill_database(temp_dir, args.questions, args.scores)
+            output = subprocess.run(
+                [sys.executable, __file__, '--worker', temp_dir,
+                 '--rounds', str(args.rounds), '--answers', str(args.answers)],
+                check=True, capture_output=True, text=True, env=env
+            ).stdout
+    finally:
+        if xvfb:
+            xvfb.terminate()
+            xvfb.wait()
+
+    report = {
+        'settings': {
+            'rounds': args.rounds,
+            'answers': args.answers,
+            'questions': args.questions,
+            'scores': args.scores,
+            'display': 'xvfb' if xvfb else args.display
+        },
+        'actions': summarize(json.loads(output.strip().splitlines()[-1]))
+    }
+    text = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.tolerance, args.slack_ms)
+        for action, before, after in regressions:
+            print(f"REGRESSION {action}: p95 {before:.1f} ms -> {after:.1f} ms", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ DATA_DIR = os.path.join(ASSETS_DIR, 'data')
 # Image directories
 LOGO_DIR = os.path.join(IMAGES_DIR, 'logo')
 CLUES_DIR = os.path.join(IMAGES_DIR, 'clues')
+CLUE_LEVELS_DIR = os.path.join(IMAGES_DIR, 'clue_levels')  # Generated progressive clue images
 
 # Logo settings
 LOGO_PATH = os.path.join(LOGO_DIR, 'python_logo.gif')
@@ -21,6 +22,34 @@ LOGO_SIZE = (60, 60)  # Width, Height for logo
 DB_NAME = 'branddb.db'
 DB_PATH = os.path.join(DATA_DIR, DB_NAME)
 
+# Serve gameplay question reads from an in-memory snapshot of the question bank
+QUESTION_SNAPSHOT = True
+
+# JSON Lines/CSV question packs in this directory are played alongside the database
+PACKS_DIR = os.path.join(DATA_DIR, 'packs')
+
+# Database maintenance settings
+BACKUP_DIR = os.path.join(DATA_DIR, 'backups')
+BACKUP_KEEP = 7                         # Automatic backups kept
+BACKUP_PAGES_PER_STEP = 64              # Pages copied per online backup step
+BACKUP_STEP_PAUSE = 0.005               # Seconds between backup steps
+BACKUP_INTERVAL_SECONDS = 24 * 60 * 60  # Time between automatic backups
+VACUUM_PAGES_PER_RUN = 256              # Free pages released per incremental vacuum
+ANALYSIS_LIMIT = 1000                   # Rows sampled per index by ANALYZE
+STATS_STALE_FRACTION = 0.1              # Row count drift that makes planner statistics stale
+MAINTENANCE_IDLE_SECONDS = 120          # No input for this long counts as idle
+MAINTENANCE_INTERVAL_SECONDS = 60 * 60  # Minimum time between idle maintenance runs
+MAINTENANCE_CHECK_INTERVAL_MS = 60 * 1000
+
+# Memory tracing (--memtrace)
+MEMTRACE_LOG_PATH = os.path.join(DATA_DIR, 'memtrace.log')
+MEMTRACE_THRESHOLD_KB = 256     # Growth between repeats of a checkpoint that gets flagged
+MEMTRACE_FRAMES = 5             # Stack frames kept per traced allocation
+
+# Session checkpoint settings
+SESSION_JOURNAL_PATH = os.path.join(DATA_DIR, 'session.journal')
+SESSION_COMPACT_EVERY = 50    # Answers appended before the journal is compacted
+
 # Window settings
 DEFAULT_WINDOW_SIZE = '640x600'
 DEFAULT_WINDOW_POSITION = '+250+150'
@@ -47,10 +76,63 @@ NORMAL_FONT_SIZE = 12
 # Image settings
 CLUE_IMAGE_SIZE = (500, 300)  # Width, Height for clue images
 LOGO_IMAGE_SIZE = (60, 60)    # Width, Height for logo
+THUMBNAIL_SIZE = (48, 48)     # Width, Height for question list previews
+PREVIEW_SIZE = (160, 100)     # Width, Height for the clue preview when adding questions
+
+# Decode clue images in a worker process so large files never stall the UI
+CLUE_DECODE_PROCESS = True
+DECODE_POLL_INTERVAL_MS = 15
+
+# Question authoring
+DEFAULT_IMPORT_QUESTION = "Which car brand does this logo belong to?"  # For multi-image imports
+
+# Duplicate clue detection
+PHASH_BANDS = 8               # Perceptual hash split into 8-bit bands for lookup
+PHASH_MAX_DISTANCE = 6        # Differing bits below which clues count as near-duplicates
+CLUE_ORPHAN_GRACE_SECONDS = 24 * 60 * 60  # Unused clues stay this long, e.g. between Browse and Add Question
 
 # Game settings
 POINTS_FOR_CORRECT = 10
 POINTS_FOR_CLUE = -5
+CLUE_LEVEL_POINTS = (-2, -3, POINTS_FOR_CLUE)  # Total clue cost by level: pixelated, partial, full
+CLUE_PIXEL_BLOCK = 20           # Size of the blocks in the pixelated clue
+CLUE_PARTIAL_REVEAL = 0.5       # Share of the width and height shown sharp in the partial clue
+TIMED_QUESTION_SECONDS = 15     # Countdown per question in timed mode
+SPEED_BONUS_MAX = 5             # Bonus for an instant correct answer in timed mode, scaled by time left
+ANSWER_BATCH_SIZE = 10          # Answers buffered before their statistics are written
+QUESTIONS_PER_GAME = 0          # Questions drawn per game, favouring weak ones; 0 deals every question
+ACHIEVEMENT_STREAK = 5          # Correct answers in a row for "Hot Streak"
+ACHIEVEMENT_SCORE = 100         # Points for "Century"
+ACHIEVEMENT_NO_CLUE_COUNT = 10  # Questions answered without any clue for "No Help Needed"
+
+# Simulator settings
+SIMULATOR_QUESTIONS_PER_GAME = 13   # Size of the bundled question bank
+SIMULATOR_CHUNK_SIZE = 20000        # Games per worker task
+
+# Leaderboard settings
+LEADERBOARD_SIZE = 100                  # Rows shown per leaderboard
+LEADERBOARD_KEEP_DAYS = 14              # Daily buckets kept before pruning
+LEADERBOARD_KEEP_WEEKS = 12             # Weekly buckets kept before pruning
+LEADERBOARD_PRUNE_INTERVAL_MS = 6 * 60 * 60 * 1000
+
+# Rows fetched per round trip when exporting
+EXPORT_CHUNK_SIZE = 5000
+
+# Adaptive question scheduling
+SCHEDULER_NEW_WEIGHT = 1.0              # Draw weight of questions never seen by the player
+SCHEDULER_MIN_WEIGHT = 0.05             # Mastered questions still come up now and then
+SCHEDULER_SLOW_ANSWER_MS = 15000        # Average answer time counted as slow
+SCHEDULER_REVIEW_HALF_LIFE_DAYS = 3.0   # Time for a seen question to become half due again
+
+# Delay before the background clue integrity scan starts
+ASSET_SCAN_DELAY_MS = 1000
+
+# Hot reload: how often to look for new clues and outside database edits
+HOT_RELOAD_INTERVAL_MS = 2000
+HOT_RELOAD_DIRS = [CLUES_DIR, LOGO_DIR]
+
+# Question management settings
+QUESTIONS_PER_PAGE = 20
 
 def ensure_directories():
     """Create necessary directories if they don't exist."""
@@ -59,7 +141,8 @@ def ensure_directories():
         IMAGES_DIR,
         DATA_DIR,
         LOGO_DIR,
-        CLUES_DIR
+        CLUES_DIR,
+        CLUE_LEVELS_DIR
     ]
     for directory in directories:
         os.makedirs(directory, exist_ok=True)
@@ -1,8 +1,28 @@
 """
 Database operations for the Car Brand Quiz application.
 """
+import datetime
+import re
 import sqlite3
-from config import DB_PATH
+import time
+from config import (
+    DB_PATH,
+    PHASH_BANDS,
+    PHASH_MAX_DISTANCE,
+    CLUE_ORPHAN_GRACE_SECONDS,
+    LEADERBOARD_KEEP_DAYS,
+    LEADERBOARD_KEEP_WEEKS,
+    EXPORT_CHUNK_SIZE,
+    get_clue_path
+)
+
+# Each leaderboard bucket is named by the local date it starts on: the day
+# itself, or the Monday of its week, so weeks run on across New Year.
+# These SQLite date() modifiers give that date; leaderboard_bucket matches them.
+LEADERBOARD_PERIODS = {
+    'daily': (),
+    'weekly': ('-6 days', 'weekday 1')
+}
 
 
 class DatabaseOperations:
@@ -15,6 +35,9 @@ class DatabaseOperations:
     def _create_tables(self):
         """Create necessary database tables if they don't exist."""
         try:
+            # New databases free their pages incrementally (no effect once tables exist)
+            self.cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+
             # Create questions table
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS question (
@@ -26,6 +49,68 @@ class DatabaseOperations:
                 )
             ''')
 
+            self._detect_question_columns()
+            self._create_search_index()
+
+            # Create clue image registry: content hash plus perceptual hash bands
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS clue_asset (
+                    filename TEXT PRIMARY KEY,
+                    sha256 TEXT UNIQUE NOT NULL,
+                    phash TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS clue_phash_band (
+                    band INTEGER NOT NULL,
+                    value INTEGER NOT NULL,
+                    filename TEXT NOT NULL,
+                    PRIMARY KEY (band, value, filename)
+                ) WITHOUT ROWID
+            ''')
+
+            # Create table of questions whose clue image is missing or corrupt
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS question_flag (
+                    question_id INTEGER PRIMARY KEY,
+                    reason TEXT NOT NULL,
+                    flagged_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Count changes to playable questions, so snapshots know when to reload
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS question_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    version INTEGER NOT NULL
+                )
+            ''')
+            self.cursor.execute('INSERT OR IGNORE INTO question_version (id, version) VALUES (0, 0)')
+            for table in ('question', 'question_flag'):
+                for event in ('INSERT', 'UPDATE', 'DELETE'):
+                    self.cursor.execute(f'''
+                        CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()}
+                        AFTER {event} ON {table} BEGIN
+                            UPDATE question_version SET version = version + 1 WHERE id = 0;
+                        END
+                    ''')
+
+            # Create per-player, per-question answer statistics
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS question_stats (
+                    player TEXT NOT NULL,
+                    question_id INTEGER NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    correct INTEGER NOT NULL DEFAULT 0,
+                    clues_used INTEGER NOT NULL DEFAULT 0,
+                    total_response_ms INTEGER NOT NULL DEFAULT 0,
+                    last_seen REAL NOT NULL,
+                    PRIMARY KEY (player, question_id)
+                ) WITHOUT ROWID
+            ''')
+
             # Create score table
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS score_table (
@@ -34,11 +119,164 @@ class DatabaseOperations:
                 )
             ''')
 
+            # Create history of every finished game
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS game_history (
+                    id INTEGER PRIMARY KEY,
+                    player TEXT NOT NULL,
+                    score INTEGER NOT NULL,
+                    questions_answered INTEGER NOT NULL,
+                    clues_used INTEGER NOT NULL,
+                    best_streak INTEGER NOT NULL,
+                    duration_ms INTEGER NOT NULL,
+                    finished_at REAL NOT NULL
+                )
+            ''')
+            self.cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_game_history_player ON game_history (player, finished_at)'
+            )
+
+            # Create per-player aggregates, maintained alongside game_history
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS player_stats (
+                    player TEXT PRIMARY KEY,
+                    games_played INTEGER NOT NULL,
+                    total_score INTEGER NOT NULL,
+                    best_score INTEGER NOT NULL,
+                    total_questions INTEGER NOT NULL,
+                    total_clues INTEGER NOT NULL,
+                    best_streak INTEGER NOT NULL,
+                    last_played REAL NOT NULL
+                )
+            ''')
+
+            # Create windowed leaderboards, one bucket per day or week
+            self.cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'leaderboard'"
+            )
+            leaderboard_exists = self.cursor.fetchone() is not None
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS leaderboard (
+                    period TEXT NOT NULL,
+                    bucket TEXT NOT NULL,
+                    player TEXT NOT NULL,
+                    best_score INTEGER NOT NULL,
+                    achieved_at REAL NOT NULL,
+                    PRIMARY KEY (period, bucket, player)
+                ) WITHOUT ROWID
+            ''')
+            self.cursor.execute(
+                '''
+                CREATE INDEX IF NOT EXISTS idx_leaderboard_rank
+                ON leaderboard (period, bucket, best_score DESC, achieved_at)
+                '''
+            )
+            self.cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_score_table_score ON score_table (score DESC)'
+            )
+            if not leaderboard_exists:
+                # Fill the buckets from games recorded before leaderboards existed
+                self._backfill_leaderboard(LEADERBOARD_PERIODS)
+            else:
+                # Weekly buckets used to be named '%Y-W%W', which split the
+                # week at New Year; rebuild them under the Monday's date
+                self.cursor.execute(
+                    "DELETE FROM leaderboard WHERE period = 'weekly' AND bucket LIKE '%-W%'"
+                )
+                if self.cursor.rowcount:
+                    self._backfill_leaderboard(['weekly'])
+
             self.conn.commit()
         except Exception as e:
             print(f"Error creating tables: {e}")
             self.conn.rollback()
 
+    def _backfill_leaderboard(self, periods):
+        """
+        Fill leaderboard buckets from game_history.
+        With max(), SQLite takes finished_at from the best game.
+
+        Args:
+            periods (iterable): Periods to fill
+        """
+        for period in periods:
+            modifiers = LEADERBOARD_PERIODS[period]
+            placeholders = ''.join(', ?' for _ in modifiers)
+            self.cursor.execute(
+                f'''
+                INSERT INTO leaderboard (period, bucket, player, best_score, achieved_at)
+                SELECT ?, date(finished_at, 'unixepoch', 'localtime'{placeholders}),
+                       player, max(score), finished_at
+                FROM game_history
+                GROUP BY 2, player
+                ON CONFLICT (period, bucket, player) DO NOTHING
+                ''',
+                (period, *modifiers)
+            )
+
+    def _detect_question_columns(self):
+        """
+        Work out which column holds the clue image filename.
+
+        Older databases store it in ``path`` rather than ``image_filename``.
+        """
+        self.cursor.execute('PRAGMA table_info(question)')
+        columns = [row[1] for row in self.cursor.fetchall()]
+        self.image_column = 'image_filename' if 'image_filename' in columns else 'path'
+
+    def _create_search_index(self):
+        """
+        Create the FTS5 index over questions and the triggers keeping it in sync.
+
+        The index is an external-content table, so question text is not stored
+        twice. It is rebuilt from the question table the first time it is created.
+        """
+        self.fts_enabled = False
+        try:
+            self.cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'question_fts'"
+            )
+            exists = self.cursor.fetchone() is not None
+
+            self.cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS question_fts USING fts5(
+                    question,
+                    answer,
+                    content='question',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            ''')
+
+            self.cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS question_fts_insert AFTER INSERT ON question BEGIN
+                    INSERT INTO question_fts (rowid, question, answer)
+                    VALUES (new.id, new.question, new.answer);
+                END
+            ''')
+            self.cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS question_fts_delete AFTER DELETE ON question BEGIN
+                    INSERT INTO question_fts (question_fts, rowid, question, answer)
+                    VALUES ('delete', old.id, old.question, old.answer);
+                END
+            ''')
+            self.cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS question_fts_update AFTER UPDATE ON question BEGIN
+                    INSERT INTO question_fts (question_fts, rowid, question, answer)
+                    VALUES ('delete', old.id, old.question, old.answer);
+                    INSERT INTO question_fts (rowid, question, answer)
+                    VALUES (new.id, new.question, new.answer);
+                END
+            ''')
+
+            if not exists:
+                self.cursor.execute("INSERT INTO question_fts (question_fts) VALUES ('rebuild')")
+
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            # SQLite builds without FTS5 fall back to LIKE matching
+            print(f"Full-text search unavailable: {e}")
+
     def insert_question(self, question, image_filename, answer):
         """
         Insert a new question into the database.
@@ -46,14 +284,14 @@ class DatabaseOperations:
         Args:
             question (str): The question text
             image_filename (str): Name of the clue image file
-            answer (set): Set containing the correct answer(s)
+            answer (str): The correct answer
         
         Returns:
             bool: True if successful, False otherwise
         """
         try:
             self.cursor.execute(
-                'INSERT INTO question (question, image_filename, answer) VALUES (?, ?, ?)',
+                f'INSERT INTO question (question, {self.image_column}, answer) VALUES (?, ?, ?)',
                 (question, image_filename, str(answer))
             )
             self.conn.commit()
@@ -77,6 +315,596 @@ class DatabaseOperations:
             print(f"Error selecting questions: {e}")
             return []
 
+    def select_playable_questions(self):
+        """
+        Retrieve all questions whose clue image has not been flagged as broken.
+        
+        Returns:
+            list: List of (id, question, image_filename, answer) tuples
+        """
+        try:
+            self.cursor.execute(
+                f'''
+                SELECT id, question, {self.image_column}, answer
+                FROM question
+                WHERE id NOT IN (SELECT question_id FROM question_flag)
+                '''
+            )
+            return self.cursor.fetchall()
+        except Exception as e:
+            print(f"Error selecting playable questions: {e}")
+            return []
+
+    def select_playable_question_ids(self):
+        """
+        Retrieve the ids of every question whose clue image has not been flagged.
+        
+        Returns:
+            list: Question ids
+        """
+        try:
+            self.cursor.execute(
+                'SELECT id FROM question WHERE id NOT IN (SELECT question_id FROM question_flag)'
+            )
+            return [row[0] for row in self.cursor.fetchall()]
+        except Exception as e:
+            print(f"Error selecting playable questions: {e}")
+            return []
+
+    def count_playable_questions(self):
+        """
+        Count the questions whose clue image has not been flagged.
+        
+        Returns:
+            int: Number of playable questions
+        """
+        try:
+            self.cursor.execute(
+                'SELECT COUNT(*) FROM question WHERE id NOT IN (SELECT question_id FROM question_flag)'
+            )
+            return self.cursor.fetchone()[0]
+        except Exception as e:
+            print(f"Error counting playable questions: {e}")
+            return 0
+
+    def get_playable_question(self, question_id):
+        """
+        Get a question by id, unless its clue image has been flagged.
+        
+        Args:
+            question_id (int): Id of the question
+        
+        Returns:
+            tuple: (id, question, image_filename, answer), or None if not found
+        """
+        try:
+            self.cursor.execute(
+                f'''
+                SELECT id, question, {self.image_column}, answer
+                FROM question
+                WHERE id = ? AND id NOT IN (SELECT question_id FROM question_flag)
+                ''',
+                (question_id,)
+            )
+            return self.cursor.fetchone()
+        except Exception as e:
+            print(f"Error getting question: {e}")
+            return None
+
+    def get_question_version(self):
+        """
+        Get the change counter of the question bank.
+
+        It goes up whenever a question is added, edited or deleted, or a
+        clue flag changes, on any connection.
+
+        Returns:
+            int: Current version, or None on error
+        """
+        try:
+            self.cursor.execute('SELECT version FROM question_version WHERE id = 0')
+            row = self.cursor.fetchone()
+            return row[0] if row else 0
+        except Exception as e:
+            print(f"Error reading question version: {e}")
+            return None
+
+    def update_question_flags(self, clue_status):
+        """
+        Flag every question whose clue image is missing or corrupt.
+
+        Updates all flags in a single transaction, so questions whose clue
+        has been fixed become playable again.
+        
+        Args:
+            clue_status (dict): Maps each clue filename on disk to True if valid
+        
+        Returns:
+            dict: Maps each flagged question id to 'missing' or 'corrupt'
+        """
+        try:
+            self.cursor.execute('''
+                CREATE TEMP TABLE IF NOT EXISTS clue_status (
+                    filename TEXT PRIMARY KEY,
+                    valid INTEGER NOT NULL
+                )
+            ''')
+            self.cursor.execute('DELETE FROM clue_status')
+            self.cursor.executemany(
+                'INSERT INTO clue_status (filename, valid) VALUES (?, ?)',
+                [(filename, int(valid)) for filename, valid in clue_status.items()]
+            )
+            broken = f'''
+                SELECT q.id, CASE WHEN s.filename IS NULL THEN 'missing' ELSE 'corrupt' END
+                FROM question AS q
+                LEFT JOIN clue_status AS s ON s.filename = q.{self.image_column}
+                WHERE s.valid IS NOT 1
+            '''
+            self.cursor.execute(
+                f'DELETE FROM question_flag WHERE question_id NOT IN (SELECT id FROM ({broken}))'
+            )
+            # WHERE true is needed for an upsert on INSERT ... SELECT
+            self.cursor.execute(
+                f'''
+                INSERT INTO question_flag (question_id, reason)
+                SELECT * FROM ({broken}) WHERE true
+                ON CONFLICT (question_id) DO UPDATE SET
+                    reason = excluded.reason,
+                    flagged_at = CURRENT_TIMESTAMP
+                WHERE reason != excluded.reason
+                '''
+            )
+            self.conn.commit()
+
+            self.cursor.execute('SELECT question_id, reason FROM question_flag')
+            return dict(self.cursor.fetchall())
+        except Exception as e:
+            print(f"Error updating question flags: {e}")
+            self.conn.rollback()
+            return {}
+
+    def unique_question_text(self, question):
+        """
+        Make question text unique by numbering repeats, e.g. 'Which brand? (2)'.
+
+        Args:
+            question (str): The question text wanted
+
+        Returns:
+            str: The text itself if unused, otherwise the first free numbered form
+        """
+        try:
+            self.cursor.execute(
+                "SELECT question FROM question WHERE question = ? OR question LIKE ? ESCAPE '\\'",
+                (question, re.sub(r'([%_\\])', r'\\\1', question) + ' (%)')
+            )
+            taken = {row[0] for row in self.cursor.fetchall()}
+        except Exception as e:
+            print(f"Error checking question text: {e}")
+            return question
+
+        if question not in taken:
+            return question
+        number = 2
+        while f"{question} ({number})" in taken:
+            number += 1
+        return f"{question} ({number})"
+
+    def count_questions(self):
+        """
+        Count the questions in the database.
+        
+        Returns:
+            int: Number of questions
+        """
+        try:
+            self.cursor.execute('SELECT COUNT(*) FROM question')
+            return self.cursor.fetchone()[0]
+        except Exception as e:
+            print(f"Error counting questions: {e}")
+            return 0
+
+    def select_question_page(self, after_id=0, limit=20):
+        """
+        Retrieve one page of questions ordered by id.
+
+        Uses keyset pagination on the primary key, so every page costs the
+        same no matter how deep into the table it is.
+        
+        Args:
+            after_id (int): Only return questions with an id above this one
+            limit (int): Maximum number of questions to return
+        
+        Returns:
+            list: List of (id, question, image_filename, answer) tuples
+        """
+        try:
+            self.cursor.execute(
+                f'''
+                SELECT id, question, {self.image_column}, answer
+                FROM question
+                WHERE id > ?
+                ORDER BY id
+                LIMIT ?
+                ''',
+                (after_id, limit)
+            )
+            return self.cursor.fetchall()
+        except Exception as e:
+            print(f"Error selecting question page: {e}")
+            return []
+
+    def update_question(self, question_id, question, image_filename, answer):
+        """
+        Update an existing question.
+        
+        Args:
+            question_id (int): Id of the question to update
+            question (str): The question text
+            image_filename (str): Name of the clue image file
+            answer (str): The correct answer
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.cursor.execute(
+                f'UPDATE question SET question = ?, {self.image_column} = ?, answer = ? WHERE id = ?',
+                (question, image_filename, answer, question_id)
+            )
+            self.conn.commit()
+            return self.cursor.rowcount == 1
+        except Exception as e:
+            print(f"Error updating question: {e}")
+            self.conn.rollback()
+            return False
+
+    def delete_questions(self, question_ids):
+        """
+        Delete several questions in a single transaction.
+        
+        Args:
+            question_ids (iterable): Ids of the questions to delete
+        
+        Returns:
+            int: Number of questions deleted, or 0 on error
+        """
+        try:
+            self.cursor.executemany(
+                'DELETE FROM question WHERE id = ?',
+                [(question_id,) for question_id in question_ids]
+            )
+            deleted = self.cursor.rowcount
+            self.conn.commit()
+            return deleted
+        except Exception as e:
+            print(f"Error deleting questions: {e}")
+            self.conn.rollback()
+            return 0
+
+    @staticmethod
+    def _build_match_query(query):
+        """
+        Turn free text into a safe FTS5 MATCH expression.
+
+        Each word becomes a quoted prefix term, so user input can never be
+        parsed as FTS5 syntax.
+
+        Args:
+            query (str): Free text typed by the user
+
+        Returns:
+            str: MATCH expression, or an empty string if there are no words
+        """
+        terms = re.findall(r'\w+', query, flags=re.UNICODE)
+        return ' '.join(f'"{term}"*' for term in terms)
+
+    def search_questions(self, query, limit=20, offset=0):
+        """
+        Search questions and answers, best matches first.
+        
+        Args:
+            query (str): Free text to search for
+            limit (int): Maximum number of results
+            offset (int): Number of results to skip, for paging
+        
+        Returns:
+            list: List of (id, question, image_filename, answer) tuples
+        """
+        try:
+            if self.fts_enabled:
+                match = self._build_match_query(query)
+                if not match:
+                    return []
+                self.cursor.execute(
+                    f'''
+                    SELECT q.id, q.question, q.{self.image_column}, q.answer
+                    FROM question_fts
+                    JOIN question AS q ON q.id = question_fts.rowid
+                    WHERE question_fts MATCH ?
+                    ORDER BY bm25(question_fts, 2.0, 1.0)
+                    LIMIT ? OFFSET ?
+                    ''',
+                    (match, limit, offset)
+                )
+            else:
+                pattern = f"%{query.strip()}%"
+                self.cursor.execute(
+                    f'''
+                    SELECT id, question, {self.image_column}, answer
+                    FROM question
+                    WHERE question LIKE ? OR answer LIKE ?
+                    ORDER BY id
+                    LIMIT ? OFFSET ?
+                    ''',
+                    (pattern, pattern, limit, offset)
+                )
+            return self.cursor.fetchall()
+        except Exception as e:
+            print(f"Error searching questions: {e}")
+            return []
+
+    def open_clue(self, question_id, image_filename):
+        """
+        Locate a question's clue image.
+        
+        Args:
+            question_id (int): Id of the question
+            image_filename (str): Name of the clue image file
+        
+        Returns:
+            str: Path of the clue image, suitable for Image.open
+        """
+        return get_clue_path(image_filename)
+
+    def find_clue_asset(self, sha256):
+        """
+        Find a stored clue image by its content hash.
+        
+        Args:
+            sha256 (str): Hex SHA-256 of the image file
+        
+        Returns:
+            str: Filename of the stored clue, or None if not stored
+        """
+        try:
+            self.cursor.execute('SELECT filename FROM clue_asset WHERE sha256 = ?', (sha256,))
+            row = self.cursor.fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            print(f"Error finding clue asset: {e}")
+            return None
+
+    def register_clue_asset(self, filename, sha256, phash, size):
+        """
+        Record a stored clue image and its perceptual hash. Registering an
+        image again restarts its grace period before orphan collection.
+        
+        Args:
+            filename (str): Name of the clue image file
+            sha256 (str): Hex SHA-256 of the image file
+            phash (int): 64-bit perceptual hash of the image
+            size (int): File size in bytes
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.cursor.execute(
+                'INSERT OR IGNORE INTO clue_asset (filename, sha256, phash, size) VALUES (?, ?, ?, ?)',
+                (filename, sha256, f'{phash:016x}', size)
+            )
+            self.cursor.execute(
+                'UPDATE clue_asset SET created_at = CURRENT_TIMESTAMP WHERE filename = ?',
+                (filename,)
+            )
+            self.cursor.executemany(
+                'INSERT OR IGNORE INTO clue_phash_band (band, value, filename) VALUES (?, ?, ?)',
+                [(band, value, filename) for band, value in enumerate(self._phash_bands(phash))]
+            )
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error registering clue asset: {e}")
+            self.conn.rollback()
+            return False
+
+    def touch_clue_asset(self, filename):
+        """
+        Restart a stored clue image's grace period, as it is about to be used.
+        
+        Args:
+            filename (str): Name of the clue image file
+        
+        Returns:
+            bool: True if the image is registered, False otherwise
+        """
+        try:
+            self.cursor.execute(
+                'UPDATE clue_asset SET created_at = CURRENT_TIMESTAMP WHERE filename = ?',
+                (filename,)
+            )
+            self.conn.commit()
+            return self.cursor.rowcount > 0
+        except Exception as e:
+            print(f"Error touching clue asset: {e}")
+            self.conn.rollback()
+            return False
+
+    @staticmethod
+    def _phash_bands(phash):
+        """Split a 64-bit perceptual hash into PHASH_BANDS equal bands."""
+        bits = 64 // PHASH_BANDS
+        mask = (1 << bits) - 1
+        return [(phash >> (band * bits)) & mask for band in range(PHASH_BANDS)]
+
+    def find_similar_clues(self, phash, max_distance=PHASH_MAX_DISTANCE):
+        """
+        Find stored clue images that look like the given one.
+
+        Two hashes within max_distance bits of each other must share at least
+        one band when max_distance is below the number of bands, so only
+        clues sharing a band are compared.
+        
+        Args:
+            phash (int): 64-bit perceptual hash to compare against
+            max_distance (int): Maximum number of differing bits
+        
+        Returns:
+            list: List of (filename, distance) tuples, closest first
+        """
+        try:
+            bands = list(enumerate(self._phash_bands(phash)))
+            conditions = ' OR '.join(['(b.band = ? AND b.value = ?)'] * len(bands))
+            self.cursor.execute(
+                f'''
+                SELECT DISTINCT a.filename, a.phash
+                FROM clue_phash_band AS b
+                JOIN clue_asset AS a ON a.filename = b.filename
+                WHERE {conditions}
+                ''',
+                [value for band in bands for value in band]
+            )
+            matches = []
+            for filename, other in self.cursor.fetchall():
+                distance = bin(phash ^ int(other, 16)).count('1')
+                if distance <= max_distance:
+                    matches.append((filename, distance))
+            return sorted(matches, key=lambda match: match[1])
+        except Exception as e:
+            print(f"Error finding similar clues: {e}")
+            return []
+
+    def select_orphan_clue_assets(self, grace_seconds=CLUE_ORPHAN_GRACE_SECONDS):
+        """
+        Find stored clue images no question refers to any more.
+
+        Images are registered before the question that uses them is saved,
+        so recently registered ones are left alone.
+        
+        Args:
+            grace_seconds (int): Minimum age of an image before it is collected
+        
+        Returns:
+            list: Filenames of unreferenced clue images
+        """
+        try:
+            self.cursor.execute(
+                f'''
+                SELECT filename FROM clue_asset
+                WHERE created_at <= datetime('now', ?)
+                    AND NOT EXISTS (
+                        SELECT 1 FROM question WHERE question.{self.image_column} = clue_asset.filename
+                    )
+                ''',
+                (f'-{int(grace_seconds)} seconds',)
+            )
+            return [row[0] for row in self.cursor.fetchall()]
+        except Exception as e:
+            print(f"Error selecting orphan clue assets: {e}")
+            return []
+
+    def delete_clue_assets(self, filenames):
+        """
+        Remove clue images from the registry in a single transaction.
+        
+        Args:
+            filenames (iterable): Names of the clue image files
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            params = [(filename,) for filename in filenames]
+            self.cursor.executemany('DELETE FROM clue_phash_band WHERE filename = ?', params)
+            self.cursor.executemany('DELETE FROM clue_asset WHERE filename = ?', params)
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error deleting clue assets: {e}")
+            self.conn.rollback()
+            return False
+
+    def record_answer(self, player, question_id, is_correct, used_clue, response_ms):
+        """
+        Add one answer to a player's statistics for a question.
+        
+        Args:
+            player (str): Player's name
+            question_id (int): Id of the question answered
+            is_correct (bool): Whether the answer was correct
+            used_clue (bool): Whether a clue was used
+            response_ms (int): Time from showing the question to the answer
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.record_answers(
+            player, [(question_id, is_correct, used_clue, response_ms, time.time())]
+        )
+
+    def record_answers(self, player, answers):
+        """
+        Add a batch of answers to a player's statistics in one transaction.
+        
+        Args:
+            player (str): Player's name
+            answers (list): (question_id, is_correct, used_clue, response_ms,
+                            answered_at) tuples, answered_at in unix time
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.cursor.executemany(
+                '''
+                INSERT INTO question_stats
+                    (player, question_id, attempts, correct, clues_used, total_response_ms, last_seen)
+                VALUES (?, ?, 1, ?, ?, ?, ?)
+                ON CONFLICT (player, question_id) DO UPDATE SET
+                    attempts = attempts + 1,
+                    correct = correct + excluded.correct,
+                    clues_used = clues_used + excluded.clues_used,
+                    total_response_ms = total_response_ms + excluded.total_response_ms,
+                    last_seen = excluded.last_seen
+                ''',
+                [
+                    (player, question_id, int(is_correct), int(used_clue), int(response_ms), answered_at)
+                    for question_id, is_correct, used_clue, response_ms, answered_at in answers
+                ]
+            )
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error recording answers: {e}")
+            self.conn.rollback()
+            return False
+
+    def select_question_stats(self, player):
+        """
+        Retrieve a player's statistics for every question they have answered.
+        
+        Args:
+            player (str): Player's name
+        
+        Returns:
+            dict: Maps question id to (attempts, correct, clues_used,
+                  total_response_ms, last_seen) tuples
+        """
+        try:
+            self.cursor.execute(
+                '''
+                SELECT question_id, attempts, correct, clues_used, total_response_ms, last_seen
+                FROM question_stats
+                WHERE player = ?
+                ''',
+                (player,)
+            )
+            return {row[0]: row[1:] for row in self.cursor.fetchall()}
+        except Exception as e:
+            print(f"Error selecting question stats: {e}")
+            return {}
+
     def select_score(self):
         """
         Retrieve all scores from the database.
@@ -91,45 +919,243 @@ class DatabaseOperations:
             print(f"Error selecting scores: {e}")
             return []
 
-    def create_score(self, player, score):
+    def record_game(self, player, stats, duration_ms, finished_at=None):
         """
-        Create or update a player's score.
+        Record a finished game.
+
+        The game is added to game_history, and the player's aggregate row and
+        best score are updated in the same transaction.
         
         Args:
             player (str): Player's name
-            score (int): Player's score
+            stats (dict): Game statistics from GameLogic.get_statistics
+            duration_ms (int): How long the game lasted
+            finished_at (float, optional): Unix time the game ended, defaults to now
             
         Returns:
             bool: True if successful, False otherwise
         """
+        if finished_at is None:
+            finished_at = time.time()
+        try:
+            self.cursor.execute(
+                '''
+                INSERT INTO game_history
+                    (player, score, questions_answered, clues_used, best_streak, duration_ms, finished_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''',
+                (player, stats['score'], stats['questions_answered'], stats['clues_used'],
+                 stats['best_streak'], int(duration_ms), finished_at)
+            )
+            self.cursor.execute(
+                '''
+                INSERT INTO player_stats
+                    (player, games_played, total_score, best_score, total_questions,
+                     total_clues, best_streak, last_played)
+                VALUES (?, 1, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (player) DO UPDATE SET
+                    games_played = games_played + 1,
+                    total_score = total_score + excluded.total_score,
+                    best_score = max(best_score, excluded.best_score),
+                    total_questions = total_questions + excluded.total_questions,
+                    total_clues = total_clues + excluded.total_clues,
+                    best_streak = max(best_streak, excluded.best_streak),
+                    last_played = excluded.last_played
+                ''',
+                (player, stats['score'], stats['score'], stats['questions_answered'],
+                 stats['clues_used'], stats['best_streak'], finished_at)
+            )
+            self.cursor.execute(
+                '''
+                INSERT INTO score_table (name, score) VALUES (?, ?)
+                ON CONFLICT (name) DO UPDATE SET score = max(score, excluded.score)
+                ''',
+                (player, stats['score'])
+            )
+            self.cursor.executemany(
+                '''
+                INSERT INTO leaderboard (period, bucket, player, best_score, achieved_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (period, bucket, player) DO UPDATE SET
+                    best_score = excluded.best_score,
+                    achieved_at = excluded.achieved_at
+                WHERE excluded.best_score > best_score
+                ''',
+                [
+                    (period, self.leaderboard_bucket(period, finished_at), player,
+                     stats['score'], finished_at)
+                    for period in LEADERBOARD_PERIODS
+                ]
+            )
+            self.conn.commit()
+            return True
+        except Exception as e:
+            print(f"Error recording game: {e}")
+            self.conn.rollback()
+            return False
+
+    def get_player_stats(self, player):
+        """
+        Get a player's aggregate statistics over all their games.
+        
+        Args:
+            player (str): Player's name
+            
+        Returns:
+            dict: games_played, mean_score, best_score, total_questions,
+                  total_clues and best_streak, or None if they never finished a game
+        """
         try:
-            # Try to insert new score
-            try:
+            self.cursor.execute(
+                '''
+                SELECT games_played, total_score, best_score, total_questions, total_clues, best_streak
+                FROM player_stats WHERE player = ?
+                ''',
+                (player,)
+            )
+            row = self.cursor.fetchone()
+            if not row:
+                return None
+            games_played, total_score, best_score, total_questions, total_clues, best_streak = row
+            return {
+                'games_played': games_played,
+                'mean_score': total_score / games_played,
+                'best_score': best_score,
+                'total_questions': total_questions,
+                'total_clues': total_clues,
+                'best_streak': best_streak
+            }
+        except Exception as e:
+            print(f"Error retrieving player stats: {e}")
+            return None
+
+    @staticmethod
+    def leaderboard_bucket(period, timestamp=None):
+        """
+        Get the bucket a moment falls into for a leaderboard period.
+        
+        Args:
+            period (str): 'daily' or 'weekly'
+            timestamp (float, optional): Unix time, defaults to now
+            
+        Returns:
+            str: Bucket name: the local date of the day, or of the Monday
+                 the week starts on, e.g. '2024-05-17' or '2024-05-13'
+        """
+        day = datetime.date.fromtimestamp(time.time() if timestamp is None else timestamp)
+        if period == 'weekly':
+            day -= datetime.timedelta(days=day.weekday())
+        return day.isoformat()
+
+    def get_leaderboard(self, period, limit=10):
+        """
+        Get the top scores for a leaderboard period.
+        
+        Args:
+            period (str): 'daily', 'weekly' or 'all'
+            limit (int): Number of scores to retrieve
+            
+        Returns:
+            list: List of (name, score) tuples, best first
+        """
+        try:
+            if period == 'all':
                 self.cursor.execute(
-                    'INSERT INTO score_table (name, score) VALUES (?, ?)',
-                    (player, score)
+                    'SELECT name, score FROM score_table ORDER BY score DESC LIMIT ?',
+                    (limit,)
                 )
-            except sqlite3.IntegrityError:
-                # Player exists, update only if new score is higher
+            else:
                 self.cursor.execute(
-                    'SELECT score FROM score_table WHERE name = ?',
-                    (player,)
-                )
-                current_score = self.cursor.fetchone()
-                
-                if current_score and current_score[0] < score:
-                    self.cursor.execute(
-                        'UPDATE score_table SET score = ? WHERE name = ?',
-                        (score, player)
-                    )
+                    '''
+                    SELECT player, best_score FROM leaderboard
+                    WHERE period = ? AND bucket = ?
+                    ORDER BY best_score DESC, achieved_at
+                    LIMIT ?
+                    ''',
+                    (period, self.leaderboard_bucket(period), limit)
+                )
+            return self.cursor.fetchall()
+        except Exception as e:
+            print(f"Error retrieving leaderboard: {e}")
+            return []
 
-            self.conn.commit()
-            return True
+    def get_player_rank(self, player, period):
+        """
+        Get a player's position on a leaderboard.
+
+        Counts the better scores with a range scan of the leaderboard index,
+        so the board is never sorted or scanned in full.
+        
+        Args:
+            player (str): Player's name
+            period (str): 'daily', 'weekly' or 'all'
             
+        Returns:
+            tuple: (rank, score), or None if the player has no score in the period
+        """
+        try:
+            if period == 'all':
+                self.cursor.execute('SELECT score FROM score_table WHERE name = ?', (player,))
+                row = self.cursor.fetchone()
+                if not row:
+                    return None
+                self.cursor.execute('SELECT COUNT(*) FROM score_table WHERE score > ?', (row[0],))
+            else:
+                bucket = self.leaderboard_bucket(period)
+                self.cursor.execute(
+                    '''
+                    SELECT best_score, achieved_at FROM leaderboard
+                    WHERE period = ? AND bucket = ? AND player = ?
+                    ''',
+                    (period, bucket, player)
+                )
+                row = self.cursor.fetchone()
+                if not row:
+                    return None
+                self.cursor.execute(
+                    '''
+                    SELECT COUNT(*) FROM leaderboard
+                    WHERE period = ? AND bucket = ?
+                      AND (best_score > ? OR (best_score = ? AND achieved_at < ?))
+                    ''',
+                    (period, bucket, row[0], row[0], row[1])
+                )
+            return self.cursor.fetchone()[0] + 1, row[0]
         except Exception as e:
-            print(f"Error creating/updating score: {e}")
+            print(f"Error retrieving player rank: {e}")
+            return None
+
+    def prune_leaderboards(self, keep_days=LEADERBOARD_KEEP_DAYS, keep_weeks=LEADERBOARD_KEEP_WEEKS):
+        """
+        Delete daily and weekly buckets older than the retention period.
+        Every game is still counted in game_history and the all-time board.
+        
+        Args:
+            keep_days (int): Number of daily buckets to keep
+            keep_weeks (int): Number of weekly buckets to keep
+            
+        Returns:
+            int: Number of rows deleted
+        """
+        now = time.time()
+        cutoffs = {
+            'daily': self.leaderboard_bucket('daily', now - keep_days * 86400),
+            'weekly': self.leaderboard_bucket('weekly', now - keep_weeks * 7 * 86400)
+        }
+        try:
+            deleted = 0
+            for period, cutoff in cutoffs.items():
+                self.cursor.execute(
+                    'DELETE FROM leaderboard WHERE period = ? AND bucket < ?',
+                    (period, cutoff)
+                )
+                deleted += self.cursor.rowcount
+            self.conn.commit()
+            return deleted
+        except Exception as e:
+            print(f"Error pruning leaderboards: {e}")
             self.conn.rollback()
-            return False
+            return 0
 
     def get_top_scores(self, limit=10):
         """
@@ -151,6 +1177,65 @@ class DatabaseOperations:
             print(f"Error retrieving top scores: {e}")
             return []
 
+    def _iter_query(self, sql, params=(), chunk_size=EXPORT_CHUNK_SIZE):
+        """
+        Stream the rows of a query in chunks.
+
+        Uses its own cursor, so other queries can run while it is consumed,
+        and never holds more than chunk_size rows in memory.
+        """
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def iter_scores(self, chunk_size=EXPORT_CHUNK_SIZE):
+        """
+        Stream the all-time leaderboard, best first.
+        
+        Yields:
+            tuple: (name, score)
+        """
+        return self._iter_query(
+            'SELECT name, score FROM score_table ORDER BY score DESC',
+            chunk_size=chunk_size
+        )
+
+    def iter_game_history(self, chunk_size=EXPORT_CHUNK_SIZE):
+        """
+        Stream every finished game, oldest first.
+        
+        Yields:
+            tuple: (id, player, score, questions_answered, clues_used,
+                    best_streak, duration_ms, finished_at)
+        """
+        return self._iter_query(
+            '''
+            SELECT id, player, score, questions_answered, clues_used,
+                   best_streak, duration_ms, finished_at
+            FROM game_history ORDER BY id
+            ''',
+            chunk_size=chunk_size
+        )
+
+    def iter_questions(self, chunk_size=EXPORT_CHUNK_SIZE):
+        """
+        Stream every question in id order.
+        
+        Yields:
+            tuple: (id, question, image_filename, answer)
+        """
+        return self._iter_query(
+            f'SELECT id, question, {self.image_column}, answer FROM question ORDER BY id',
+            chunk_size=chunk_size
+        )
+
     def add_sample_questions(self):
         """Add sample questions to the database if it's empty."""
         if not self.select_question():
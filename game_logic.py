@@ -1,14 +1,48 @@
 """
 Game logic module handling core game mechanics and state management.
 """
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence
+from config import (
+    POINTS_FOR_CORRECT,
+    POINTS_FOR_CLUE,
+    CLUE_LEVEL_POINTS,
+    SPEED_BONUS_MAX,
+    ACHIEVEMENT_STREAK,
+    ACHIEVEMENT_SCORE,
+    ACHIEVEMENT_NO_CLUE_COUNT
+)
 
 
 class GameLogic:
     """Handles core game mechanics and scoring logic."""
 
-    def __init__(self):
-        """Initialize game state."""
+    def __init__(self, points_for_correct: int = POINTS_FOR_CORRECT,
+                 points_for_clue: int = POINTS_FOR_CLUE,
+                 streak_goal: int = ACHIEVEMENT_STREAK,
+                 score_goal: int = ACHIEVEMENT_SCORE,
+                 no_clue_goal: int = ACHIEVEMENT_NO_CLUE_COUNT,
+                 speed_bonus_max: int = SPEED_BONUS_MAX,
+                 clue_level_points: Sequence[int] = CLUE_LEVEL_POINTS):
+        """
+        Initialize game state.
+        
+        Args:
+            points_for_correct (int): Points for a correct answer
+            points_for_clue (int): Points added (normally negative) for using a clue
+            streak_goal (int): Correct answers in a row for the streak achievement
+            score_goal (int): Score for the century achievement
+            no_clue_goal (int): Questions answered without clues for its achievement
+            speed_bonus_max (int): Timed-mode bonus for an instant correct answer
+            clue_level_points (Sequence[int]): Total points added (normally
+                negative) for reaching each progressive clue level
+        """
+        self.points_for_correct = points_for_correct
+        self.points_for_clue = points_for_clue
+        self.streak_goal = streak_goal
+        self.score_goal = score_goal
+        self.no_clue_goal = no_clue_goal
+        self.speed_bonus_max = speed_bonus_max
+        self.clue_level_points = tuple(clue_level_points)
         self.reset_game()
 
     def reset_game(self):
@@ -18,29 +52,73 @@ class GameLogic:
         self.clues_used = 0
         self.current_streak = 0
         self.best_streak = 0
+        self.speed_bonus = 0
+
+    def calculate_speed_bonus(self, response_ms: float, time_limit_ms: float) -> int:
+        """
+        Calculate the timed-mode bonus for a correct answer.
+        
+        Args:
+            response_ms (float): Time the player took to answer
+            time_limit_ms (float): Time allowed for the question
+            
+        Returns:
+            int: Bonus points, in proportion to the time left
+        """
+        time_left = max(0.0, 1 - response_ms / time_limit_ms)
+        return round(self.speed_bonus_max * time_left)
+
+    def clue_penalty(self, level: int) -> int:
+        """
+        Get the total cost of revealing a progressive clue up to a level.
+        
+        Args:
+            level (int): Clue level reached; 0 for none, 1 for the least revealing
+            
+        Returns:
+            int: Points added (normally negative) for the clue
+        """
+        if level <= 0:
+            return 0
+        return self.clue_level_points[min(level, len(self.clue_level_points)) - 1]
 
-    def calculate_score(self, is_correct: bool, used_clue: bool) -> int:
+    def calculate_score(self, is_correct: bool, used_clue: bool,
+                        response_ms: Optional[float] = None,
+                        time_limit_ms: Optional[float] = None,
+                        clue_level: Optional[int] = None) -> int:
         """
         Calculate score for an answer.
         
         Args:
             is_correct (bool): Whether the answer was correct
             used_clue (bool): Whether a clue was used
+            response_ms (float, optional): Time taken to answer, in timed mode
+            time_limit_ms (float, optional): Time allowed, in timed mode
+            clue_level (int, optional): Progressive clue level reached; when
+                given, the clue costs that level's penalty instead of points_for_clue
             
         Returns:
             int: Points earned/lost for this question
         """
+        if clue_level is not None:
+            used_clue = clue_level > 0
         points = 0
         
         if is_correct:
-            points = 10
+            points = self.points_for_correct
+            if time_limit_ms and response_ms is not None:
+                bonus = self.calculate_speed_bonus(response_ms, time_limit_ms)
+                self.speed_bonus += bonus
+                points += bonus
             self.current_streak += 1
             self.best_streak = max(self.best_streak, self.current_streak)
         else:
             self.current_streak = 0
         
-        if used_clue:
-            points -= 5
+        if clue_level is not None:
+            points += self.clue_penalty(clue_level)
+        elif used_clue:
+            points += self.points_for_clue
         
         self.score += points
         self.questions_answered += 1
@@ -74,9 +152,24 @@ class GameLogic:
             'questions_answered': self.questions_answered,
             'clues_used': self.clues_used,
             'current_streak': self.current_streak,
-            'best_streak': self.best_streak
+            'best_streak': self.best_streak,
+            'speed_bonus': self.speed_bonus
         }
 
+    def restore_statistics(self, statistics: Dict[str, int]):
+        """
+        Restore game state saved from get_statistics.
+        
+        Args:
+            statistics (Dict[str, int]): Dictionary from get_statistics
+        """
+        self.score = statistics['score']
+        self.questions_answered = statistics['questions_answered']
+        self.clues_used = statistics['clues_used']
+        self.current_streak = statistics['current_streak']
+        self.best_streak = statistics['best_streak']
+        self.speed_bonus = statistics.get('speed_bonus', 0)
+
     def calculate_accuracy(self) -> Optional[float]:
         """
         Calculate the player's accuracy percentage.
@@ -86,22 +179,37 @@ class GameLogic:
         """
         if self.questions_answered == 0:
             return None
-        return (self.score / (self.questions_answered * 10)) * 100
+        return (self.score / (self.questions_answered * self.points_for_correct)) * 100
 
-    def should_show_achievement(self) -> Optional[str]:
+    def get_achievements(self) -> List[str]:
         """
-        Check if any achievements have been unlocked.
+        Check which achievement conditions the current state meets.
         
         Returns:
-            Optional[str]: Achievement message if unlocked, None otherwise
+            List[str]: Names of the achievements met: 'streak', 'century', 'no_clue'
         """
         achievements = []
         
-        if self.current_streak >= 5:
-            achievements.append("Hot Streak: 5 correct answers in a row!")
-        if self.score >= 100:
-            achievements.append("Century: Reached 100 points!")
-        if self.questions_answered >= 10 and self.clues_used == 0:
-            achievements.append("No Help Needed: Answered 10 questions without clues!")
+        if self.current_streak >= self.streak_goal:
+            achievements.append('streak')
+        if self.score >= self.score_goal:
+            achievements.append('century')
+        if self.questions_answered >= self.no_clue_goal and self.clues_used == 0:
+            achievements.append('no_clue')
             
-        return achievements[0] if achievements else None
+        return achievements
+
+    def should_show_achievement(self) -> Optional[str]:
+        """
+        Check if any achievements have been unlocked.
+        
+        Returns:
+            Optional[str]: Achievement message if unlocked, None otherwise
+        """
+        messages = {
+            'streak': f"Hot Streak: {self.streak_goal} correct answers in a row!",
+            'century': f"Century: Reached {self.score_goal} points!",
+            'no_clue': f"No Help Needed: Answered {self.no_clue_goal} questions without clues!"
+        }
+        achievements = self.get_achievements()
+        return messages[achievements[0]] if achievements else None
@@ -1,117 +1,225 @@
 """
 Main application module for Car Brand Quiz.
+
+Only the front end that is asked for gets imported, so the terminal mode and
+the maintenance commands start without loading Tk or PIL.
 """
-import customtkinter as ctk
-from game_logic import GameLogic
-from pages.home_page import HomePage
-from pages.player_input_page import PlayerInputPage
-from pages.game_page import GamePage
-from pages.score_page import ScorePage
-from pages.info_page import InfoPage
-from pages.settings_page import SettingsPage
+import argparse
+import os
+import sys
+import time
 from database_operations import DatabaseOperations
-from config import DEFAULT_WINDOW_SIZE, DEFAULT_WINDOW_POSITION
-
-
-class CarBrandQuiz:
-    def __init__(self):
-        """Initialize the application."""
-        self.setup_window()
-        self.setup_game()
-        self.create_pages()
-        self.show_home()
-
-    def setup_window(self):
-        """Set up the main window."""
-        self.root = ctk.CTk()
-        self.root.title("Car Brand Quiz")
-        self.root.geometry(f"{DEFAULT_WINDOW_SIZE}{DEFAULT_WINDOW_POSITION}")
-        ctk.set_appearance_mode("dark")
-        self.root.resizable(False, False)
-
-    def setup_game(self):
-        """Initialize game components."""
-        self.db = DatabaseOperations()
-        self.game_logic = GameLogic()
-        self.score = 0
-        self.player_name = None
-        self.current_page = None
-
-    def create_pages(self):
-        """Create all application pages."""
-        self.pages = {
-            'home': HomePage(self.root, self),
-            'player_input': PlayerInputPage(self.root, self),
-            'game': GamePage(self.root, self),
-            'score': ScorePage(self.root, self),
-            'info': InfoPage(self.root, self),
-            'settings': SettingsPage(self.root, self)
-        }
-        
-        # Hide all pages initially
-        for page in self.pages.values():
-            page.hide()
-
-    def show_page(self, page_name):
-        """Show specified page and hide current one."""
-        if self.current_page:
-            self.current_page.hide()
-            
-        page = self.pages[page_name]
-        page.reset()
-        page.show()
-        self.current_page = page
-
-    # Navigation methods
-    def show_home(self):
-        """Show home page."""
-        self.score = 0
-        self.show_page('home')
-
-    def show_player_input(self):
-        """Show player input page."""
-        self.show_page('player_input')
-
-    def show_game(self):
-        """Show game page."""
-        self.show_page('game')
-
-    def show_high_scores(self):
-        """Show high scores page."""
-        self.show_page('score')
-
-    def show_info(self):
-        """Show info page."""
-        self.show_page('info')
-
-    def show_settings(self):
-        """Show settings page."""
-        self.show_page('settings')
-
-    def start_game(self, player_name):
-        """Start game with given player name."""
-        self.player_name = player_name
-        self.score = 0
-        self.show_game()
-
-    def update_score(self, points):
-        """Update game score."""
-        self.score += points
-        self.pages['game'].update_score_display()
-
-    def save_score(self):
-        """Save player score to database."""
-        if self.player_name and self.score > 0:
-            self.db.create_score(self.player_name, self.score)
-
-    def run(self):
-        """Start the application."""
-        self.root.mainloop()
+from utils.db_maintenance import DatabaseMaintenance
+from utils import exporter
+from config import (
+    VACUUM_PAGES_PER_RUN,
+    QUESTION_SNAPSHOT,
+    PACKS_DIR,
+    MEMTRACE_LOG_PATH,
+    MEMTRACE_THRESHOLD_KB
+)
+
+
+def run_export(args):
+    """Export a table to CSV or JSON Lines."""
+    count = exporter.export(
+        DatabaseOperations(),
+        args.what,
+        args.output,
+        fmt=args.format,
+        compress=True if args.gzip else None
+    )
+    print(f"Exported {count} rows", file=sys.stderr)
+
+
+def run_maintenance(args):
+    """Run database maintenance from the command line."""
+    maintenance = DatabaseMaintenance()
+
+    if args.enable_incremental_vacuum:
+        if maintenance.enable_incremental_vacuum():
+            print("Database converted to incremental auto-vacuum")
+        else:
+            print("Incremental auto-vacuum already enabled")
+
+    if args.analyze:
+        maintenance.analyze()
+    else:
+        maintenance.optimize()
+    print(f"Free pages left: {maintenance.incremental_vacuum(args.vacuum_pages)}")
+
+    if args.backup is not None:
+        def show_progress(remaining, total):
+            print(f"\rBacking up: {total - remaining}/{total} pages", end="", file=sys.stderr)
+
+        path = maintenance.backup(args.backup or None, progress=show_progress)
+        print(file=sys.stderr)
+        print(f"Backup written to {path}")
+        if not args.backup:
+            maintenance.prune_backups()
+
+
+def probability_range(value):
+    """Parse --skill/--clue-rate with the simulator's parser, imported only when used."""
+    import simulator
+    return simulator.parse_range(value)
+
+
+def level_accuracy(value):
+    """Parse --clue-level-accuracy with the simulator's parser, imported only when used."""
+    import simulator
+    return simulator.parse_level_accuracy(value)
+
+
+def level_points(value):
+    """Parse --clue-level-points with the simulator's parser, imported only when used."""
+    import simulator
+    return simulator.parse_level_points(value)
+
+
+def run_simulation(args):
+    """Simulate games and write a scoring calibration report."""
+    # Imported here so other commands don't load the process pool machinery
+    import simulator
+
+    # Options left unset are absent from args and fall back to simulator.DEFAULT_SETTINGS
+    settings = {key: value for key, value in vars(args).items() if key in simulator.DEFAULT_SETTINGS}
+    if 'clue_model' in settings and settings['clue_model'] not in simulator.CLUE_MODELS:
+        sys.exit(f"Unknown clue model {settings['clue_model']}; "
+                 f"choose from {', '.join(simulator.CLUE_MODELS)}")
+    started = time.perf_counter()
+    try:
+        report = simulator.simulate(args.games, settings, workers=args.workers, seed=args.seed)
+    except ValueError as e:
+        sys.exit(str(e))
+    elapsed = time.perf_counter() - started
+    simulator.write_report(report, args.output)
+
+    score = report['score']
+    print(
+        f"Simulated {args.games} games in {elapsed:.1f}s: "
+        f"mean score {score.get('mean')}, median {score.get('p50')}; "
+        f"achievements {report['achievement_rates']}",
+        file=sys.stderr
+    )
 
 
 def main():
     """Main function to start the application."""
-    app = CarBrandQuiz()
+    parser = argparse.ArgumentParser(description="Car Brand Quiz")
+    parser.add_argument(
+        '--pack',
+        help="Play questions from a question pack file instead of the database"
+    )
+    parser.add_argument(
+        '--mount', action='append', default=[], metavar='DIR',
+        help="Also play the JSON Lines/CSV packs in DIR (repeatable); "
+             f"{PACKS_DIR} is mounted when it exists"
+    )
+    parser.add_argument(
+        '--tui', action='store_true',
+        help="Play in the terminal instead of opening a window"
+    )
+    parser.add_argument(
+        '--memtrace', nargs='?', const=MEMTRACE_LOG_PATH, metavar='LOG',
+        help="Log memory growth per page transition and game (default log: %(const)s)"
+    )
+    parser.add_argument(
+        '--memtrace-threshold', type=int, default=MEMTRACE_THRESHOLD_KB, metavar='KB',
+        help="Flag checkpoints that grow by more than this (default: %(default)s)"
+    )
+    subparsers = parser.add_subparsers(dest='command')
+
+    export_parser = subparsers.add_parser(
+        'export',
+        help="Stream scores, game history or questions to CSV or JSON Lines"
+    )
+    export_parser.add_argument('what', choices=list(exporter.EXPORTS))
+    export_parser.add_argument(
+        '-o', '--output', default='-',
+        help="Output file (default: standard output); .gz paths are compressed"
+    )
+    export_parser.add_argument('-f', '--format', choices=exporter.FORMATS, default='csv')
+    export_parser.add_argument('--gzip', action='store_true', help="Gzip the output")
+    export_parser.set_defaults(handler=run_export)
+
+    maintain_parser = subparsers.add_parser(
+        'maintain',
+        help="Optimize, vacuum and back up the database"
+    )
+    maintain_parser.add_argument(
+        '--analyze', action='store_true',
+        help="Run a full ANALYZE instead of PRAGMA optimize"
+    )
+    maintain_parser.add_argument(
+        '--vacuum-pages', type=int, default=VACUUM_PAGES_PER_RUN,
+        help="Free pages to release (default: %(default)s)"
+    )
+    maintain_parser.add_argument(
+        '--enable-incremental-vacuum', action='store_true',
+        help="Convert the database to incremental auto-vacuum (rewrites the file once)"
+    )
+    maintain_parser.add_argument(
+        '--backup', nargs='?', const='', metavar='PATH',
+        help="Take an online backup, to PATH or to the backups folder"
+    )
+    maintain_parser.set_defaults(handler=run_maintenance)
+
+    # Defaults live in simulator.DEFAULT_SETTINGS, which is only imported to run
+    simulate_parser = subparsers.add_parser(
+        'simulate',
+        help="Play synthetic games to calibrate points and achievement thresholds",
+        argument_default=argparse.SUPPRESS
+    )
+    simulate_parser.add_argument('-n', '--games', type=int, default=1000000)
+    simulate_parser.add_argument('--questions', type=int, help="Questions per game")
+    simulate_parser.add_argument('--skill', type=probability_range,
+                                 help="Chance a player knows an answer, or a LOW:HIGH range")
+    simulate_parser.add_argument('--clue-rate', type=probability_range,
+                                 help="Chance a player takes a clue, or a LOW:HIGH range")
+    simulate_parser.add_argument('--clue-level-accuracy', type=level_accuracy,
+                                 help="Chance a player has the answer after each clue level, e.g. 0.4,0.6,0.8")
+    simulate_parser.add_argument('--clue-model', help="How players take clues: random or unsure")
+    simulate_parser.add_argument('--points-correct', type=int, dest='points_for_correct')
+    simulate_parser.add_argument('--clue-level-points', type=level_points,
+                                 help="Total cost of each clue level, e.g. --clue-level-points=-2,-3,-5")
+    simulate_parser.add_argument('--streak-goal', type=int)
+    simulate_parser.add_argument('--score-goal', type=int)
+    simulate_parser.add_argument('--no-clue-goal', type=int)
+    simulate_parser.add_argument('-j', '--workers', type=int, default=None, help="Worker processes (default: all CPUs)")
+    simulate_parser.add_argument('--seed', type=int, default=None, help="Seed for a reproducible run")
+    simulate_parser.add_argument('-o', '--output', default='-',
+                                 help="Report file (default: standard output)")
+    simulate_parser.set_defaults(handler=run_simulation)
+
+    args = parser.parse_args()
+    if args.command:
+        args.handler(args)
+        return
+
+    for directory in args.mount:
+        if not os.path.isdir(directory):
+            parser.error(f"--mount: {directory} is not a directory")
+    mount_dirs = list(args.mount)
+    if os.path.isdir(PACKS_DIR) and PACKS_DIR not in mount_dirs:
+        mount_dirs.append(PACKS_DIR)
+
+    if args.tui:
+        from tui import TerminalQuiz
+        from utils.question_sources import open_question_source
+        db = DatabaseOperations()
+        source = open_question_source(db, args.pack, mount_dirs, snapshot=QUESTION_SNAPSHOT)
+        sys.exit(TerminalQuiz(db, source).run())
+
+    # Start tracing before the GUI is imported so its allocations are seen
+    memtracer = None
+    if args.memtrace:
+        from utils.memory_tracer import MemoryTracer
+        memtracer = MemoryTracer(args.memtrace, args.memtrace_threshold)
+
+    # Tk and PIL are only loaded for the window version
+    from app import CarBrandQuiz
+    app = CarBrandQuiz(pack_path=args.pack, memtracer=memtracer, mount_dirs=mount_dirs)
     app.run()
 
 
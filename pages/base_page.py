@@ -2,7 +2,6 @@
 Base page module providing common functionality for all pages in the Car Brand Quiz application.
 """
 import customtkinter as ctk
-from config import FONT_FAMILY, NORMAL_FONT_SIZE
 
 
 class BasePage:
@@ -82,12 +81,10 @@ class BasePage:
         Returns:
             CTkLabel: The created label
         """
-        font_size = font_size or NORMAL_FONT_SIZE
-        weight = "bold" if bold else "normal"
         label = ctk.CTkLabel(
             parent,
             text=text,
-            font=(FONT_FAMILY, font_size, weight),
+            font=self.game.resources.font(font_size, bold),
             **kwargs
         )
         return label
@@ -109,7 +106,7 @@ class BasePage:
             parent,
             text=text,
             command=command,
-            font=(FONT_FAMILY, NORMAL_FONT_SIZE),
+            font=self.game.resources.font(),
             **kwargs
         )
         return button
@@ -129,7 +126,7 @@ class BasePage:
         entry = ctk.CTkEntry(
             parent,
             placeholder_text=placeholder_text,
-            font=(FONT_FAMILY, NORMAL_FONT_SIZE),
+            font=self.game.resources.font(),
             **kwargs
         )
         return entry
@@ -1,21 +1,96 @@
 """
 Game page module for the Car Brand Quiz application.
 """
-import random
-import os
-from PIL import Image, ImageTk
+import time
 import customtkinter as ctk
 from pages.base_page import BasePage
-from config import CLUE_IMAGE_SIZE
+from question_scheduler import QuestionScheduler
+from utils.image_handler import ImageHandler
+from config import CLUE_IMAGE_SIZE, TIMED_QUESTION_SECONDS, ANSWER_BATCH_SIZE, QUESTIONS_PER_GAME
 
 
 class GamePage(BasePage):
+    # Clue button label for each progressive clue level
+    CLUE_LEVEL_NAMES = ("Clue", "Sharper clue", "Full clue")
+
     def __init__(self, master, game_instance):
         self.current_question = None
-        self.clue_shown = False
-        self.questions = {}
+        self.questions = {}      # Deck: id -> (question, image_filename, answer), None until fetched
+        self.clue_level = 0      # Progressive clue level shown; 0 for none
+        self.clue_levels = {}    # Levels derived in memory when not precomputed
+        self.scheduler = None
+        self.started_at = None
+        self.timed = False
+        # Clock for the question on screen, all perf_counter_ns() values
+        self.shown_ns = None
+        self.deadline_ns = None
+        self.clue_requested_ns = None
+        self.clue_wait_ns = 0
+        self.tick_id = None
+        self.timer_label = None
+        # Answers not yet written to question_stats
+        self.pending_answers = []
         super().__init__(master, game_instance)
 
+    def new_game(self, timed=False):
+        """
+        Forget any remaining deck so the next page load deals a fresh one.
+
+        Args:
+            timed (bool): Give each question a countdown and a speed bonus
+        """
+        self.questions = {}
+        self.scheduler = None
+        self.timed = timed
+        self.started_at = time.monotonic()
+
+    def resume(self, deck, timed=False):
+        """
+        Continue a checkpointed game with its remaining questions.
+
+        Args:
+            deck (list): Ids of the questions not yet answered
+            timed (bool): Whether the game was in timed mode
+        """
+        self.timed = timed
+        playable = set(self.game.question_source.question_ids())
+        self.deal(question_id for question_id in deck if question_id in playable)
+        self.started_at = time.monotonic()
+
+    def deal(self, question_ids, stats=None):
+        """
+        Set up the deck for a game. Questions are fetched from the source
+        only when they come up.
+
+        Args:
+            question_ids (iterable): Ids of the questions to play
+            stats (dict, optional): The player's question stats, if already read
+        """
+        if stats is None:
+            stats = self.game.db.select_question_stats(self.game.player_name)
+        self.questions = dict.fromkeys(question_ids)
+        # Favour questions this player finds hard
+        self.scheduler = QuestionScheduler(self.questions.keys(), stats)
+
+    def pick_questions(self, count):
+        """
+        Choose the questions for a game of a fixed length. With the player's
+        stats the whole bank is drawn from by weight, so weak questions are
+        more likely to make the game; without any, a uniform sample is taken.
+
+        Args:
+            count (int): Questions wanted
+
+        Returns:
+            tuple: (question ids, the player's question stats)
+        """
+        source = self.game.question_source
+        stats = self.game.db.select_question_stats(self.game.player_name)
+        if not stats:
+            return source.sample(count), stats
+        scheduler = QuestionScheduler(source.question_ids(), stats)
+        return [scheduler.draw() for _ in range(min(count, len(scheduler)))], stats
+
     def create_content(self):
         """Create the game page content."""
         # Main container with fixed height
@@ -23,27 +98,51 @@ class GamePage(BasePage):
         main_container.pack(fill="both", expand=True)
 
         # Score display - centered at top
-        ctk.CTkLabel(
+        self.score_label = ctk.CTkLabel(
             main_container,
             text=f"Score: {self.game.score}",
-            font=("Arial", 16),
+            font=self.game.resources.font(16),
             anchor="center"
-        ).pack(pady=(0, 10))
+        )
+        self.score_label.pack(pady=(0, 10))
+
+        # Countdown, timed mode only
+        self.timer_label = None
+        if self.timed:
+            self.timer_label = ctk.CTkLabel(
+                main_container,
+                text=f"Time: {TIMED_QUESTION_SECONDS}",
+                font=self.game.resources.font(16, bold=True),
+                anchor="center"
+            )
+            self.timer_label.pack()
 
         # Load questions if needed
         if not self.questions:
-            self.questions = {
-                q[1]: (q[2], q[3]) for q in self.game.db.select_question()
-            }
+            source = self.game.question_source
+            if QUESTIONS_PER_GAME:
+                self.deal(*self.pick_questions(QUESTIONS_PER_GAME))
+            else:
+                self.deal(source.question_ids())
+            if self.game.player_name:
+                self.game.journal.start(
+                    self.game.player_name,
+                    list(self.questions),
+                    self.game.game_logic.get_statistics(),
+                    self.timed
+                )
 
-        if self.questions:
-            # Get random question
-            question = random.choice(list(self.questions.keys()))
+        question = self.next_question()
+        if question is not None:
+            # The question stays in the deck until answered
+            self.current_question = question
+            self.clue_level = 0
+            self.clue_levels = {}
             
             # Question display - centered
             question_label = ctk.CTkLabel(
                 main_container,
-                text=question,
+                text=self.questions[question][0],
                 wraplength=400,
                 justify="center"
             )
@@ -78,9 +177,9 @@ class GamePage(BasePage):
             # Buttons with fixed width
             self.clue_button = ctk.CTkButton(
                 button_frame,
-                text="Clue",
+                text=self.clue_button_text(),
                 command=lambda: self.show_clue(question),
-                width=100,
+                width=130,
                 height=30
             )
             self.clue_button.pack(side="left", padx=10)
@@ -100,57 +199,250 @@ class GamePage(BasePage):
             # Bind Enter key to submit
             self.answer_entry.bind("<Return>", lambda e: self.check_answer(question))
 
+            # Start timing once the question has actually been drawn
+            self.shown_ns = None
+            self.frame.after_idle(self.start_clock, question)
+
+    def next_question(self):
+        """
+        Pick the next question and fetch it from the source, skipping any
+        that have gone from the source since the deal.
+
+        Returns:
+            int: Id of the question, or None if the deck is empty
+        """
+        while self.questions:
+            question = self.scheduler.peek()
+            if self.questions[question] is None:
+                row = self.game.question_source.get_question(question)
+                if row is None:
+                    self.questions.pop(question)
+                    self.scheduler.remove(question)
+                    continue
+                self.questions[question] = tuple(row[1:4])
+            return question
+        return None
+
+    def start_clock(self, question):
+        """Start timing the answer, and the countdown in timed mode."""
+        if question != self.current_question:
+            return
+        self.shown_ns = time.perf_counter_ns()
+        self.clue_wait_ns = 0
+        self.clue_requested_ns = None
+        if self.timed:
+            self.deadline_ns = self.shown_ns + TIMED_QUESTION_SECONDS * 1_000_000_000
+            self.tick(question)
+
+    def tick(self, question):
+        """
+        Update the countdown. Each tick is scheduled against the absolute
+        deadline, so late callbacks do not add up to drift.
+        """
+        self.tick_id = None
+        if question != self.current_question or not self.timer_label.winfo_exists():
+            return
+        if self.clue_requested_ns is not None:
+            # The clock is paused while the clue loads
+            self.tick_id = self.frame.after(50, self.tick, question)
+            return
+
+        remaining_ns = self.deadline_ns - time.perf_counter_ns()
+        if remaining_ns <= 0:
+            self.timer_label.configure(text="Time: 0")
+            self.check_answer(question, timed_out=True)
+            return
+
+        # Wake on the next whole-second boundary before the deadline
+        self.timer_label.configure(text=f"Time: {-(-remaining_ns // 1_000_000_000)}")
+        delay_ms = ((remaining_ns - 1) % 1_000_000_000) // 1_000_000 + 1
+        self.tick_id = self.frame.after(delay_ms, self.tick, question)
+
+    def stop_clock(self):
+        """Cancel the pending countdown tick, if any."""
+        if self.tick_id is not None:
+            self.frame.after_cancel(self.tick_id)
+            self.tick_id = None
+
+    def clue_button_text(self):
+        """Label for the clue button: the next level and what it costs."""
+        logic = self.game.game_logic
+        level = self.clue_level + 1
+        cost = logic.clue_penalty(level) - logic.clue_penalty(self.clue_level)
+        return f"{self.CLUE_LEVEL_NAMES[level - 1]} ({cost})"
+
     def show_clue(self, question):
-        """Display clue image."""
+        """Reveal the next level of the clue image."""
         try:
-            # Update score first
-            self.game.score -= 5
+            # Update score first; each level costs its difference to the last
+            logic = self.game.game_logic
+            level = self.clue_level + 1
+            self.game.score += logic.clue_penalty(level) - logic.clue_penalty(self.clue_level)
+            self.clue_level = level
             self.update_score_display()
 
-            # Load and display image
-            image_path = os.path.join("assets", "images", "clues", self.questions[question][0])
-            original_image = Image.open(image_path)
-            
-            # Calculate aspect ratio
-            aspect_ratio = original_image.width / original_image.height
-            target_height = 300
-            target_width = int(target_height * aspect_ratio)
-            
-            # Resize maintaining aspect ratio
-            resized_image = original_image.resize((target_width, target_height), Image.Resampling.LANCZOS)
-            
-            # Create CTkImage instead of PhotoImage
-            ctk_image = ctk.CTkImage(
-                light_image=resized_image,
-                dark_image=resized_image,
-                size=(target_width, target_height)
-            )
-            
-            # Update existing label
-            self.clue_label.configure(image=ctk_image)
-            self.clue_label.image = ctk_image  # Keep reference
-            
             # Disable clue button
             self.clue_button.configure(state="disabled")
 
+            # Loading the clue is not counted against the player
+            self.clue_requested_ns = time.perf_counter_ns()
+
+            # Precomputed levels only need reading
+            image_filename = self.questions[question][1]
+            image = self.clue_levels.get(level)
+            if image is None and self.game.question_source.has_clue_levels(question):
+                image = ImageHandler.load_clue_level(image_filename, level)
+            if image is not None:
+                self.display_clue(question, image)
+                return
+
+            # Otherwise (question packs, clues not yet processed) decode the
+            # full clue once and derive every level from it
+            source = self.game.question_source.open_clue(question, image_filename)
+            if self.game.decoder:
+                # Decoded in the worker process; shown when ready
+                self.clue_label.configure(text="Loading clue...")
+                self.game.decoder.decode(
+                    source,
+                    target_height=CLUE_IMAGE_SIZE[1],
+                    callback=lambda image: self.display_levels(question, image),
+                    error_callback=lambda e: self.clue_failed(question, e)
+                )
+            else:
+                self.display_levels(
+                    question,
+                    ImageHandler.load_clue_image(source, target_height=CLUE_IMAGE_SIZE[1])
+                )
+
         except Exception as e:
-            print(f"Error showing clue: {e}")
+            self.clue_failed(question, e)
 
-    def check_answer(self, question):
-        """Process the answer and move to next question."""
-        answer = self.answer_entry.get().strip().lower()
-        correct_answer = str(self.questions[question][1]).strip().lower()
+    def display_levels(self, question, full_image):
+        """Derive the clue levels from the full clue and show the current one."""
+        if question != self.current_question:
+            return
+        levels = ImageHandler.render_clue_levels(full_image)
+        self.clue_levels = dict(enumerate(levels, start=1))
+        self.display_clue(question, self.clue_levels[self.clue_level])
 
-        if answer == correct_answer:
-            self.game.score += 10
+    def resume_clock(self, question):
+        """Restart the clock paused while a clue loaded."""
+        if question != self.current_question or self.clue_requested_ns is None:
+            return
+        waited_ns = time.perf_counter_ns() - self.clue_requested_ns
+        self.clue_requested_ns = None
+        self.clue_wait_ns += waited_ns
+        if self.deadline_ns is not None:
+            self.deadline_ns += waited_ns
+
+    def clue_failed(self, question, error):
+        """Report a clue that could not be shown and restart the clock."""
+        print(f"Error showing clue: {error}")
+        self.resume_clock(question)
+
+    def display_clue(self, question, resized_image):
+        """Show a loaded clue image, unless the player has moved on."""
+        if question != self.current_question or not self.clue_label.winfo_exists():
+            return
+
+        # Create CTkImage instead of PhotoImage
+        ctk_image = ctk.CTkImage(
+            light_image=resized_image,
+            dark_image=resized_image,
+            size=resized_image.size
+        )
+        
+        # Update existing label
+        self.clue_label.configure(image=ctk_image, text="")
+        self.clue_label.image = ctk_image  # Keep reference
+        if self.clue_level < len(self.game.game_logic.clue_level_points):
+            self.clue_button.configure(state="normal", text=self.clue_button_text())
+        # Count time from when the clue could be seen
+        self.frame.after_idle(self.resume_clock, question)
+
+    def check_answer(self, question, timed_out=False):
+        """
+        Process the answer and move to next question.
+
+        Args:
+            question (int): Id of the question answered
+            timed_out (bool): The countdown ran out; the answer is wrong
+        """
+        now_ns = time.perf_counter_ns()
+        if question != self.current_question:
+            return
+        self.stop_clock()
+        self.resume_clock(question)
+        # Answered before the question was drawn: count it as instant
+        shown_ns = self.shown_ns if self.shown_ns is not None else now_ns
+        response_ms = max(0, now_ns - shown_ns - self.clue_wait_ns) // 1_000_000
+
+        logic = self.game.game_logic
+        is_correct = not timed_out and logic.check_answer(
+            self.answer_entry.get(), str(self.questions[question][2])
+        )
+
+        logic.calculate_score(
+            is_correct,
+            self.clue_level > 0,
+            response_ms,
+            TIMED_QUESTION_SECONDS * 1000 if self.timed else None,
+            clue_level=self.clue_level
+        )
+        self.game.score = logic.score
+        self.pending_answers.append(
+            (question, is_correct, self.clue_level > 0, response_ms, time.time())
+        )
+        if len(self.pending_answers) >= ANSWER_BATCH_SIZE:
+            self.flush_answers()
+        self.current_question = None
 
         self.questions.pop(question)
+        self.scheduler.remove(question)
+        self.game.journal.record_answer(question, logic.get_statistics())
         
         if self.questions:
             self.reset()  # Show next question
         else:
             self.show_game_over()
 
+    def flush_answers(self):
+        """Write the answers collected so far to the player's statistics."""
+        if self.pending_answers and self.game.db.record_answers(
+            self.game.player_name, self.pending_answers
+        ):
+            self.pending_answers = []
+
+    def sync_deck(self):
+        """
+        Bring the remaining deck in line with the question bank after it was
+        edited from outside: deleted or flagged questions are dropped and
+        edited ones take their new text and answer. New questions are dealt
+        from the next game on, so a game in progress keeps its length.
+        """
+        if not self.questions:
+            return
+        source = self.game.question_source
+        playable = set(source.question_ids())
+        self.drop_questions([question_id for question_id in self.questions if question_id not in playable])
+        for question_id, row in self.questions.items():
+            # Questions not fetched yet will be read fresh anyway
+            if row is not None and question_id in playable:
+                row = source.get_question(question_id)
+                if row is not None:
+                    self.questions[question_id] = tuple(row[1:4])
+
+    def drop_questions(self, question_ids):
+        """
+        Remove questions from the remaining deck, e.g. when their clue is broken.
+        The question currently on screen is left for the player to finish.
+        """
+        for question_id in question_ids:
+            if question_id != self.current_question:
+                self.questions.pop(question_id, None)
+                if self.scheduler:
+                    self.scheduler.remove(question_id)
+
     def show_game_over(self):
         """Display game over screen."""
         self.clear_frame()
@@ -159,7 +451,7 @@ class GamePage(BasePage):
         ctk.CTkLabel(
             self.frame,
             text="Game Over!",
-            font=("Arial", 24, "bold")
+            font=self.game.resources.font(24, bold=True)
         ).pack(pady=20)
 
         # Score message
@@ -171,17 +463,35 @@ class GamePage(BasePage):
         ctk.CTkLabel(
             self.frame,
             text=message,
-            font=("Arial", 16)
+            font=self.game.resources.font(16)
         ).pack(pady=5)
 
         ctk.CTkLabel(
             self.frame,
             text=f"Final Score: {self.game.score} points",
-            font=("Arial", 20, "bold")
+            font=self.game.resources.font(20, bold=True)
         ).pack(pady=10)
 
-        # Save score
-        self.game.db.create_score(self.game.player_name, self.game.score)
+        # Save the game, then show the player's record over all their games
+        self.flush_answers()
+        self.game.journal.finish()
+        self.game.resumable_session = None
+        self.game.db.record_game(
+            self.game.player_name,
+            self.game.game_logic.get_statistics(),
+            (time.monotonic() - self.started_at) * 1000
+        )
+        player_stats = self.game.db.get_player_stats(self.game.player_name)
+        if player_stats:
+            ctk.CTkLabel(
+                self.frame,
+                text=(
+                    f"Games played: {player_stats['games_played']}   "
+                    f"Average: {player_stats['mean_score']:.1f}   "
+                    f"Best: {player_stats['best_score']}"
+                ),
+                font=self.game.resources.font(14)
+            ).pack(pady=5)
 
         # Buttons
         button_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
@@ -203,12 +513,11 @@ class GamePage(BasePage):
             height=30
         ).pack(side="left", padx=10)
 
+        self.game.trace_memory('game_over')
+
     def update_score_display(self):
         """Update the score display."""
-        for widget in self.frame.winfo_children():
-            if isinstance(widget, ctk.CTkLabel) and "Score:" in widget._text:
-                widget.configure(text=f"Score: {self.game.score}")
-                break
+        self.score_label.configure(text=f"Score: {self.game.score}")
 
     def clear_frame(self):
         """Clear all widgets from the frame."""
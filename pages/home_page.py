@@ -2,10 +2,9 @@
 Home page module for the Car Brand Quiz application.
 """
 import os
-from PIL import Image
 import customtkinter as ctk
 from pages.base_page import BasePage
-from config import TITLE_FONT_SIZE, NORMAL_FONT_SIZE, LOGO_PATH
+from config import TITLE_FONT_SIZE, LOGO_PATH, LOGO_SIZE
 
 
 class HomePage(BasePage):
@@ -18,12 +17,7 @@ class HomePage(BasePage):
         # Load and display logo
         try:
             if os.path.exists(LOGO_PATH):
-                logo_image = Image.open(LOGO_PATH)
-                self.logo = ctk.CTkImage(
-                    light_image=logo_image,
-                    dark_image=logo_image,
-                    size=(60, 60)
-                )
+                self.logo = self.game.resources.image(LOGO_PATH, LOGO_SIZE)
                 logo_label = ctk.CTkLabel(
                     header_frame,
                     image=self.logo,
@@ -41,12 +35,14 @@ class HomePage(BasePage):
             bold=True
         ).pack(pady=(0, 20))
 
-        # Welcome message
-        welcome_text = """
+        # Welcome message, with the points the game logic actually uses
+        logic = self.game.game_logic
+        clue_costs = [logic.clue_penalty(level) for level in range(1, len(logic.clue_level_points) + 1)]
+        welcome_text = f"""
         Welcome to the Car Brand Quiz Challenge!
         Test your knowledge of automotive brands and logos.
-        Each correct answer earns you 10 points.
-        Need help? Use a clue for -5 points.
+        Each correct answer earns you {logic.points_for_correct} points.
+        Need help? Clues cost {max(clue_costs)} to {min(clue_costs)} points, the clearer the more.
         See if you can become the ultimate car brand expert!
         """
         
@@ -60,6 +56,16 @@ class HomePage(BasePage):
         button_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
         button_frame.pack(pady=30)
 
+        # Resume button, shown when a game was interrupted
+        session = self.game.resumable_session
+        if session:
+            self.create_button(
+                button_frame,
+                text=f"Resume {session['player']}'s Game ({session['statistics']['score']} pts)",
+                command=self.resume_game,
+                width=200
+            ).pack(pady=10)
+
         # Start quiz button
         self.create_button(
             button_frame,
@@ -84,11 +90,24 @@ class HomePage(BasePage):
             width=200
         ).pack(pady=10)
 
+        # Question management button
+        self.create_button(
+            button_frame,
+            text="Manage Questions",
+            command=self.show_settings,
+            width=200
+        ).pack(pady=10)
+
     def start_quiz(self):
         """Start the quiz by showing the player name input page."""
         self.hide()
         self.game.show_player_input()
 
+    def resume_game(self):
+        """Resume the interrupted game."""
+        self.hide()
+        self.game.resume_game()
+
     def show_info(self):
         """Show the info page."""
         self.hide()
@@ -99,6 +118,11 @@ class HomePage(BasePage):
         self.hide()
         self.game.show_high_scores()
 
+    def show_settings(self):
+        """Show the question management settings page."""
+        self.hide()
+        self.game.show_settings()
+
     def refresh(self):
         """Refresh the home page (if needed)."""
         # This could be used to update any dynamic content
@@ -32,6 +32,14 @@ class PlayerInputPage(BasePage):
         )
         self.error_label.pack_forget()
 
+        # Timed mode: a countdown per question, with a bonus for fast answers
+        self.timed_switch = ctk.CTkSwitch(
+            self.frame,
+            text="Timed mode",
+            font=self.game.resources.font(12)
+        )
+        self.timed_switch.pack(pady=5)
+
         # Start button
         self.create_button(
             self.frame,
@@ -64,7 +72,7 @@ class PlayerInputPage(BasePage):
         self.error_label.pack_forget()
         
         # Start game with validated name
-        self.game.start_game(name)
+        self.game.start_game(name, timed=bool(self.timed_switch.get()))
 
     def show_error(self, message):
         """Display error message."""
@@ -0,0 +1,351 @@
+"""
+Question manager page module for the Car Brand Quiz application.
+Lists existing questions page by page and allows editing and deleting them.
+"""
+import customtkinter as ctk
+from pages.base_page import BasePage
+from config import TITLE_FONT_SIZE, TEXT_COLOR, QUESTIONS_PER_PAGE, THUMBNAIL_SIZE, get_clue_path
+from database_operations import DatabaseOperations
+from utils.image_handler import ImageHandler
+
+
+class QuestionManagerPage(BasePage):
+    def __init__(self, master, game_instance):
+        self.page_starts = [0]   # Last id before each visited page
+        self.search_query = ""
+        self.rows = []
+        self.selected = {}
+        self.thumbnails = {}
+        self.generation = 0      # Bumped on every reload to drop stale thumbnails
+        self.editing_id = None
+        super().__init__(master, game_instance)
+
+    def create_content(self):
+        """Create the content for the question manager page."""
+        # Title
+        self.create_label(
+            self.frame,
+            text="Manage Questions",
+            font_size=TITLE_FONT_SIZE,
+            bold=True
+        ).pack(pady=(0, 10))
+
+        # Search bar
+        search_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        search_frame.pack(fill="x", padx=20)
+
+        self.search_entry = self.create_entry(
+            search_frame,
+            placeholder_text="Search questions and answers...",
+            width=400
+        )
+        self.search_entry.pack(side="left", padx=(0, 10))
+        self.search_entry.bind("<Return>", lambda e: self.search())
+
+        self.create_button(
+            search_frame,
+            text="Search",
+            command=self.search,
+            width=100
+        ).pack(side="left")
+
+        # Question list
+        self.list_frame = self.create_scrollable_frame(self.frame, height=220)
+        self.list_frame.pack(fill="both", expand=True, padx=20, pady=10)
+
+        # Paging controls
+        paging_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        paging_frame.pack(pady=(0, 5))
+
+        self.prev_button = self.create_button(
+            paging_frame,
+            text="< Prev",
+            command=self.previous_page,
+            width=80
+        )
+        self.prev_button.pack(side="left", padx=5)
+
+        self.page_label = self.create_label(paging_frame, text="", width=160)
+        self.page_label.pack(side="left", padx=5)
+
+        self.next_button = self.create_button(
+            paging_frame,
+            text="Next >",
+            command=self.next_page,
+            width=80
+        )
+        self.next_button.pack(side="left", padx=5)
+
+        # Edit form (filled in when a row's Edit button is clicked)
+        edit_frame = ctk.CTkFrame(self.frame)
+        edit_frame.pack(fill="x", padx=20, pady=5)
+
+        self.edit_question_entry = self.create_entry(
+            edit_frame,
+            placeholder_text="Question",
+            width=560
+        )
+        self.edit_question_entry.pack(padx=10, pady=(10, 5))
+
+        edit_row = ctk.CTkFrame(edit_frame, fg_color="transparent")
+        edit_row.pack(padx=10, pady=(0, 10))
+
+        self.edit_image_entry = self.create_entry(
+            edit_row,
+            placeholder_text="Clue image file",
+            width=180
+        )
+        self.edit_image_entry.pack(side="left", padx=(0, 10))
+
+        self.edit_answer_entry = self.create_entry(
+            edit_row,
+            placeholder_text="Answer",
+            width=180
+        )
+        self.edit_answer_entry.pack(side="left", padx=(0, 10))
+
+        self.create_button(
+            edit_row,
+            text="Save",
+            command=self.save_edit,
+            width=80
+        ).pack(side="left")
+
+        # Message label
+        self.message_label = self.create_label(self.frame, text="")
+        self.message_label.pack(pady=5)
+
+        # Buttons
+        button_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        button_frame.pack(pady=(0, 10))
+
+        self.create_button(
+            button_frame,
+            text="Delete Selected",
+            command=self.delete_selected,
+            width=120,
+            fg_color="#8d1f1f"
+        ).pack(side="left", padx=10)
+
+        self.create_button(
+            button_frame,
+            text="Back",
+            command=self.go_back,
+            width=120
+        ).pack(side="left", padx=10)
+
+        self.load_page()
+
+    def load_page(self):
+        """Fetch and display the current page of questions."""
+        self.generation += 1
+        self.selected = {}
+        self.thumbnails = {}
+
+        page_index = len(self.page_starts) - 1
+        if self.search_query:
+            self.rows = self.game.db.search_questions(
+                self.search_query,
+                limit=QUESTIONS_PER_PAGE,
+                offset=page_index * QUESTIONS_PER_PAGE
+            )
+        else:
+            self.rows = self.game.db.select_question_page(
+                after_id=self.page_starts[-1],
+                limit=QUESTIONS_PER_PAGE
+            )
+
+        for widget in self.list_frame.winfo_children():
+            widget.destroy()
+
+        if not self.rows:
+            self.create_label(
+                self.list_frame,
+                text="No questions found",
+                text_color=("gray70", "gray30")
+            ).pack(pady=20)
+
+        for row in self.rows:
+            self.create_question_row(row)
+
+        self.page_label.configure(text=f"Page {page_index + 1}")
+        self.prev_button.configure(state="normal" if page_index > 0 else "disabled")
+        self.next_button.configure(
+            state="normal" if len(self.rows) == QUESTIONS_PER_PAGE else "disabled"
+        )
+
+    def create_question_row(self, row):
+        """
+        Create a row in the question list.
+
+        Args:
+            row (tuple): (id, question, image_filename, answer)
+        """
+        question_id, question, image_filename, answer = row
+
+        row_frame = ctk.CTkFrame(self.list_frame, fg_color="transparent")
+        row_frame.pack(fill="x", pady=2)
+
+        var = ctk.BooleanVar()
+        self.selected[question_id] = var
+        ctk.CTkCheckBox(row_frame, text="", variable=var, width=24).pack(side="left")
+
+        # Placeholder until the thumbnail has been generated
+        thumb_label = ctk.CTkLabel(
+            row_frame,
+            text="...",
+            width=THUMBNAIL_SIZE[0],
+            height=THUMBNAIL_SIZE[1]
+        )
+        thumb_label.pack(side="left", padx=5)
+        self.load_thumbnail(thumb_label, image_filename)
+
+        display_question = question if len(question) <= 45 else question[:42] + "..."
+        self.create_label(
+            row_frame,
+            text=f"{display_question}\n{answer}",
+            justify="left",
+            anchor="w",
+            width=360
+        ).pack(side="left", padx=5)
+
+        self.create_button(
+            row_frame,
+            text="Edit",
+            command=lambda: self.start_edit(row),
+            width=50
+        ).pack(side="right", padx=5)
+
+    def load_thumbnail(self, label, image_filename):
+        """Generate a row's thumbnail in the background and show it when ready."""
+        generation = self.generation
+
+        def show(image):
+            if generation != self.generation or not label.winfo_exists():
+                return
+            ctk_image = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
+            self.thumbnails[label] = ctk_image  # Keep reference
+            label.configure(image=ctk_image, text="")
+
+        def show_missing(error):
+            if generation == self.generation and label.winfo_exists():
+                label.configure(text="?", text_color="red")
+
+        self.game.tasks.submit(
+            ImageHandler.create_thumbnail,
+            get_clue_path(image_filename or ""),
+            THUMBNAIL_SIZE,
+            callback=show,
+            error_callback=show_missing
+        )
+
+    def search(self):
+        """Restart paging with the current search text."""
+        self.search_query = self.search_entry.get().strip()
+        self.page_starts = [0]
+        self.load_page()
+
+    def next_page(self):
+        """Move to the next page of questions."""
+        if self.rows:
+            self.page_starts.append(self.rows[-1][0])
+            self.load_page()
+
+    def previous_page(self):
+        """Move back to the previous page of questions."""
+        if len(self.page_starts) > 1:
+            self.page_starts.pop()
+            self.load_page()
+
+    def start_edit(self, row):
+        """Fill the edit form with a question's current values."""
+        question_id, question, image_filename, answer = row
+        self.editing_id = question_id
+        for entry, value in [
+            (self.edit_question_entry, question),
+            (self.edit_image_entry, image_filename or ""),
+            (self.edit_answer_entry, answer)
+        ]:
+            entry.delete(0, 'end')
+            entry.insert(0, value)
+        self.show_message(f"Editing question #{question_id}")
+
+    def save_edit(self):
+        """Save the question being edited."""
+        if self.editing_id is None:
+            self.show_message("Click Edit on a question first", "red")
+            return
+
+        question = self.edit_question_entry.get().strip()
+        image_filename = self.edit_image_entry.get().strip()
+        answer = self.edit_answer_entry.get().strip()
+
+        if not question or not image_filename or not answer:
+            self.show_message("Question, image and answer are all required", "red")
+            return
+
+        if self.game.db.update_question(self.editing_id, question, image_filename, answer):
+            self.collect_orphan_clues()
+            self.show_message(f"Question #{self.editing_id} updated", "green")
+            self.editing_id = None
+            self.load_page()
+        else:
+            self.show_message("Error updating question", "red")
+
+    def delete_selected(self):
+        """Delete every checked question in one transaction."""
+        question_ids = [qid for qid, var in self.selected.items() if var.get()]
+        if not question_ids:
+            self.show_message("No questions selected", "red")
+            return
+
+        deleted = self.game.db.delete_questions(question_ids)
+        if deleted:
+            self.show_message(f"Deleted {deleted} question(s)", "green")
+            self.collect_orphan_clues(
+                lambda removed: self.show_message(
+                    f"Deleted {deleted} question(s), removed {removed} unused clue image(s)",
+                    "green"
+                )
+            )
+            self.load_page()
+        else:
+            self.show_message("Error deleting questions", "red")
+
+    @staticmethod
+    def _collect_orphan_clues():
+        """Delete unused clue images on a connection of its own, for a worker thread."""
+        db = DatabaseOperations()
+        try:
+            return ImageHandler.collect_orphan_clues(db)
+        finally:
+            db.conn.close()
+
+    def collect_orphan_clues(self, callback=None):
+        """
+        Delete clue images no question uses any more, in the background.
+
+        Args:
+            callback: Called on the UI thread with the number of files removed
+        """
+        self.game.tasks.submit(
+            self._collect_orphan_clues,
+            callback=callback,
+            error_callback=lambda e: self.show_message(f"Error removing unused clues: {e}", "red")
+        )
+
+    def show_message(self, text, color=TEXT_COLOR):
+        """Display a message with the specified color."""
+        self.message_label.configure(text=text, text_color=color)
+
+    def go_back(self):
+        """Return to the settings page."""
+        self.hide()
+        self.game.show_settings()
+
+    def reset(self):
+        """Reset the page state."""
+        self.page_starts = [0]
+        self.search_query = ""
+        self.editing_id = None
+        super().reset()
@@ -4,10 +4,21 @@ Displays high scores and rankings.
 """
 import customtkinter as ctk
 from pages.base_page import BasePage
-from config import TITLE_FONT_SIZE
+from config import TITLE_FONT_SIZE, LEADERBOARD_SIZE
 
 
 class ScorePage(BasePage):
+    # Tab label -> leaderboard period
+    PERIODS = {
+        "Today": "daily",
+        "This Week": "weekly",
+        "All Time": "all"
+    }
+
+    def __init__(self, master, game_instance):
+        self.period = "All Time"
+        super().__init__(master, game_instance)
+
     def create_content(self):
         """Create the content for the score page."""
         # Title
@@ -16,7 +27,15 @@ class ScorePage(BasePage):
             text="Top Scores",
             font_size=TITLE_FONT_SIZE,
             bold=True
-        ).pack(pady=(0, 30))
+        ).pack(pady=(0, 10))
+
+        # Leaderboard period tabs
+        self.period_selector = ctk.CTkSegmentedButton(
+            self.frame,
+            values=list(self.PERIODS),
+            command=self.show_leaderboard
+        )
+        self.period_selector.pack(pady=(0, 10))
 
         # Create scoreboard frame
         scoreboard = ctk.CTkFrame(self.frame)
@@ -47,32 +66,12 @@ class ScorePage(BasePage):
                 width=width
             ).pack(side="left")
 
-        # Get scores from database
-        scores = self.game.db.select_score()
-        
-        if scores:
-            # Create scrollable frame for scores
-            scores_frame = self.create_scrollable_frame(
-                scoreboard,
-                height=200,
-                width=400
-            )
-            scores_frame.pack(fill="x", padx=20, pady=5)
-
-            # Sort scores by value in descending order
-            sorted_scores = sorted(scores, key=lambda x: x[1], reverse=True)
+        # Rows are rebuilt here when the period changes
+        self.rows_container = ctk.CTkFrame(scoreboard, fg_color="transparent")
+        self.rows_container.pack(fill="both", expand=True)
 
-            # Display scores
-            for rank, (name, score) in enumerate(sorted_scores, 1):
-                self.create_score_row(scores_frame, rank, name, score)
-        else:
-            # Show message if no scores
-            self.create_label(
-                scoreboard,
-                text="No scores yet! Be the first to play!",
-                font_size=14,
-                text_color=("gray70", "gray30")  # Different colors for light/dark mode
-            ).pack(pady=20)
+        self.period_selector.set(self.period)
+        self.show_leaderboard(self.period)
 
         # Add button container
         button_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
@@ -93,6 +92,52 @@ class ScorePage(BasePage):
             width=120
         ).pack(side="left", padx=10)
 
+    def show_leaderboard(self, period):
+        """
+        Display the leaderboard for a period.
+        Only this period's top rows are queried, through the leaderboard indexes.
+
+        Args:
+            period (str): Tab label of the period to show
+        """
+        self.period = period
+        for widget in self.rows_container.winfo_children():
+            widget.destroy()
+
+        scores = self.game.db.get_leaderboard(self.PERIODS[period], LEADERBOARD_SIZE)
+
+        if scores:
+            # Create scrollable frame for scores
+            scores_frame = self.create_scrollable_frame(
+                self.rows_container,
+                height=200,
+                width=400
+            )
+            scores_frame.pack(fill="x", padx=20, pady=5)
+
+            # Display scores
+            for rank, (name, score) in enumerate(scores, 1):
+                self.create_score_row(scores_frame, rank, name, score)
+
+            # Show the current player's rank if they are below the top rows
+            player = getattr(self.game, 'player_name', None)
+            if player and player not in (name for name, _ in scores):
+                player_rank = self.game.db.get_player_rank(player, self.PERIODS[period])
+                if player_rank:
+                    self.create_label(
+                        self.rows_container,
+                        text=f"Your rank: #{player_rank[0]} with {player_rank[1]} points",
+                        font_size=14
+                    ).pack(pady=5)
+        else:
+            # Show message if no scores
+            self.create_label(
+                self.rows_container,
+                text="No scores yet! Be the first to play!",
+                font_size=14,
+                text_color=("gray70", "gray30")  # Different colors for light/dark mode
+            ).pack(pady=20)
+
     def create_score_row(self, parent, rank, name, score):
         """
         Create a row in the scoreboard.
@@ -5,11 +5,13 @@ Handles question management and game settings.
 import os
 import customtkinter as ctk
 from pages.base_page import BasePage
-from config import TITLE_FONT_SIZE, CLUES_DIR
-from utils.image_handler import ImageHandler
+from config import TITLE_FONT_SIZE, CLUES_DIR, PREVIEW_SIZE, DEFAULT_IMPORT_QUESTION
+from utils.question_importer import QuestionImporter
 
 
 class SettingsPage(BasePage):
+    FAILURES_SHOWN = 3   # Failed imports listed by name in the message
+
     def create_content(self):
         """Create the content for the settings page."""
         # Title
@@ -22,7 +24,8 @@ class SettingsPage(BasePage):
 
         # Description
         description_text = """Add new questions to the quiz database.
-        Provide a question, select a clue image, and specify the correct answer."""
+        Provide a question, select a clue image, and specify the correct answer.
+        Select several images to add a question for each, answered by its file name."""
         
         self.create_label(
             self.frame,
@@ -69,12 +72,18 @@ class SettingsPage(BasePage):
         )
         self.image_entry.pack(side="left", padx=(0, 10))
 
-        self.create_button(
+        self.browse_button = self.create_button(
             image_frame,
             text="Browse",
             command=self.browse_image,
             width=100
-        ).pack(side="left")
+        )
+        self.browse_button.pack(side="left")
+
+        # Preview of the chosen clue image
+        self.preview_image = None
+        self.preview_label = ctk.CTkLabel(form_frame, text="", height=PREVIEW_SIZE[1])
+        self.preview_label.pack(padx=20, pady=(0, 5))
 
         # Answer input
         self.create_label(
@@ -94,19 +103,34 @@ class SettingsPage(BasePage):
         self.message_label = self.create_label(
             self.frame,
             text="",
-            font_size=12
+            font_size=12,
+            wraplength=500
         )
         self.message_label.pack(pady=10)
 
+        # Progress of multi-image imports, shown while one is running
+        self.progress_bar = ctk.CTkProgressBar(self.frame, width=400)
+        self.import_total = 0
+        self.import_done = 0
+        self.import_failed = []
+
         # Buttons
         button_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
         button_frame.pack(pady=20)
 
-        self.create_button(
+        self.add_button = self.create_button(
             button_frame,
             text="Add Question",
             command=self.save_question,
             width=120
+        )
+        self.add_button.pack(side="left", padx=10)
+
+        self.create_button(
+            button_frame,
+            text="Manage Questions",
+            command=self.manage_questions,
+            width=120
         ).pack(side="left", padx=10)
 
         self.create_button(
@@ -117,36 +141,110 @@ class SettingsPage(BasePage):
         ).pack(side="left", padx=10)
 
     def browse_image(self):
-        """Open file dialog to select a clue image."""
+        """Open file dialog to select one clue image, or several to add a question for each."""
         file_types = (
             ('Image files', '*.png *.jpg *.jpeg *.gif *.bmp'),
             ('All files', '*.*')
         )
         
-        filename = ctk.filedialog.askopenfilename(
-            title='Select a clue image',
+        filenames = ctk.filedialog.askopenfilenames(
+            title='Select clue images',
             filetypes=file_types,
             initialdir=CLUES_DIR
         )
 
-        if filename:
-            # Get just the filename, not the full path
-            image_filename = os.path.basename(filename)
-            
-            # Check if the file is already in the clues directory
-            if not os.path.exists(os.path.join(CLUES_DIR, image_filename)):
-                # Copy the file to the clues directory
-                try:
-                    import shutil
-                    shutil.copy2(filename, os.path.join(CLUES_DIR, image_filename))
-                except Exception as e:
-                    self.show_message(f"Error copying image: {e}", "red")
-                    return
-            
-            self.image_path_var.set(image_filename)
+        if len(filenames) == 1:
+            self.prepare_image(filenames[0])
+        elif filenames:
+            self.import_images(filenames)
+
+    def prepare_image(self, filename):
+        """Copy and validate a chosen image in the background, then preview it."""
+        self.set_busy(True)
+        self.show_message("Processing image...", "gray")
+        self.game.tasks.submit(
+            QuestionImporter.prepare_clue,
+            filename,
+            callback=self.on_image_prepared,
+            error_callback=self.on_task_error
+        )
+
+    def on_image_prepared(self, result):
+        """Show the prepared clue image."""
+        self.set_busy(False)
+        if not result['filename']:
+            self.show_message("Error copying image: not a valid image file", "red")
+            return
+
+        self.image_path_var.set(result['filename'])
+        self.show_preview(result['preview'])
+        if result['near_duplicates']:
+            self.show_message(
+                f"Warning: image looks like existing clue {result['near_duplicates'][0][0]}",
+                "orange"
+            )
+        else:
+            self.show_message("")
+
+    def import_images(self, filenames):
+        """
+        Add a question for each image in the background, with its answer
+        taken from the file name and the question from the form.
+        """
+        question = self.question_entry.get().strip() or DEFAULT_IMPORT_QUESTION
+        self.import_total = len(filenames)
+        self.import_done = 0
+        self.import_failed = []
+
+        self.set_busy(True)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(pady=(0, 10), before=self.message_label)
+        self.show_message(f"Adding questions: 0/{self.import_total}", "gray")
+
+        for filename in filenames:
+            self.game.tasks.submit(
+                QuestionImporter.import_image,
+                filename,
+                question,
+                callback=self.on_image_imported,
+                error_callback=lambda e, path=filename: self.on_image_imported(
+                    {'path': path, 'error': str(e), 'near_duplicates': [], 'thumbnail': None}
+                )
+            )
+
+    def on_image_imported(self, result):
+        """Update progress as each image of a multi-image import finishes."""
+        self.import_done += 1
+        if result['error']:
+            self.import_failed.append(result)
+        elif result['thumbnail']:
+            self.show_preview(result['thumbnail'])
+
+        self.progress_bar.set(self.import_done / self.import_total)
+        if self.import_done < self.import_total:
+            self.show_message(f"Adding questions: {self.import_done}/{self.import_total}", "gray")
+            return
+
+        self.set_busy(False)
+        added = self.import_total - len(self.import_failed)
+        if self.import_failed:
+            failures = [
+                f"{os.path.basename(result['path'])}: {result['error']}"
+                for result in self.import_failed[:self.FAILURES_SHOWN]
+            ]
+            more = len(self.import_failed) - len(failures)
+            if more:
+                failures.append(f"and {more} more")
+            self.show_message(
+                f"Added {added} of {self.import_total} questions; "
+                f"{len(self.import_failed)} failed:\n" + "\n".join(failures),
+                "orange"
+            )
+        else:
+            self.show_message(f"Added {added} questions!", "green")
 
     def save_question(self):
-        """Validate and save the new question."""
+        """Validate the form and save the new question in the background."""
         # Get values
         question = self.question_entry.get().strip()
         image_filename = self.image_path_var.get().strip()
@@ -165,17 +263,47 @@ class SettingsPage(BasePage):
             self.show_message("Please enter the correct answer", "red")
             return
 
-        # Validate image exists
-        if not ImageHandler.validate_image_path(image_filename):
-            self.show_message("Selected image file is not accessible", "red")
-            return
+        # Check the image and save to database off the UI thread
+        self.set_busy(True)
+        self.show_message("Saving question...", "gray")
+        self.game.tasks.submit(
+            QuestionImporter.add_question,
+            question,
+            image_filename,
+            answer,
+            callback=self.on_question_saved,
+            error_callback=self.on_task_error
+        )
 
-        # Save to database
-        if self.game.db.insert_question(question, image_filename, {answer}):
+    def on_question_saved(self, error):
+        """Report the outcome of saving a question."""
+        self.set_busy(False)
+        if error:
+            self.show_message(error, "red")
+        else:
             self.show_message("Question added successfully!", "green")
             self.clear_form()
-        else:
-            self.show_message("Error saving question", "red")
+
+    def on_task_error(self, error):
+        """Report a background task that failed unexpectedly."""
+        self.set_busy(False)
+        self.show_message(f"Error: {error}", "red")
+
+    def set_busy(self, busy):
+        """Disable the form buttons while background work is running."""
+        state = "disabled" if busy else "normal"
+        self.browse_button.configure(state=state)
+        self.add_button.configure(state=state)
+
+    def show_preview(self, image):
+        """Show a clue preview thumbnail."""
+        if image is None:
+            # An empty string, not None, is what clears a CTkLabel's image
+            self.preview_label.configure(image="")
+            self.preview_image = None
+            return
+        self.preview_image = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
+        self.preview_label.configure(image=self.preview_image)
 
     def show_message(self, text, color="black"):
         """Display a message with the specified color."""
@@ -186,6 +314,12 @@ class SettingsPage(BasePage):
         self.question_entry.delete(0, 'end')
         self.image_path_var.set("")
         self.answer_entry.delete(0, 'end')
+        self.show_preview(None)
+
+    def manage_questions(self):
+        """Open the question manager page."""
+        self.hide()
+        self.game.show_question_manager()
 
     def go_back(self):
         """Return to the home page."""
@@ -196,3 +330,5 @@ class SettingsPage(BasePage):
         """Reset the page state."""
         self.clear_form()
         self.show_message("")
+        if self.import_done >= self.import_total:
+            self.progress_bar.pack_forget()
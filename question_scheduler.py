@@ -0,0 +1,148 @@
+"""
+Adaptive question scheduling for the Car Brand Quiz application.
+
+Questions a player tends to miss, needs clues for or answers slowly are drawn
+more often, while questions they have mastered recently are drawn less,
+spaced-repetition style. Weights are computed once per game and kept in a
+Fenwick tree, so drawing or removing a question costs O(log n).
+"""
+import math
+import random
+import time
+from typing import Dict, Iterable, Optional, Tuple
+from config import (
+    SCHEDULER_NEW_WEIGHT,
+    SCHEDULER_MIN_WEIGHT,
+    SCHEDULER_SLOW_ANSWER_MS,
+    SCHEDULER_REVIEW_HALF_LIFE_DAYS
+)
+
+# attempts, correct, clues_used, total_response_ms, last_seen (unix time)
+QuestionStats = Tuple[int, int, int, int, float]
+
+
+def question_weight(stats: Optional[QuestionStats], now: float) -> float:
+    """
+    Calculate how strongly a question should be favoured in the draw.
+
+    Args:
+        stats (QuestionStats, optional): The player's history with the question
+        now (float): Current unix time
+
+    Returns:
+        float: Relative draw weight, always positive
+    """
+    if not stats or not stats[0]:
+        return SCHEDULER_NEW_WEIGHT
+
+    attempts, correct, clues_used, total_response_ms, last_seen = stats
+
+    # Smoothed error rate, plus extra weight for leaning on clues or answering slowly
+    weakness = 1 - (correct + 1) / (attempts + 2)
+    weakness += 0.5 * clues_used / attempts
+    if total_response_ms / attempts > SCHEDULER_SLOW_ANSWER_MS:
+        weakness += 0.25
+
+    # Every seen question slowly becomes due for review again
+    elapsed_days = max(0.0, now - last_seen) / 86400
+    due = 1 - math.exp(-elapsed_days * math.log(2) / SCHEDULER_REVIEW_HALF_LIFE_DAYS)
+
+    return max(SCHEDULER_MIN_WEIGHT, weakness + due)
+
+
+class QuestionScheduler:
+    """Weighted random draw without replacement over a deck of questions."""
+
+    def __init__(self, question_ids: Iterable[int],
+                 stats: Optional[Dict[int, QuestionStats]] = None,
+                 rng: Optional[random.Random] = None):
+        """
+        Build the draw tree for a deck.
+
+        Args:
+            question_ids (Iterable[int]): Questions in the deck
+            stats (Dict[int, QuestionStats], optional): Player's history per question
+            rng (random.Random, optional): Random number generator to draw with
+        """
+        stats = stats or {}
+        now = time.time()
+        self.rng = rng or random.Random()
+        self.ids = list(question_ids)
+        self.positions = {question_id: i for i, question_id in enumerate(self.ids)}
+        self.weights = [question_weight(stats.get(question_id), now) for question_id in self.ids]
+        self.remaining = len(self.ids)
+
+        # Fenwick tree built in O(n)
+        self.tree = [0.0] + self.weights
+        for i in range(1, len(self.tree)):
+            parent = i + (i & -i)
+            if parent < len(self.tree):
+                self.tree[parent] += self.tree[i]
+
+        self.top_bit = 1 << (len(self.ids).bit_length() - 1) if self.ids else 0
+
+    def __len__(self):
+        return self.remaining
+
+    def _add(self, position: int, delta: float):
+        """Add delta to the weight at a 0-based position."""
+        i = position + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def total_weight(self) -> float:
+        """Sum of the weights of all questions still in the deck."""
+        total = 0.0
+        i = len(self.ids)
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def remove(self, question_id: int):
+        """Take a question out of the deck."""
+        position = self.positions.get(question_id)
+        if position is None or self.weights[position] == 0:
+            return
+        self._add(position, -self.weights[position])
+        self.weights[position] = 0.0
+        self.remaining -= 1
+
+    def peek(self) -> Optional[int]:
+        """
+        Pick a question at random in proportion to its weight, leaving it in the deck.
+
+        Returns:
+            Optional[int]: Question id, or None if the deck is empty
+        """
+        if not self.remaining:
+            return None
+
+        target = self.rng.random() * self.total_weight()
+        position = 0
+        bit = self.top_bit
+        while bit:
+            nxt = position + bit
+            if nxt < len(self.tree) and self.tree[nxt] <= target:
+                target -= self.tree[nxt]
+                position = nxt
+            bit >>= 1
+
+        # Floating point drift can land on an emptied slot; step to a live one
+        position = min(position, len(self.ids) - 1)
+        while self.weights[position] == 0:
+            position = (position + 1) % len(self.ids)
+        return self.ids[position]
+
+    def draw(self) -> Optional[int]:
+        """
+        Pick a question at random in proportion to its weight and remove it.
+
+        Returns:
+            Optional[int]: Question id, or None if the deck is empty
+        """
+        question_id = self.peek()
+        if question_id is not None:
+            self.remove(question_id)
+        return question_id
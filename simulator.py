@@ -0,0 +1,274 @@
+"""
+Monte Carlo game simulator for the Car Brand Quiz application.
+
+Plays large numbers of synthetic games through GameLogic so point values and
+achievement thresholds can be tuned from data. Players are modelled by their
+skill (chance of knowing an answer), how readily they take clues and how many
+progressive clue levels they need to see, scored as the game scores them. Games
+are split into chunks and played across a process pool; each worker reduces
+its games to integer histograms, which are summed and turned into a report,
+so memory use does not grow with the number of games.
+"""
+import json
+import math
+import os
+import random
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from game_logic import GameLogic
+from config import (
+    POINTS_FOR_CORRECT,
+    CLUE_LEVEL_POINTS,
+    ACHIEVEMENT_STREAK,
+    ACHIEVEMENT_SCORE,
+    ACHIEVEMENT_NO_CLUE_COUNT,
+    SIMULATOR_QUESTIONS_PER_GAME,
+    SIMULATOR_CHUNK_SIZE
+)
+
+ACHIEVEMENTS = ('streak', 'century', 'no_clue')
+
+# How a simulated player decides to take a clue
+CLUE_MODELS = {
+    'random': "takes a clue on any question with the given probability",
+    'unsure': "only considers a clue when they do not know the answer",
+}
+
+DEFAULT_SETTINGS = {
+    'questions': SIMULATOR_QUESTIONS_PER_GAME,
+    'skill': (0.5, 0.5),
+    'clue_rate': (0.3, 0.3),
+    # Chance the player has the answer once each progressive clue level is shown
+    'clue_level_accuracy': (0.4, 0.6, 0.8),
+    'clue_model': 'unsure',
+    'points_for_correct': POINTS_FOR_CORRECT,
+    'clue_level_points': CLUE_LEVEL_POINTS,
+    'streak_goal': ACHIEVEMENT_STREAK,
+    'score_goal': ACHIEVEMENT_SCORE,
+    'no_clue_goal': ACHIEVEMENT_NO_CLUE_COUNT,
+}
+
+
+def parse_range(value):
+    """
+    Parse a probability or a LOW:HIGH range of them.
+
+    Args:
+        value (str): e.g. '0.7' or '0.4:0.9'
+
+    Returns:
+        tuple: (low, high); each game draws uniformly from the range
+    """
+    low, _, high = value.partition(':')
+    low = float(low)
+    high = float(high) if high else low
+    if not 0 <= low <= high <= 1:
+        raise ValueError(f"Expected probabilities with low <= high, got {value}")
+    return low, high
+
+
+def parse_level_accuracy(value):
+    """
+    Parse per-level clue accuracies, e.g. '0.4,0.6,0.8'.
+
+    Returns:
+        tuple: Chance the answer is known once each level is shown; each
+               level reveals more, so the chances may not go down
+    """
+    levels = tuple(float(part) for part in value.split(','))
+    if not all(0 <= level <= 1 for level in levels) or list(levels) != sorted(levels):
+        raise ValueError(f"Expected non-decreasing probabilities, got {value}")
+    return levels
+
+
+def parse_level_points(value):
+    """
+    Parse the total cost of each clue level, e.g. '-2,-3,-5'.
+
+    Returns:
+        tuple: Points added at each level
+    """
+    return tuple(int(part) for part in value.split(','))
+
+
+def simulate_chunk(task):
+    """
+    Play a chunk of games and reduce them to histograms.
+
+    Args:
+        task (tuple): (games, seed, settings)
+
+    Returns:
+        dict: Counters for score, best_streak, clues_used and the clue level
+              each clue stopped at, plus the number of games unlocking each
+              achievement
+    """
+    games, seed, settings = task
+    rng = random.Random(seed)
+    random_value = rng.random
+    uniform = rng.uniform
+    logic = GameLogic(
+        points_for_correct=settings['points_for_correct'],
+        clue_level_points=settings['clue_level_points'],
+        streak_goal=settings['streak_goal'],
+        score_goal=settings['score_goal'],
+        no_clue_goal=settings['no_clue_goal']
+    )
+    calculate_score = logic.calculate_score
+    get_achievements = logic.get_achievements
+
+    questions = settings['questions']
+    skill_range = settings['skill']
+    clue_range = settings['clue_rate']
+    level_accuracy = settings['clue_level_accuracy']
+    last_level = len(level_accuracy)
+    unsure = settings['clue_model'] == 'unsure'
+
+    scores = Counter()
+    streaks = Counter()
+    clues = Counter()
+    clue_levels = Counter()
+    achievements = Counter()
+
+    for _ in range(games):
+        logic.reset_game()
+        skill = uniform(*skill_range)
+        clue_rate = uniform(*clue_range)
+        unlocked = set()
+
+        for _ in range(questions):
+            known = random_value() < skill
+            clue_level = 0
+            is_correct = known
+            if not (unsure and known) and random_value() < clue_rate:
+                if known:
+                    clue_level = 1
+                else:
+                    # Levels are revealed until one gives the answer away, or none is left
+                    levels_missed = bisect_right(level_accuracy, random_value())
+                    is_correct = levels_missed < last_level
+                    clue_level = min(levels_missed + 1, last_level)
+                clue_levels[clue_level] += 1
+            calculate_score(is_correct, clue_level > 0, clue_level=clue_level)
+            unlocked.update(get_achievements())
+
+        scores[logic.score] += 1
+        streaks[logic.best_streak] += 1
+        clues[logic.clues_used] += 1
+        achievements.update(unlocked)
+        if unlocked:
+            achievements['any'] += 1
+
+    return {
+        'score': scores,
+        'best_streak': streaks,
+        'clues_used': clues,
+        'clue_levels': clue_levels,
+        'achievements': achievements
+    }
+
+
+def summarize(histogram):
+    """
+    Describe a distribution given as a value -> count histogram.
+
+    Returns:
+        dict: count, mean, stddev, min, max and percentiles
+    """
+    count = sum(histogram.values())
+    if not count:
+        return {'count': 0}
+    mean = sum(value * n for value, n in histogram.items()) / count
+    variance = sum(n * (value - mean) ** 2 for value, n in histogram.items()) / count
+
+    summary = {
+        'count': count,
+        'mean': round(mean, 4),
+        'stddev': round(math.sqrt(variance), 4),
+        'min': min(histogram),
+        'max': max(histogram),
+    }
+
+    # Walk the sorted values once, picking off each percentile as it is passed
+    wanted = [(p, math.ceil(p / 100 * count)) for p in (5, 25, 50, 75, 95, 99)]
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        while wanted and seen >= wanted[0][1]:
+            summary[f"p{wanted[0][0]}"] = value
+            wanted.pop(0)
+    return summary
+
+
+def simulate(games, settings=None, workers=None, seed=None, chunk_size=SIMULATOR_CHUNK_SIZE):
+    """
+    Run a simulation across a process pool.
+
+    Args:
+        games (int): Number of games to play
+        settings (dict, optional): Overrides for DEFAULT_SETTINGS
+        workers (int, optional): Worker processes; defaults to the CPU count
+        seed (int, optional): Seed for reproducible runs
+        chunk_size (int): Games per worker task
+
+    Returns:
+        dict: The report
+    """
+    settings = {**DEFAULT_SETTINGS, **(settings or {})}
+    if settings['clue_model'] not in CLUE_MODELS:
+        raise ValueError(f"Unknown clue model: {settings['clue_model']}")
+    if len(settings['clue_level_accuracy']) != len(settings['clue_level_points']):
+        raise ValueError("Give one clue accuracy for each clue level")
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+
+    tasks = []
+    for index, start in enumerate(range(0, games, chunk_size)):
+        # Every chunk gets its own deterministic stream
+        tasks.append((min(chunk_size, games - start), f"{seed}:{index}", settings))
+
+    totals = {
+        key: Counter() for key in ('score', 'best_streak', 'clues_used', 'clue_levels', 'achievements')
+    }
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(simulate_chunk, tasks):
+            for key, counter in result.items():
+                totals[key].update(counter)
+
+    return {
+        'games': games,
+        'seed': seed,
+        'settings': {
+            **settings,
+            **{key: list(settings[key]) for key in ('skill', 'clue_rate', 'clue_level_accuracy', 'clue_level_points')}
+        },
+        'score': summarize(totals['score']),
+        'best_streak': summarize(totals['best_streak']),
+        'clues_used': summarize(totals['clues_used']),
+        'achievement_rates': {
+            name: round(totals['achievements'][name] / games, 6) if games else 0
+            for name in ACHIEVEMENTS + ('any',)
+        },
+        'histograms': {
+            key: {str(value): totals[key][value] for value in sorted(totals[key])}
+            for key in ('score', 'best_streak', 'clues_used', 'clue_levels')
+        },
+    }
+
+
+def write_report(report, path):
+    """
+    Write a simulation report as JSON.
+
+    Args:
+        report (dict): Report from simulate
+        path (str): Output file path, or '-' for standard output
+    """
+    text = json.dumps(report, indent=2)
+    if path == '-':
+        print(text)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
@@ -0,0 +1,19 @@
+"""
+Shared fixtures: every test gets its own scratch database.
+"""
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_operations  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """A DatabaseOperations instance on an empty database file."""
+    monkeypatch.setattr(database_operations, 'DB_PATH', str(tmp_path / 'quiz.db'))
+    db = database_operations.DatabaseOperations()
+    yield db
+    db.conn.close()
@@ -0,0 +1,50 @@
+"""
+Tests for orphan clue collection.
+"""
+
+
+def register(db, filename):
+    db.register_clue_asset(filename, filename * 4, 0x0123456789abcdef, 100)
+
+
+def age(db, filename, seconds):
+    db.cursor.execute(
+        "UPDATE clue_asset SET created_at = datetime('now', ?) WHERE filename = ?",
+        (f'-{seconds} seconds', filename)
+    )
+    db.conn.commit()
+
+
+def test_new_clues_are_not_orphans_yet(db):
+    register(db, 'fresh.png')
+    assert db.select_orphan_clue_assets() == []
+    assert db.select_orphan_clue_assets(grace_seconds=0) == ['fresh.png']
+
+
+def test_used_and_touched_clues_are_kept(db):
+    register(db, 'used.png')
+    register(db, 'reused.png')
+    register(db, 'old.png')
+    db.insert_question("Which brand?", 'used.png', "Audi")
+    for filename in ('used.png', 'reused.png', 'old.png'):
+        age(db, filename, 2 * 24 * 60 * 60)
+
+    assert db.touch_clue_asset('reused.png')
+    assert not db.touch_clue_asset('unknown.png')
+    assert db.select_orphan_clue_assets() == ['old.png']
+
+
+def test_no_collection_while_an_import_is_running(db, tmp_path, monkeypatch):
+    from utils import image_handler
+    from utils.image_handler import ImageHandler
+    monkeypatch.setattr(image_handler, 'CLUES_DIR', str(tmp_path))
+    monkeypatch.setattr(image_handler, 'CLUE_LEVELS_DIR', str(tmp_path / 'levels'))
+    (tmp_path / 'old.png').write_bytes(b'')
+    register(db, 'old.png')
+    age(db, 'old.png', 2 * 24 * 60 * 60)
+
+    with ImageHandler.importing():
+        assert ImageHandler.collect_orphan_clues(db) == 0
+        assert (tmp_path / 'old.png').exists()
+    assert ImageHandler.collect_orphan_clues(db) == 1
+    assert not (tmp_path / 'old.png').exists()
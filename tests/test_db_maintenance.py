@@ -0,0 +1,86 @@
+"""
+Tests for the idle database maintenance.
+"""
+import sqlite3
+from utils.db_maintenance import DatabaseMaintenance
+
+
+def make_database(path):
+    """Create a non-incremental database with an index and plenty of free pages."""
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT, score INTEGER)')
+    conn.execute('CREATE INDEX idx_item_score ON item (score)')
+    conn.executemany(
+        'INSERT INTO item (name, score) VALUES (?, ?)',
+        [(f"item {i}" * 20, i % 97) for i in range(5000)]
+    )
+    conn.commit()
+    conn.execute('DELETE FROM item WHERE id % 2 = 0')
+    conn.commit()
+    conn.close()
+
+
+def pragma(path, name):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(f'PRAGMA {name}').fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_idle_tasks_analyze_without_rewriting_the_file(tmp_path):
+    path = str(tmp_path / 'maintain.db')
+    make_database(path)
+    pages_before = pragma(path, 'page_count')
+
+    report = DatabaseMaintenance(path).run_idle_tasks()
+
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1 WHERE tbl = 'item'").fetchone()[0] > 0
+    finally:
+        conn.close()
+    assert report['analyzed']
+    # The one-off VACUUM is left to the maintain command and shutdown
+    assert 'converted' not in report
+    assert pragma(path, 'auto_vacuum') == 0
+    assert pragma(path, 'page_count') >= pages_before
+
+
+def test_later_runs_vacuum_incrementally_and_skip_fresh_statistics(tmp_path):
+    path = str(tmp_path / 'maintain.db')
+    make_database(path)
+    maintenance = DatabaseMaintenance(path)
+    assert maintenance.enable_incremental_vacuum()
+    assert not maintenance.enable_incremental_vacuum()
+    assert pragma(path, 'auto_vacuum') == 2
+    maintenance.run_idle_tasks()
+
+    conn = sqlite3.connect(path)
+    # Pruning removes old rows in a run, as the leaderboard does
+    conn.execute('DELETE FROM item WHERE id < 3000')
+    conn.commit()
+    conn.close()
+    free_before = pragma(path, 'freelist_count')
+    assert free_before > 0
+
+    report = maintenance.run_idle_tasks()
+    assert report['analyzed']  # Over half of the rows went away
+    assert pragma(path, 'freelist_count') < free_before
+    assert not maintenance.run_idle_tasks()['analyzed']
+
+
+def test_new_tables_make_statistics_stale(tmp_path):
+    path = str(tmp_path / 'maintain.db')
+    make_database(path)
+    maintenance = DatabaseMaintenance(path)
+    assert maintenance.run_idle_tasks()['analyzed']
+
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE extra (id INTEGER PRIMARY KEY)')
+    conn.commit()
+    assert not maintenance.optimize()  # Empty tables have nothing to analyze
+    conn.execute('INSERT INTO extra DEFAULT VALUES')
+    conn.commit()
+    conn.close()
+    assert maintenance.optimize()
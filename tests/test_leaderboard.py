@@ -0,0 +1,82 @@
+"""
+Tests for the windowed leaderboards.
+"""
+import time
+from database_operations import DatabaseOperations
+
+STATS = {'questions_answered': 10, 'clues_used': 0, 'best_streak': 3}
+
+
+def local_noon(year, month, day):
+    return time.mktime((year, month, day, 12, 0, 0, 0, 0, -1))
+
+
+def test_week_runs_on_across_new_year():
+    # Monday 30 December 2024 to Sunday 5 January 2025 is one week
+    week = [local_noon(2024, 12, 30 + i) for i in range(2)] + \
+           [local_noon(2025, 1, day) for day in range(1, 6)]
+    assert {DatabaseOperations.leaderboard_bucket('weekly', ts) for ts in week} == {'2024-12-30'}
+    assert DatabaseOperations.leaderboard_bucket('weekly', local_noon(2025, 1, 6)) == '2025-01-06'
+    assert DatabaseOperations.leaderboard_bucket('daily', local_noon(2024, 12, 31)) == '2024-12-31'
+
+
+def test_new_year_games_share_a_weekly_bucket(db):
+    db.record_game('alice', dict(STATS, score=40), 1000, finished_at=local_noon(2024, 12, 31))
+    db.record_game('alice', dict(STATS, score=70), 1000, finished_at=local_noon(2025, 1, 1))
+    db.record_game('bob', dict(STATS, score=50), 1000, finished_at=local_noon(2025, 1, 2))
+
+    rows = db.cursor.execute(
+        "SELECT bucket, player, best_score FROM leaderboard WHERE period = 'weekly' ORDER BY player"
+    ).fetchall()
+    assert rows == [('2024-12-30', 'alice', 70), ('2024-12-30', 'bob', 50)]
+
+
+def test_backfill_matches_python_buckets(db):
+    start = local_noon(2024, 12, 20)
+    for day in range(21):
+        db.cursor.execute(
+            '''
+            INSERT INTO game_history
+                (player, score, questions_answered, clues_used, best_streak, duration_ms, finished_at)
+            VALUES (?, ?, 10, 0, 0, 1000, ?)
+            ''',
+            (f"p{day}", day, start + day * 86400)
+        )
+    db.cursor.execute('DELETE FROM leaderboard')
+    db._backfill_leaderboard(['daily', 'weekly'])
+
+    for period in ('daily', 'weekly'):
+        rows = db.cursor.execute(
+            'SELECT player, bucket FROM leaderboard WHERE period = ?', (period,)
+        ).fetchall()
+        expected = {
+            f"p{day}": DatabaseOperations.leaderboard_bucket(period, start + day * 86400)
+            for day in range(21)
+        }
+        assert dict(rows) == expected
+
+
+def test_old_weekly_buckets_are_rebuilt(db):
+    db.record_game('alice', dict(STATS, score=30), 1000, finished_at=local_noon(2025, 1, 1))
+    db.cursor.execute("UPDATE leaderboard SET bucket = '2025-W00' WHERE period = 'weekly'")
+    db.conn.commit()
+
+    reopened = DatabaseOperations()
+    try:
+        rows = reopened.cursor.execute(
+            "SELECT bucket, player, best_score FROM leaderboard WHERE period = 'weekly'"
+        ).fetchall()
+    finally:
+        reopened.conn.close()
+    assert rows == [('2024-12-30', 'alice', 30)]
+
+
+def test_prune_keeps_recent_weeks(db):
+    now = time.time()
+    db.record_game('old', dict(STATS, score=10), 1000, finished_at=now - 30 * 86400)
+    db.record_game('new', dict(STATS, score=20), 1000, finished_at=now)
+    db.prune_leaderboards(keep_days=7, keep_weeks=2)
+
+    weekly = db.cursor.execute("SELECT player FROM leaderboard WHERE period = 'weekly'").fetchall()
+    assert weekly == [('new',)]
+    assert [row[0] for row in db.get_leaderboard('weekly')] == ['new']
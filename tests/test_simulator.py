@@ -0,0 +1,27 @@
+"""
+Tests for the scoring simulator.
+"""
+import simulator
+
+SETTINGS = {
+    **simulator.DEFAULT_SETTINGS,
+    'questions': 1,
+    'skill': (0.0, 0.0),
+    'clue_rate': (1.0, 1.0),
+    'clue_level_points': (-1, -2, -4),
+}
+
+
+def test_clues_are_scored_by_the_level_reached():
+    # Every clue gives the answer at the second level
+    settings = dict(SETTINGS, clue_level_accuracy=(0.0, 1.0, 1.0))
+    result = simulator.simulate_chunk((50, 'seed', settings))
+    assert result['clue_levels'] == {2: 50}
+    assert result['score'] == {settings['points_for_correct'] - 2: 50}
+
+
+def test_unanswered_clues_cost_every_level():
+    settings = dict(SETTINGS, clue_level_accuracy=(0.0, 0.0, 0.0))
+    result = simulator.simulate_chunk((50, 'seed', settings))
+    assert result['clue_levels'] == {3: 50}
+    assert result['score'] == {-4: 50}
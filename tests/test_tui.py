@@ -0,0 +1,23 @@
+"""
+Tests for the terminal front end.
+"""
+import io
+from tui import TerminalQuiz
+from utils.question_sources import MemoryQuestionSource
+
+
+def test_skips_questions_whose_clue_is_gone(db, tmp_path):
+    (tmp_path / 'here.png').write_bytes(b'')
+    source = MemoryQuestionSource(
+        [(1, "Which brand?", 'here.png', 'Audi'), (2, "Which brand?", 'gone.png', 'Ford')],
+        clue_lookup=lambda filename: str(tmp_path / filename)
+    )
+    stdout = io.StringIO()
+    quiz = TerminalQuiz(db, source, stdin=io.StringIO("alice\naudi\nn\n"), stdout=stdout)
+
+    assert quiz.run() == 0
+    assert "Question 2/" not in stdout.getvalue()
+    assert "Ford" not in stdout.getvalue()
+    stats = db.select_question_stats('alice')
+    assert list(stats) == [1] and stats[1][:3] == (1, 1, 0)
+    assert quiz.pending_answers == []
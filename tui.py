@@ -0,0 +1,203 @@
+"""
+Terminal front end for the Car Brand Quiz application.
+
+Plays the same question, clue, answer, score and save flow as the window
+version, but only imports the database and game logic, so it starts almost
+instantly and works over SSH or on headless machines. Answers can be piped in
+on standard input for scripted runs: the first line is the player's name and
+every following line is one answer.
+"""
+import os
+import sys
+import time
+from game_logic import GameLogic
+from question_scheduler import QuestionScheduler
+from utils.question_sources import SQLiteQuestionSource
+from config import ANSWER_BATCH_SIZE
+
+CLUE_COMMANDS = ('?', ':clue')
+QUIT_COMMANDS = (':q', ':quit')
+
+
+class TerminalQuiz:
+    """Runs quiz games on a text stream."""
+
+    def __init__(self, db, question_source=None, stdin=None, stdout=None):
+        """
+        Initialize the terminal quiz.
+
+        Args:
+            db (DatabaseOperations): Database for stats and scores
+            question_source (QuestionSource): Where questions come from;
+                defaults to the database
+            stdin: Stream answers are read from (default: sys.stdin)
+            stdout: Stream the game is written to (default: sys.stdout)
+        """
+        self.db = db
+        self.question_source = question_source or SQLiteQuestionSource(db)
+        self.stdin = stdin or sys.stdin
+        self.stdout = stdout or sys.stdout
+        self.interactive = self.stdin.isatty()
+        self.game_logic = GameLogic()
+        self.answers = 0
+        self.pending_answers = []
+
+    def say(self, text=""):
+        """Write a line of output."""
+        self.stdout.write(text + "\n")
+
+    def ask(self, prompt):
+        """
+        Read one line of input.
+
+        Returns:
+            str: The line without its newline, or None at end of input
+        """
+        self.stdout.write(prompt)
+        self.stdout.flush()
+        line = self.stdin.readline()
+        if not line:
+            self.stdout.write("\n")
+            return None
+        if not self.interactive:
+            # Echo scripted input so transcripts read like a session
+            self.stdout.write(line if line.endswith("\n") else line + "\n")
+        return line.rstrip("\n")
+
+    def play(self, player_name):
+        """
+        Play one game.
+
+        Args:
+            player_name (str): Player's name
+
+        Returns:
+            bool: True if the game was finished and saved, False if abandoned
+        """
+        logic = self.game_logic
+        logic.reset_game()
+        question_ids = self.question_source.question_ids()
+        if not question_ids:
+            self.say("No questions available.")
+            return False
+
+        scheduler = QuestionScheduler(question_ids, self.db.select_question_stats(player_name))
+        started_at = time.monotonic()
+        total = len(question_ids)
+
+        while len(scheduler):
+            question_id = scheduler.draw()
+            row = self.question_source.get_question(question_id)
+            # No asset scan runs here, so a clue deleted since the last one isn't flagged yet
+            if row is None or not self.clue_available(question_id, row[2]):
+                total -= 1
+                continue
+            _, question, image_filename, answer = row[:4]
+            clue_level = 0
+
+            self.say()
+            self.say(f"Question {logic.questions_answered + 1}/{total}   Score: {logic.score}")
+            self.say(question)
+            shown_at = time.perf_counter()
+
+            while True:
+                reply = self.ask("Answer (? for clue, :q to quit): ")
+                if reply is None or reply.strip().lower() in QUIT_COMMANDS:
+                    self.flush_answers(player_name)
+                    self.say("Game abandoned.")
+                    return False
+                if reply.strip().lower() in CLUE_COMMANDS:
+                    if not clue_level:
+                        # Terminals can't show the blurred levels, so the clue is the full image
+                        clue_level = len(logic.clue_level_points)
+                        self.say(f"Clue ({logic.clue_penalty(clue_level)} points): "
+                                 f"{self.describe_clue(question_id, image_filename)}")
+                    continue
+                break
+
+            response_ms = (time.perf_counter() - shown_at) * 1000
+            is_correct = logic.check_answer(reply, str(answer))
+            points = logic.calculate_score(is_correct, clue_level > 0, clue_level=clue_level)
+            self.pending_answers.append((question_id, is_correct, clue_level > 0, response_ms, time.time()))
+            if len(self.pending_answers) >= ANSWER_BATCH_SIZE:
+                self.flush_answers(player_name)
+            self.answers += 1
+
+            if is_correct:
+                self.say(f"Correct! {points:+d} points")
+            else:
+                self.say(f"Wrong, it was {answer}. {points:+d} points")
+
+        self.flush_answers(player_name)
+        self.show_game_over(player_name, (time.monotonic() - started_at) * 1000)
+        return True
+
+    def flush_answers(self, player_name):
+        """Write the answers collected so far to the player's statistics."""
+        if self.pending_answers and self.db.record_answers(player_name, self.pending_answers):
+            self.pending_answers = []
+
+    def clue_available(self, question_id, image_filename):
+        """Check that a question's clue image can still be found."""
+        try:
+            clue = self.question_source.open_clue(question_id, image_filename)
+        except (OSError, ValueError):
+            return False
+        return os.path.exists(clue) if isinstance(clue, str) else True
+
+    def describe_clue(self, question_id, image_filename):
+        """Say where the clue image can be viewed; terminals cannot show it."""
+        try:
+            clue = self.question_source.open_clue(question_id, image_filename)
+        except (OSError, ValueError) as e:
+            return f"unavailable ({e})"
+        return clue if isinstance(clue, str) else f"{image_filename} (in question pack)"
+
+    def show_game_over(self, player_name, duration_ms):
+        """Save the finished game and print the player's results."""
+        stats = self.game_logic.get_statistics()
+        self.db.record_game(player_name, stats, duration_ms)
+
+        self.say()
+        self.say("Game Over!")
+        self.say(f"Final Score: {stats['score']} points   Best streak: {stats['best_streak']}")
+
+        player_stats = self.db.get_player_stats(player_name)
+        if player_stats:
+            self.say(
+                f"Games played: {player_stats['games_played']}   "
+                f"Average: {player_stats['mean_score']:.1f}   "
+                f"Best: {player_stats['best_score']}"
+            )
+        rank = self.db.get_player_rank(player_name, 'all')
+        if rank:
+            self.say(f"All-time rank: #{rank[0]}")
+
+    def run(self):
+        """
+        Play games until the input runs out or the player declines another.
+
+        Returns:
+            int: Exit status
+        """
+        started_at = time.perf_counter()
+        while True:
+            player_name = self.ask("Player name: ")
+            if player_name is None:
+                break
+            player_name = player_name.strip()
+            if not player_name:
+                self.say("Please enter a name.")
+                continue
+
+            self.play(player_name)
+
+            again = self.ask("Play again? [y/N]: ")
+            if again is None or again.strip().lower() not in ('y', 'yes'):
+                break
+
+        if not self.interactive:
+            elapsed = time.perf_counter() - started_at
+            rate = self.answers / elapsed if elapsed else 0
+            print(f"Answered {self.answers} questions in {elapsed:.2f}s ({rate:.0f}/s)", file=sys.stderr)
+        return 0
@@ -0,0 +1,56 @@
+"""
+Clue asset integrity scanner for the Car Brand Quiz application.
+
+Reconciles the question table with the clue directory: every question whose
+clue image is missing or corrupt is flagged in the database, and flagged
+questions are never drawn by the game. The image validation cache serves as
+the scan manifest, so only files added or changed since the last scan are
+opened. Progressive clue levels missing or older than their clue are built
+here too, so clues added by hand get them without waiting for a game.
+"""
+from database_operations import DatabaseOperations
+from utils.image_handler import ImageHandler
+
+
+class AssetScanner:
+    """Checks clue images against the question table."""
+
+    @staticmethod
+    def scan():
+        """
+        Run a full reconciliation.
+
+        Opens its own database connection, so it can be run on a worker thread.
+
+        Returns:
+            dict: Maps each flagged question id to 'missing' or 'corrupt'
+        """
+        clue_status = {
+            filename: info['valid']
+            for filename, info in ImageHandler.scan_clues().items()
+        }
+        for filename, valid in clue_status.items():
+            if valid:
+                ImageHandler.build_clue_levels(filename)
+        db = DatabaseOperations()
+        try:
+            return db.update_question_flags(clue_status)
+        finally:
+            db.conn.close()
+
+    @staticmethod
+    def start(tasks, callback, error_callback=None):
+        """
+        Run a scan in the background.
+
+        Args:
+            tasks (BackgroundTasks): Task runner to use
+            callback: Called on the UI thread with the flagged question ids
+            error_callback: Called on the UI thread with the exception if the
+                scan fails; by default the error is printed
+        """
+        tasks.submit(
+            AssetScanner.scan,
+            callback=callback,
+            error_callback=error_callback or (lambda e: print(f"Error scanning clue assets: {e}"))
+        )
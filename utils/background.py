@@ -0,0 +1,80 @@
+"""
+Background task runner for the Car Brand Quiz application.
+
+Tk widgets may only be touched from the main thread, so work is run on a
+thread pool and its results are handed back to the UI through a queue that
+is polled with ``after()``.
+"""
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundTasks:
+    """Run functions off the UI thread and deliver results on it."""
+
+    def __init__(self, widget, max_workers=2, poll_interval=30):
+        """
+        Initialize the task runner.
+
+        Args:
+            widget: Any Tk widget, used to schedule polling on the UI thread
+            max_workers (int): Number of worker threads
+            poll_interval (int): Milliseconds between result checks
+        """
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.results = queue.Queue()
+        self.pending = 0
+        self.polling = False
+
+    def submit(self, func, *args, callback=None, error_callback=None):
+        """
+        Run a function in the background.
+
+        Args:
+            func: Function to run on a worker thread
+            *args: Arguments for the function
+            callback: Called on the UI thread with the function's result
+            error_callback: Called on the UI thread with the raised exception
+        """
+        def run():
+            try:
+                self.results.put((callback, func(*args), None))
+            except Exception as e:
+                self.results.put((error_callback, None, e))
+
+        self.pending += 1
+        self.executor.submit(run)
+        if not self.polling:
+            self.polling = True
+            self.widget.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        """Deliver finished results on the UI thread."""
+        while True:
+            try:
+                callback, result, error = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            self.pending -= 1
+            try:
+                if error is not None:
+                    if callback:
+                        callback(error)
+                    else:
+                        print(f"Background task failed: {error}")
+                elif callback:
+                    callback(result)
+            except Exception as e:
+                print(f"Error in background callback: {e}")
+
+        if self.pending > 0:
+            self.widget.after(self.poll_interval, self._poll)
+        else:
+            self.polling = False
+
+    def shutdown(self):
+        """Stop accepting work and drop anything not yet started."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,63 @@
+"""
+Change detection for hot-reloading assets in the Car Brand Quiz application.
+
+Staff may add clue images or edit the database with other tools while the
+kiosk is running. Nothing is rescanned to find out: a poll is one os.stat per
+watched directory, whose modification time moves whenever a file is added,
+removed or renamed into it, and one PRAGMA data_version, which moves whenever
+another connection commits to the database. Both are answered from the OS and
+SQLite's page cache, so polling costs a few microseconds.
+"""
+import os
+
+
+class ChangeDetector:
+    """Polls directory mtimes and the database's data_version for changes."""
+
+    def __init__(self, conn, directories=()):
+        """
+        Take the initial readings.
+
+        Args:
+            conn (sqlite3.Connection): Connection whose data_version is watched;
+                its own commits do not count as changes
+            directories (iterable): Directories to watch
+        """
+        self.conn = conn
+        self.directories = {
+            os.path.abspath(path): self._mtime(os.path.abspath(path)) for path in directories
+        }
+        self.data_version = self._data_version()
+
+    @staticmethod
+    def _mtime(directory):
+        """Modification time of a directory in ns, or None if it is missing."""
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def _data_version(self):
+        """Counter that moves when another connection commits to the database."""
+        return self.conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def poll(self):
+        """
+        Check for changes since the last poll.
+
+        Returns:
+            dict: database (bool, True if another connection committed) and
+                  directories (list of watched directories that changed)
+        """
+        changed_directories = []
+        for directory, mtime in self.directories.items():
+            current = self._mtime(directory)
+            if current != mtime:
+                self.directories[directory] = current
+                changed_directories.append(directory)
+
+        data_version = self._data_version()
+        database_changed = data_version != self.data_version
+        self.data_version = data_version
+
+        return {'database': database_changed, 'directories': changed_directories}
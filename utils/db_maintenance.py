@@ -0,0 +1,256 @@
+"""
+Database maintenance for the Car Brand Quiz application.
+
+Keeps branddb.db healthy on long-running kiosks: refreshes query planner
+statistics, returns free pages to the file system a few at a time, and takes
+online backups through the sqlite3 backup API in small page steps so other
+connections are never locked out for long.
+"""
+import os
+import sqlite3
+import time
+from config import (
+    DB_PATH,
+    BACKUP_DIR,
+    BACKUP_KEEP,
+    BACKUP_PAGES_PER_STEP,
+    BACKUP_STEP_PAUSE,
+    VACUUM_PAGES_PER_RUN,
+    ANALYSIS_LIMIT,
+    STATS_STALE_FRACTION
+)
+
+
+class DatabaseMaintenance:
+    """Maintenance tasks; each opens its own connection so it can run on any thread."""
+
+    def __init__(self, db_path=None):
+        """
+        Initialize maintenance for a database.
+
+        Args:
+            db_path (str, optional): Database file to maintain
+        """
+        self.db_path = db_path or DB_PATH
+
+    def _connect(self):
+        """Open a connection that waits for busy writers instead of failing."""
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def _used_pages(conn):
+        """Pages holding data; read from the header, so no table is scanned."""
+        page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+        return page_count - conn.execute('PRAGMA freelist_count').fetchone()[0]
+
+    @staticmethod
+    def _stats_stale(conn):
+        """
+        Check whether planner statistics are missing or out of date.
+
+        PRAGMA optimize cannot tell on a fresh connection (before SQLite 3.46
+        it only looks at tables that connection has queried), so the check is
+        done here without scanning anything: a non-empty table with no row in
+        sqlite_stat1 has never been analyzed, and the data pages in use are
+        compared with the number logged at the last ANALYZE.
+        """
+        exists = conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ('sqlite_stat1', 'analyze_state')"
+        ).fetchone()[0]
+        if exists < 2:
+            return True
+
+        unanalyzed = conn.execute(
+            """
+            SELECT name FROM sqlite_master
+            WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+                AND sql NOT LIKE 'CREATE VIRTUAL%' AND name != 'analyze_state'
+                AND name NOT IN (SELECT tbl FROM sqlite_stat1)
+            """
+        ).fetchall()
+        for (table,) in unanalyzed:
+            if conn.execute(f'SELECT 1 FROM "{table}" LIMIT 1').fetchone():
+                return True
+
+        row = conn.execute('SELECT used_pages FROM analyze_state WHERE id = 0').fetchone()
+        if row is None:
+            return True
+        return abs(DatabaseMaintenance._used_pages(conn) - row[0]) > row[0] * STATS_STALE_FRACTION
+
+    @staticmethod
+    def _log_analyze(conn):
+        """Record the data pages in use when the new statistics were gathered."""
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS analyze_state (id INTEGER PRIMARY KEY CHECK (id = 0), used_pages INTEGER NOT NULL)'
+        )
+        conn.execute(
+            'INSERT OR REPLACE INTO analyze_state (id, used_pages) VALUES (0, ?)',
+            (DatabaseMaintenance._used_pages(conn),)
+        )
+
+    def optimize(self):
+        """
+        Refresh query planner statistics if they are missing or stale.
+        ANALYZE samples at most ANALYSIS_LIMIT rows per index, so it stays quick.
+
+        Returns:
+            bool: True if the statistics were refreshed
+        """
+        conn = self._connect()
+        try:
+            if not self._stats_stale(conn):
+                return False
+            conn.execute(f'PRAGMA analysis_limit = {int(ANALYSIS_LIMIT)}')
+            conn.execute('ANALYZE')
+            self._log_analyze(conn)
+            conn.commit()
+            return True
+        finally:
+            conn.close()
+
+    def analyze(self):
+        """Rebuild query planner statistics for every table."""
+        conn = self._connect()
+        try:
+            conn.execute('ANALYZE')
+            self._log_analyze(conn)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def enable_incremental_vacuum(self):
+        """
+        Switch the database to incremental auto-vacuum.
+
+        This rewrites the whole file once with VACUUM, so it is never run
+        while the application is in use: only from the maintain command and
+        when the application shuts down.
+
+        Returns:
+            bool: True if the database was converted, False if it already was
+        """
+        conn = self._connect()
+        try:
+            if conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2:
+                return False
+            conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            conn.execute('VACUUM')
+            return True
+        finally:
+            conn.close()
+
+    def incremental_vacuum(self, pages=VACUUM_PAGES_PER_RUN):
+        """
+        Return up to the given number of free pages to the file system.
+        Does nothing unless incremental auto-vacuum has been enabled.
+
+        Returns:
+            int: Number of free pages left afterwards
+        """
+        conn = self._connect()
+        try:
+            if conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2:
+                conn.execute(f'PRAGMA incremental_vacuum({int(pages)})').fetchall()
+                conn.commit()
+            return conn.execute('PRAGMA freelist_count').fetchone()[0]
+        finally:
+            conn.close()
+
+    def backup(self, destination=None, pages=BACKUP_PAGES_PER_STEP, pause=BACKUP_STEP_PAUSE,
+               progress=None):
+        """
+        Copy the database while it stays in use.
+
+        Copies a few pages at a time and sleeps between steps, so writers on
+        other connections only ever wait for one small step.
+
+        Args:
+            destination (str, optional): Backup file path; defaults to a
+                timestamped file in BACKUP_DIR
+            pages (int): Pages copied per step
+            pause (float): Seconds to sleep between steps
+            progress: Optional callback(remaining, total) after each step
+
+        Returns:
+            str: Path of the finished backup
+        """
+        if destination is None:
+            os.makedirs(BACKUP_DIR, exist_ok=True)
+            destination = os.path.join(
+                BACKUP_DIR,
+                f"branddb-{time.strftime('%Y%m%d-%H%M%S')}.db"
+            )
+
+        temp_path = destination + '.tmp'
+        source = self._connect()
+        target = sqlite3.connect(temp_path)
+        try:
+            def step(status, remaining, total):
+                if progress:
+                    progress(remaining, total)
+                time.sleep(pause)
+
+            source.backup(target, pages=pages, progress=step)
+        finally:
+            target.close()
+            source.close()
+
+        # Only a complete copy ever carries the backup's name
+        os.replace(temp_path, destination)
+        return destination
+
+    @staticmethod
+    def _list_backups():
+        """Names of automatic backups in BACKUP_DIR, oldest first."""
+        try:
+            return sorted(
+                name for name in os.listdir(BACKUP_DIR)
+                if name.startswith('branddb-') and name.endswith('.db')
+            )
+        except FileNotFoundError:
+            return []
+
+    def last_backup_time(self):
+        """
+        Get when the newest automatic backup was taken.
+
+        Returns:
+            float: Unix time of the newest backup, or 0 if there is none
+        """
+        backups = self._list_backups()
+        if not backups:
+            return 0
+        return os.path.getmtime(os.path.join(BACKUP_DIR, backups[-1]))
+
+    def prune_backups(self, keep=BACKUP_KEEP):
+        """
+        Delete all but the newest automatic backups.
+
+        Returns:
+            int: Number of backups deleted
+        """
+        backups = self._list_backups()
+        stale = backups[:-keep] if keep else backups
+        for name in stale:
+            os.remove(os.path.join(BACKUP_DIR, name))
+        return len(stale)
+
+    def run_idle_tasks(self, backup=False):
+        """
+        Run the routine maintenance done while the application is idle:
+        refresh stale statistics, release free pages and optionally back up.
+
+        Args:
+            backup (bool): Whether to also take and rotate a backup
+
+        Returns:
+            dict: What was done
+        """
+        report = {
+            'analyzed': self.optimize(),
+            'free_pages': self.incremental_vacuum()
+        }
+        if backup:
+            report['backup'] = self.backup()
+            report['backups_pruned'] = self.prune_backups()
+        return report
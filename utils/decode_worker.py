@@ -0,0 +1,198 @@
+"""
+Out-of-process clue image decoding for the Car Brand Quiz application.
+
+PIL holds the GIL for parts of decoding and resizing, so a very large PNG or
+BMP clue decoded on any thread of the UI process can stall Tk. Clues are
+decoded instead in a dedicated worker process, which writes the resized
+pixels straight into a shared memory block owned by the UI process. Only the
+request (a path, or the encoded bytes of a packed clue) crosses the pipe; the
+pixels are never pickled. The UI process just wraps the buffer in an image.
+
+One decode is in flight at a time, so the single shared block is never
+written while it is being read; a newer request replaces any waiting one.
+"""
+import io
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+from PIL import Image
+from config import CLUE_IMAGE_SIZE, DECODE_POLL_INTERVAL_MS
+
+
+def _decode_loop(requests, results):
+    """Worker process main loop: decode requests until told to stop."""
+    from utils.image_handler import ImageHandler
+
+    blocks = {}
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        sequence, source, size, block_name = request
+        try:
+            if isinstance(source, bytes):
+                source = io.BytesIO(source)
+            image = ImageHandler.load_clue_image(source, size[1])
+            if image.size != size:
+                image = image.resize(size)
+            if image.mode not in ('RGB', 'RGBA'):
+                has_alpha = 'A' in image.mode or 'transparency' in image.info
+                image = image.convert('RGBA' if has_alpha else 'RGB')
+
+            if block_name not in blocks:
+                for block in blocks.values():
+                    block.close()
+                blocks = {block_name: shared_memory.SharedMemory(name=block_name)}
+            pixels = image.tobytes()
+            blocks[block_name].buf[:len(pixels)] = pixels
+            results.put((sequence, image.mode, None))
+        except Exception as e:
+            results.put((sequence, None, f"{type(e).__name__}: {e}"))
+
+    for block in blocks.values():
+        block.close()
+
+
+class DecodeWorker:
+    """Decodes clue images in a separate process and delivers them on the UI thread."""
+
+    def __init__(self, widget, poll_interval=DECODE_POLL_INTERVAL_MS):
+        """
+        Initialize the worker; the process is started on first use.
+
+        Args:
+            widget: Any Tk widget, used to schedule polling on the UI thread
+            poll_interval (int): Milliseconds between result checks
+        """
+        self.widget = widget
+        self.poll_interval = poll_interval
+        # Never fork a process that is running Tk
+        self.context = multiprocessing.get_context('spawn')
+        self.process = None
+        self.requests = None
+        self.results = None
+        self.block = None
+        self.sequence = 0
+        self.in_flight = None
+        self.waiting = None
+
+    def start(self):
+        """Start the worker process if it is not running."""
+        if self.process and self.process.is_alive():
+            return
+        self.requests = self.context.Queue()
+        self.results = self.context.Queue()
+        self.process = self.context.Process(
+            target=_decode_loop,
+            args=(self.requests, self.results),
+            name="clue-decoder",
+            daemon=True
+        )
+        self.process.start()
+        self.in_flight = None
+
+    def decode(self, source, target_height=CLUE_IMAGE_SIZE[1], callback=None, error_callback=None):
+        """
+        Decode an image at the given height, keeping its aspect ratio.
+
+        Args:
+            source: Path or file-like object of the image
+            target_height (int): Height of the decoded image
+            callback: Called on the UI thread with the PIL image
+            error_callback: Called on the UI thread with an exception
+        """
+        try:
+            # Only the header is read here; it gives the output size
+            with Image.open(source) as img:
+                aspect_ratio = img.width / img.height
+            size = (max(1, int(target_height * aspect_ratio)), target_height)
+            if not isinstance(source, str):
+                source.seek(0)
+                source = source.read()
+        except Exception as e:
+            if error_callback:
+                error_callback(e)
+            return
+
+        self.sequence += 1
+        self.waiting = (self.sequence, source, size, callback, error_callback)
+        if self.in_flight is None:
+            self._send_waiting()
+
+    def _ensure_block(self, needed):
+        """Make sure the shared block can hold the given number of bytes."""
+        if self.block and self.block.size >= needed:
+            return
+        if self.block:
+            self.block.close()
+            self.block.unlink()
+        self.block = shared_memory.SharedMemory(create=True, size=needed)
+
+    def _send_waiting(self):
+        """Send the newest waiting request to the worker."""
+        request, self.waiting = self.waiting, None
+        sequence, source, size, callback, error_callback = request
+        try:
+            self.start()
+            self._ensure_block(size[0] * size[1] * 4)
+            self.requests.put((sequence, source, size, self.block.name))
+        except Exception as e:
+            if error_callback:
+                error_callback(e)
+            return
+        self.in_flight = (sequence, size, callback, error_callback)
+        self.widget.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        """Deliver the finished decode on the UI thread."""
+        if self.in_flight is None:
+            return
+        sequence, size, callback, error_callback = self.in_flight
+        try:
+            result_sequence, mode, error = self.results.get_nowait()
+        except queue.Empty:
+            if not self.process.is_alive():
+                self.in_flight = None
+                self.process = None
+                if error_callback:
+                    error_callback(RuntimeError("Clue decoder process exited"))
+                if self.waiting:
+                    self._send_waiting()
+                return
+            self.widget.after(self.poll_interval, self._poll)
+            return
+
+        if result_sequence != sequence:
+            # A reply to a request abandoned by a restart; keep waiting
+            self.widget.after(self.poll_interval, self._poll)
+            return
+
+        self.in_flight = None
+        # Results superseded by a newer request are dropped unseen
+        if self.waiting is None:
+            try:
+                if error is not None:
+                    raise RuntimeError(error)
+                length = size[0] * size[1] * len(mode)
+                image = Image.frombuffer(mode, size, self.block.buf[:length], 'raw', mode, 0, 1).copy()
+            except Exception as e:
+                if error_callback:
+                    error_callback(e)
+            else:
+                if callback:
+                    callback(image)
+        else:
+            self._send_waiting()
+
+    def close(self):
+        """Stop the worker process and free the shared block."""
+        if self.process:
+            self.requests.put(None)
+            self.process.join(timeout=2)
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process = None
+        if self.block:
+            self.block.close()
+            self.block.unlink()
+            self.block = None
@@ -0,0 +1,99 @@
+"""
+Streaming data export for the Car Brand Quiz application.
+
+Rows are streamed from a database cursor straight into CSV or JSON Lines,
+optionally gzip-compressed, so memory use stays constant however many rows
+are exported.
+"""
+import csv
+import gzip
+import json
+import sys
+from contextlib import contextmanager
+
+# Export name -> (DatabaseOperations method, column names)
+EXPORTS = {
+    'scores': ('iter_scores', ('name', 'score')),
+    'history': ('iter_game_history', (
+        'id', 'player', 'score', 'questions_answered', 'clues_used',
+        'best_streak', 'duration_ms', 'finished_at'
+    )),
+    'questions': ('iter_questions', ('id', 'question', 'image_filename', 'answer')),
+}
+
+FORMATS = ('csv', 'jsonl')
+
+
+@contextmanager
+def open_output(path, compress):
+    """
+    Open an export destination for text writing.
+
+    Args:
+        path (str): File path, or '-' for standard output
+        compress (bool): Whether to gzip the output
+    """
+    if path == '-':
+        if compress:
+            with gzip.open(sys.stdout.buffer, 'wt', encoding='utf-8', newline='') as f:
+                yield f
+        else:
+            yield sys.stdout
+    elif compress:
+        with gzip.open(path, 'wt', encoding='utf-8', newline='') as f:
+            yield f
+    else:
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            yield f
+
+
+def write_rows(f, columns, rows, fmt):
+    """
+    Write rows to an open text file.
+
+    Args:
+        f: Open text file
+        columns (tuple): Column names
+        rows (iterable): Row tuples; consumed one at a time
+        fmt (str): 'csv' or 'jsonl'
+
+    Returns:
+        int: Number of rows written
+    """
+    count = 0
+    if fmt == 'csv':
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    elif fmt == 'jsonl':
+        for row in rows:
+            f.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+            f.write('\n')
+            count += 1
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+    return count
+
+
+def export(db, what, path, fmt='csv', compress=None):
+    """
+    Export a table from the database.
+
+    Args:
+        db (DatabaseOperations): Database to export from
+        what (str): One of EXPORTS
+        path (str): Output file path, or '-' for standard output
+        fmt (str): 'csv' or 'jsonl'
+        compress (bool, optional): Gzip the output; defaults to True for .gz paths
+
+    Returns:
+        int: Number of rows exported
+    """
+    method, columns = EXPORTS[what]
+    if compress is None:
+        compress = path.endswith('.gz')
+
+    with open_output(path, compress) as f:
+        return write_rows(f, columns, getattr(db, method)(), fmt)
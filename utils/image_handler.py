@@ -1,57 +1,375 @@
 """
 Utility functions for handling images in the Car Brand Quiz application.
 """
+import hashlib
 import os
 import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
 from PIL import Image
-from config import CLUES_DIR, CLUE_IMAGE_SIZE
+from config import (
+    CLUES_DIR,
+    CLUE_LEVELS_DIR,
+    CLUE_IMAGE_SIZE,
+    CLUE_LEVEL_POINTS,
+    CLUE_PIXEL_BLOCK,
+    CLUE_PARTIAL_REVEAL,
+    THUMBNAIL_SIZE
+)
+from utils.validation_cache import ImageValidationCache
 
 
 class ImageHandler:
+    _validation_cache = None
+    # Held while a clue is stored or claimed and while orphans are collected,
+    # so collection never sees a clue between its copy and its registration
+    _store_lock = threading.Lock()
+    _imports_running = 0
+
+    @classmethod
+    def validation_cache(cls):
+        """Get the shared image validation cache, opening it on first use."""
+        if cls._validation_cache is None:
+            cls._validation_cache = ImageValidationCache()
+        return cls._validation_cache
+
+    @staticmethod
+    def inspect_image(file_path):
+        """
+        Get an image's validity, format, mode and dimensions.
+        Unchanged files are answered from the validation cache.
+        """
+        return ImageHandler.validation_cache().inspect(file_path)
+
     @staticmethod
     def validate_image_file(file_path):
         """
         Validate if a file is a valid image file.
         """
-        try:
-            with Image.open(file_path) as img:
-                img.verify()
-            return True
-        except Exception:
-            return False
+        return ImageHandler.inspect_image(file_path)['valid']
+
+    @staticmethod
+    def scan_clues():
+        """
+        Validate every file in the clues directory.
+
+        Returns:
+            dict: Maps each filename to its validation info
+        """
+        return ImageHandler.validation_cache().scan_directory(CLUES_DIR)
+
+    @staticmethod
+    def compute_sha256(file_path):
+        """
+        Compute the SHA-256 of a file's contents as a hex string.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def compute_phash(file_path):
+        """
+        Compute a 64-bit difference hash of an image.
+        Similar-looking images get hashes that differ in only a few bits.
+        """
+        with Image.open(file_path) as img:
+            img = img.convert('L').resize((9, 8), Image.Resampling.LANCZOS)
+            pixels = list(img.getdata())
+
+        phash = 0
+        for row in range(8):
+            for col in range(8):
+                left = pixels[row * 9 + col]
+                right = pixels[row * 9 + col + 1]
+                phash = (phash << 1) | (left > right)
+        return phash
 
     @staticmethod
     def copy_to_clues(source_path):
         """
         Copy an image file to the clues directory.
+        Files are named after their content hash, so copying the same
+        image twice stores it only once.
         """
+        temp_path = None
         try:
-            if not ImageHandler.validate_image_file(source_path):
+            info = ImageHandler.inspect_image(source_path)
+            if not info['valid']:
                 return None
 
-            filename = os.path.basename(source_path)
-            base, ext = os.path.splitext(filename)
-            counter = 1
-            
-            while os.path.exists(os.path.join(CLUES_DIR, filename)):
-                filename = f"{base}_{counter}{ext}"
-                counter += 1
-
+            ext = os.path.splitext(source_path)[1].lower()
+            if ext == '.jpeg':
+                ext = '.jpg'
+            filename = f"{ImageHandler.compute_sha256(source_path)}{ext}"
             destination = os.path.join(CLUES_DIR, filename)
-            shutil.copy2(source_path, destination)
 
-            # Resize image if needed
-            with Image.open(destination) as img:
-                img = img.convert('RGB')
-                img.thumbnail(CLUE_IMAGE_SIZE)
-                img.save(destination, quality=95, optimize=True)
+            if os.path.exists(destination):
+                return filename
 
+            # Write to a unique temporary name first, so a half-written file
+            # is never mistaken for a stored clue and concurrent copies of
+            # the same image don't write to the same file
+            with tempfile.NamedTemporaryFile(dir=CLUES_DIR, prefix=f".{filename}.",
+                                             suffix='.tmp', delete=False) as temp:
+                temp_path = temp.name
+            shutil.copy2(source_path, temp_path)
+
+            # Resize image if needed; small RGB images are kept byte for byte
+            fits = info['width'] <= CLUE_IMAGE_SIZE[0] and info['height'] <= CLUE_IMAGE_SIZE[1]
+            if not fits or info['mode'] != 'RGB':
+                with Image.open(temp_path) as img:
+                    img = img.convert('RGB')
+                    img.thumbnail(CLUE_IMAGE_SIZE)
+                    img.save(temp_path, format=Image.registered_extensions()[ext], quality=95, optimize=True)
+
+            os.replace(temp_path, destination)
             return filename
 
         except Exception as e:
             print(f"Error copying image: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+
+    @staticmethod
+    def store_clue(source_path, db):
+        """
+        Copy an image to the clues directory and register it in the database.
+
+        Args:
+            source_path (str): Image file to store
+            db (DatabaseOperations): Database to record the clue in
+
+        Returns:
+            tuple: (filename, near_duplicates) where near_duplicates is a list of
+                   (filename, distance) tuples for similar stored clues.
+                   filename is None if the image could not be stored.
+        """
+        sha256 = ImageHandler.compute_sha256(source_path)
+        with ImageHandler._store_lock:
+            existing = db.find_clue_asset(sha256)
+            if existing and os.path.exists(os.path.join(CLUES_DIR, existing)):
+                db.touch_clue_asset(existing)
+                return existing, []
+
+            filename = ImageHandler.copy_to_clues(source_path)
+            if not filename:
+                return None, []
+
+            stored_path = os.path.join(CLUES_DIR, filename)
+            phash = ImageHandler.compute_phash(stored_path)
+            near_duplicates = [
+                match for match in db.find_similar_clues(phash)
+                if match[0] != filename
+            ]
+            db.register_clue_asset(filename, sha256, phash, os.path.getsize(stored_path))
+        ImageHandler.build_clue_levels(filename)
+        return filename, near_duplicates
+
+    @staticmethod
+    def claim_clue(filename, db):
+        """
+        Mark a clue already in the clues directory as about to be used, so
+        orphan collection leaves it alone for another grace period.
+
+        Returns:
+            bool: True if the clue is a registered one
+        """
+        with ImageHandler._store_lock:
+            return db.touch_clue_asset(filename)
+
+    @staticmethod
+    @contextmanager
+    def importing():
+        """
+        Mark a question import as running, from storing its clue until its
+        question is saved; orphan collection is skipped until none are.
+        """
+        with ImageHandler._store_lock:
+            ImageHandler._imports_running += 1
+        try:
+            yield
+        finally:
+            with ImageHandler._store_lock:
+                ImageHandler._imports_running -= 1
+
+    @staticmethod
+    def collect_orphan_clues(db):
+        """
+        Delete stored clue images that no question has referred to for
+        CLUE_ORPHAN_GRACE_SECONDS. Only images registered through store_clue
+        are ever removed. Nothing is collected while a question import is
+        running, since its clue has no question until the import finishes.
+
+        Returns:
+            int: Number of files removed
+        """
+        with ImageHandler._store_lock:
+            if ImageHandler._imports_running:
+                return 0
+            orphans = db.select_orphan_clue_assets()
+            removed = 0
+            for filename in orphans:
+                try:
+                    os.remove(os.path.join(CLUES_DIR, filename))
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"Error removing orphan clue {filename}: {e}")
+                ImageHandler.remove_clue_levels(filename)
+            db.delete_clue_assets(orphans)
+        return removed
+
+    @staticmethod
+    def load_clue_image(source, target_height=CLUE_IMAGE_SIZE[1]):
+        """
+        Load a clue image resized to the given height, keeping its aspect ratio.
+
+        JPEGs are decoded at the smallest 1/2, 1/4 or 1/8 scale that is still
+        at least the target size, so large photos are never decoded at full
+        resolution just to be shrunk. The final resize is always LANCZOS.
+
+        Args:
+            source: Path or file-like object of the image
+            target_height (int): Height of the returned image
+
+        Returns:
+            PIL.Image.Image: The resized image
+        """
+        with Image.open(source) as img:
+            aspect_ratio = img.width / img.height
+            target_width = max(1, int(target_height * aspect_ratio))
+            if img.format == 'JPEG':
+                img.draft('RGB', (target_width, target_height))
+            return img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+
+    @staticmethod
+    def clue_level_path(filename, level):
+        """Get the path of a clue's precomputed image for a progressive clue level."""
+        return os.path.join(CLUE_LEVELS_DIR, f"{filename}.{level}.png")
+
+    @staticmethod
+    def render_clue_levels(image):
+        """
+        Make the progressive clue images from a clue at display size.
+
+        Args:
+            image (PIL.Image.Image): The full clue
+
+        Returns:
+            list: One RGB image per level: pixelated, partially revealed, full
+        """
+        image = image.convert('RGB')
+        width, height = image.size
+
+        small = image.resize(
+            (max(1, width // CLUE_PIXEL_BLOCK), max(1, height // CLUE_PIXEL_BLOCK)),
+            Image.Resampling.BOX
+        )
+        pixelated = small.resize(image.size, Image.Resampling.NEAREST)
+
+        # The centre shown sharp over the pixelated clue
+        partial = pixelated.copy()
+        box_width, box_height = int(width * CLUE_PARTIAL_REVEAL), int(height * CLUE_PARTIAL_REVEAL)
+        box = ((width - box_width) // 2, (height - box_height) // 2)
+        box = box + (box[0] + box_width, box[1] + box_height)
+        partial.paste(image.crop(box), box[:2])
+
+        return [pixelated, partial, image][:len(CLUE_LEVEL_POINTS)]
+
+    @staticmethod
+    def _clue_levels_fresh(filename):
+        """Check that every level of a clue exists and is newer than the clue."""
+        try:
+            source_mtime = os.stat(os.path.join(CLUES_DIR, filename)).st_mtime_ns
+            return all(
+                os.stat(ImageHandler.clue_level_path(filename, level)).st_mtime_ns >= source_mtime
+                for level in range(1, len(CLUE_LEVEL_POINTS) + 1)
+            )
+        except OSError:
+            return False
+
+    @staticmethod
+    def build_clue_levels(filename):
+        """
+        Precompute a clue's progressive levels at display size, so showing a
+        level is a small PNG read with no resizing or filtering.
+        Levels newer than the clue are left as they are.
+
+        Args:
+            filename (str): Clue image in the clues directory
+
+        Returns:
+            bool: True if the levels are up to date
+        """
+        if ImageHandler._clue_levels_fresh(filename):
+            return True
+        temp_path = None
+        try:
+            image = ImageHandler.load_clue_image(
+                os.path.join(CLUES_DIR, filename), target_height=CLUE_IMAGE_SIZE[1]
+            )
+            os.makedirs(CLUE_LEVELS_DIR, exist_ok=True)
+            for level, level_image in enumerate(ImageHandler.render_clue_levels(image), start=1):
+                path = ImageHandler.clue_level_path(filename, level)
+                temp_path = path + '.tmp'
+                level_image.save(temp_path, format='PNG', compress_level=1)
+                os.replace(temp_path, path)
+            return True
+        except Exception as e:
+            print(f"Error building clue levels for {filename}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+    @staticmethod
+    def load_clue_level(filename, level):
+        """
+        Load a precomputed progressive clue level.
+
+        Args:
+            filename (str): Clue image in the clues directory
+            level (int): Clue level, 1 for the least revealing
+
+        Returns:
+            PIL.Image.Image: The level image, or None if it is missing or
+                             older than the clue
+        """
+        if not ImageHandler._clue_levels_fresh(filename):
+            return None
+        try:
+            with Image.open(ImageHandler.clue_level_path(filename, level)) as img:
+                img.load()
+                return img
+        except OSError:
             return None
 
+    @staticmethod
+    def remove_clue_levels(filename):
+        """Delete a clue's precomputed levels."""
+        for level in range(1, len(CLUE_LEVEL_POINTS) + 1):
+            try:
+                os.remove(ImageHandler.clue_level_path(filename, level))
+            except OSError:
+                pass
+
+    @staticmethod
+    def create_thumbnail(file_path, size=THUMBNAIL_SIZE):
+        """
+        Load an image scaled down to fit within the given size.
+        Safe to call from a worker thread.
+        """
+        with Image.open(file_path) as img:
+            img.draft('RGB', size)
+            img = img.convert('RGB')
+            img.thumbnail(size)
+            return img
+
     @staticmethod
     def get_supported_formats():
         """Get list of supported image formats."""
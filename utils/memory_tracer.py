@@ -0,0 +1,182 @@
+"""
+Memory tracing for the Car Brand Quiz application.
+
+In --memtrace mode a checkpoint is taken after every page transition and at
+the end of every game. Each checkpoint records Python heap use from
+tracemalloc, resident memory, live widget counts per page and the number of
+live images, and is appended to a JSON Lines log together with the growth
+since the previous checkpoint with the same label. Steady-state repeats of
+the same transition should not grow; any that grows by more than the
+threshold is flagged with the allocation sites responsible.
+
+Summarize a log with:
+    python -m utils.memory_tracer assets/data/memtrace.log
+"""
+import gc
+import json
+import time
+import tracemalloc
+from config import MEMTRACE_LOG_PATH, MEMTRACE_THRESHOLD_KB, MEMTRACE_FRAMES
+
+
+def resident_kb():
+    """Current resident memory of this process in KiB, or None if unknown."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def count_widgets(widget):
+    """Count a widget and all of its descendants."""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def count_images():
+    """Count live CTkImage and PIL images."""
+    counts = {'ctk_images': 0, 'pil_images': 0}
+    for obj in gc.get_objects():
+        name = type(obj).__name__
+        if name == 'CTkImage':
+            counts['ctk_images'] += 1
+        elif name.endswith('ImageFile') or name == 'Image':
+            counts['pil_images'] += 1
+    return counts
+
+
+class MemoryTracer:
+    """Takes memory checkpoints and logs their growth."""
+
+    def __init__(self, log_path=MEMTRACE_LOG_PATH, threshold_kb=MEMTRACE_THRESHOLD_KB):
+        """
+        Start tracing.
+
+        Args:
+            log_path (str): JSON Lines log to append checkpoints to
+            threshold_kb (int): Growth between repeats of a checkpoint that gets flagged
+        """
+        self.log_path = log_path
+        self.threshold_kb = threshold_kb
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(MEMTRACE_FRAMES)
+        self.previous = {}
+        self.log = open(log_path, 'a', encoding='utf-8')
+        self.started_at = time.time()
+        self._write({'event': 'start', 'time': self.started_at, 'rss_kb': resident_kb()})
+
+    def _write(self, record):
+        """Append a record to the log."""
+        self.log.write(json.dumps(record) + '\n')
+        self.log.flush()
+
+    def checkpoint(self, label, root, pages=None, caches=None):
+        """
+        Record memory use and its growth since the last checkpoint with this label.
+
+        Args:
+            label (str): What just happened, e.g. 'page:home' or 'game_over'
+            root: Root window, for the total widget count
+            pages (dict, optional): Page name -> BasePage, for per-page widget counts
+            caches (dict, optional): Cache name -> current number of entries
+
+        Returns:
+            dict: The record written to the log
+        """
+        # Only memory that survives a collection counts as growth
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        traced_kb = sum(stat.size for stat in snapshot.statistics('filename')) // 1024
+
+        record = {
+            'event': 'checkpoint',
+            'label': label,
+            'time': time.time(),
+            'traced_kb': traced_kb,
+            'rss_kb': resident_kb(),
+            'widgets': count_widgets(root),
+            **count_images(),
+        }
+        if pages:
+            record['page_widgets'] = {
+                name: count_widgets(page.frame) if page.frame else 0
+                for name, page in pages.items()
+            }
+        if caches:
+            record['caches'] = dict(caches)
+
+        previous = self.previous.get(label)
+        if previous:
+            previous_record, previous_snapshot = previous
+            record['growth_kb'] = traced_kb - previous_record['traced_kb']
+            record['widget_growth'] = record['widgets'] - previous_record['widgets']
+            if record['growth_kb'] > self.threshold_kb:
+                record['flagged'] = True
+                record['top_growth'] = [
+                    f"{stat.traceback[0].filename}:{stat.traceback[0].lineno} +{stat.size_diff // 1024} KiB"
+                    for stat in snapshot.compare_to(previous_snapshot, 'lineno')[:5]
+                ]
+                print(f"Memory grew {record['growth_kb']} KiB since the last '{label}'")
+
+        self.previous[label] = (record, snapshot)
+        self._write(record)
+        return record
+
+    def close(self):
+        """Write a final record and stop tracing."""
+        self._write({
+            'event': 'stop',
+            'time': time.time(),
+            'uptime_s': round(time.time() - self.started_at),
+            'rss_kb': resident_kb(),
+        })
+        self.log.close()
+        tracemalloc.stop()
+
+
+def summarize_log(path):
+    """
+    Summarize growth per checkpoint label over a memtrace log.
+
+    Returns:
+        dict: Label -> checkpoints, total growth, mean growth per repeat and flag count
+    """
+    summary = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            if record.get('event') != 'checkpoint':
+                continue
+            entry = summary.setdefault(record['label'], {
+                'checkpoints': 0, 'first_kb': record['traced_kb'], 'growth_kb': 0, 'flagged': 0
+            })
+            entry['checkpoints'] += 1
+            entry['growth_kb'] = record['traced_kb'] - entry['first_kb']
+            entry['flagged'] += bool(record.get('flagged'))
+
+    for entry in summary.values():
+        repeats = entry['checkpoints'] - 1
+        entry['kb_per_repeat'] = round(entry['growth_kb'] / repeats, 2) if repeats else 0
+        del entry['first_kb']
+    return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summarize a memtrace log.")
+    parser.add_argument('log', nargs='?', default=MEMTRACE_LOG_PATH)
+    args = parser.parse_args()
+
+    for label, entry in sorted(summarize_log(args.log).items()):
+        print(
+            f"{label:<24} {entry['checkpoints']:>6} checkpoints  "
+            f"{entry['growth_kb']:>+8} KiB total  {entry['kb_per_repeat']:>+8} KiB/repeat  "
+            f"{entry['flagged']} flagged"
+        )
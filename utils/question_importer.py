@@ -0,0 +1,126 @@
+"""
+Background question authoring for the Car Brand Quiz application.
+
+Copying, validating and thumbnailing clue images and inserting questions are
+done here, off the UI thread. Every function opens its own database
+connection, so it can be handed to BackgroundTasks as it is.
+"""
+import os
+from database_operations import DatabaseOperations
+from utils.image_handler import ImageHandler
+from config import CLUES_DIR, PREVIEW_SIZE
+
+# Tries at numbering a repeated question before giving up
+IMPORT_INSERT_ATTEMPTS = 3
+
+
+class QuestionImporter:
+    """Prepares clue images and adds questions from a worker thread."""
+
+    @staticmethod
+    def answer_from_filename(path):
+        """Guess a question's answer from its image name, e.g. 'rolls_royce.jpg' -> 'Rolls Royce'."""
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return ' '.join(stem.replace('_', ' ').replace('-', ' ').split()).title()
+
+    @staticmethod
+    def prepare_clue(path):
+        """
+        Store an image as a clue and make its preview.
+
+        Images already in the clues directory are used as they are; anything
+        else is copied in under its content hash and registered.
+
+        Args:
+            path (str): Image file chosen by the user
+
+        Returns:
+            dict: filename (None if the file is not a valid image),
+                  near_duplicates and preview (a PIL image, or None)
+        """
+        if os.path.dirname(os.path.abspath(path)) == os.path.abspath(CLUES_DIR):
+            filename = os.path.basename(path)
+            near_duplicates = []
+            if not ImageHandler.validate_image_in_clues(filename):
+                filename = None
+            else:
+                db = DatabaseOperations()
+                try:
+                    ImageHandler.claim_clue(filename, db)
+                finally:
+                    db.conn.close()
+                ImageHandler.build_clue_levels(filename)
+        else:
+            db = DatabaseOperations()
+            try:
+                filename, near_duplicates = ImageHandler.store_clue(path, db)
+            finally:
+                db.conn.close()
+
+        preview = None
+        if filename:
+            preview = ImageHandler.create_thumbnail(os.path.join(CLUES_DIR, filename), PREVIEW_SIZE)
+        return {'filename': filename, 'near_duplicates': near_duplicates, 'preview': preview}
+
+    @staticmethod
+    def add_question(question, image_filename, answer, number_repeats=False):
+        """
+        Validate a question's clue and insert the question.
+
+        Args:
+            question (str): Question text
+            image_filename (str): Clue image in the clues directory
+            answer (str): Correct answer
+            number_repeats (bool): Number the question text if it is already
+                used, since question text must be unique
+
+        Returns:
+            str: None on success, otherwise why the question was not added
+        """
+        if not ImageHandler.validate_image_in_clues(image_filename):
+            return "Selected image file is not accessible"
+
+        db = DatabaseOperations()
+        try:
+            # Another worker may take the same number first; pick again if so
+            for _ in range(IMPORT_INSERT_ATTEMPTS if number_repeats else 1):
+                text = db.unique_question_text(question) if number_repeats else question
+                if db.insert_question(text, image_filename, answer):
+                    return None
+            return "Error saving question"
+        finally:
+            db.conn.close()
+
+    @staticmethod
+    def import_image(path, question):
+        """
+        Add one question for an image file, answered by the file's name.
+
+        Args:
+            path (str): Image file
+            question (str): Question text to use
+
+        Returns:
+            dict: path, answer, error (None on success), near_duplicates and
+                  thumbnail (a PIL image, or None)
+        """
+        answer = QuestionImporter.answer_from_filename(path)
+        result = {'path': path, 'answer': answer, 'near_duplicates': [], 'thumbnail': None}
+        # The stored clue has no question until add_question, so hold off orphan collection
+        with ImageHandler.importing():
+            try:
+                clue = QuestionImporter.prepare_clue(path)
+            except OSError as e:
+                result['error'] = f"Could not read image: {e}"
+                return result
+
+            if not clue['filename']:
+                result['error'] = "Not a valid image file"
+                return result
+
+            result['near_duplicates'] = clue['near_duplicates']
+            result['thumbnail'] = clue['preview']
+            result['error'] = QuestionImporter.add_question(
+                question, clue['filename'], answer, number_repeats=True
+            )
+        return result
@@ -0,0 +1,242 @@
+"""
+Single-file question packs for the Car Brand Quiz application.
+
+A pack holds questions and their clue images in one memory-mapped file:
+
+    header | index | question records | clue image blobs
+
+The index is a fixed-size entry per question, sorted by question id, that
+gives the offset and length of the question record and of its clue image.
+A question and its clue can therefore be read by offset without loading the
+rest of the file, and clue images shared by several questions are stored once.
+"""
+import io
+import mmap
+import os
+import struct
+from config import get_clue_path
+from utils.question_sources import QuestionSource
+
+PACK_MAGIC = b'CBQPACK\x00'
+PACK_VERSION = 1
+
+# magic, version, flags, question count, index offset
+HEADER = struct.Struct('<8sHHIQ')
+# question id, record offset, record length, image offset, image length
+INDEX_ENTRY = struct.Struct('<IQIQI')
+# question, image filename and answer lengths (UTF-8 bytes)
+RECORD_HEADER = struct.Struct('<HHH')
+
+# Clue blobs start on a block boundary so reading one costs a single seek
+BLOB_ALIGNMENT = 4096
+
+
+class QuestionPackError(Exception):
+    """Raised when a pack file is missing, truncated or not a question pack."""
+
+
+class QuestionPack(QuestionSource):
+    """Read-only, memory-mapped question pack usable as a question source."""
+
+    def __init__(self, pack_path):
+        """
+        Open and map a question pack.
+
+        Args:
+            pack_path (str): Path to the pack file
+        """
+        self.pack_path = pack_path
+        try:
+            self.file = open(pack_path, 'rb')
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise QuestionPackError(f"Cannot open question pack {pack_path}: {e}") from e
+
+        if len(self.data) < HEADER.size:
+            raise QuestionPackError(f"{pack_path} is too small to be a question pack")
+
+        magic, version, _flags, self.entry_count, self.index_offset = HEADER.unpack_from(self.data, 0)
+        if magic != PACK_MAGIC:
+            raise QuestionPackError(f"{pack_path} is not a question pack")
+        if version != PACK_VERSION:
+            raise QuestionPackError(f"Unsupported question pack version {version}")
+        if self.index_offset + self.entry_count * INDEX_ENTRY.size > len(self.data):
+            raise QuestionPackError(f"{pack_path} is truncated")
+
+    def __len__(self):
+        return self.entry_count
+
+    def _entry(self, position):
+        """Read the index entry at a position."""
+        return INDEX_ENTRY.unpack_from(self.data, self.index_offset + position * INDEX_ENTRY.size)
+
+    def _find(self, question_id):
+        """Binary search the index for a question id."""
+        low, high = 0, self.entry_count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            entry = self._entry(middle)
+            if entry[0] == question_id:
+                return entry
+            if entry[0] < question_id:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def _read_record(self, entry):
+        """Decode a question record into an (id, question, image_filename, answer) row."""
+        question_id, offset, _length, _image_offset, _image_length = entry
+        lengths = RECORD_HEADER.unpack_from(self.data, offset)
+        offset += RECORD_HEADER.size
+        fields = []
+        for length in lengths:
+            fields.append(self.data[offset:offset + length].decode('utf-8'))
+            offset += length
+        return (question_id, *fields)
+
+    def get_question(self, question_id):
+        """
+        Get a single question by id.
+
+        Returns:
+            tuple: (id, question, image_filename, answer), or None if not found
+        """
+        entry = self._find(question_id)
+        return self._read_record(entry) if entry else None
+
+    def select_question(self):
+        """
+        Retrieve all questions in the pack.
+
+        Returns:
+            list: List of (id, question, image_filename, answer) tuples
+        """
+        return [self._read_record(self._entry(i)) for i in range(self.entry_count)]
+
+    def question_ids(self):
+        """
+        Get the ids of the questions in the pack that have a clue image.
+
+        Returns:
+            list: Question ids, read from the index alone
+        """
+        return [entry[0] for entry in map(self._entry, range(self.entry_count)) if entry[4]]
+
+    def select_playable_questions(self):
+        """
+        Retrieve the questions in the pack that have a clue image.
+
+        Returns:
+            list: List of (id, question, image_filename, answer) tuples
+        """
+        playable = []
+        for i in range(self.entry_count):
+            entry = self._entry(i)
+            if entry[4]:
+                playable.append(self._read_record(entry))
+        return playable
+
+    def read_clue(self, question_id):
+        """
+        Get a question's clue image bytes without copying them.
+
+        Returns:
+            memoryview: View into the mapped file, or None if not found
+        """
+        entry = self._find(question_id)
+        if not entry or not entry[4]:
+            return None
+        return memoryview(self.data)[entry[3]:entry[3] + entry[4]]
+
+    def open_clue(self, question_id, image_filename):
+        """
+        Open a question's clue image for PIL.
+
+        Returns:
+            io.BytesIO: File-like object holding just this clue's bytes
+        """
+        clue = self.read_clue(question_id)
+        if clue is None:
+            raise FileNotFoundError(f"No clue image in pack for question {question_id}")
+        return io.BytesIO(clue)
+
+    def close(self):
+        """Unmap and close the pack file."""
+        try:
+            self.data.close()
+            self.file.close()
+        except (BufferError, ValueError):
+            # Views into the mapping are still alive; the OS releases it on exit
+            pass
+
+    @staticmethod
+    def build(rows, output_path, clue_dir_lookup=get_clue_path):
+        """
+        Write a question pack.
+
+        Args:
+            rows (iterable): (id, question, image_filename, answer) tuples
+            output_path (str): Path of the pack file to create
+            clue_dir_lookup: Function mapping an image filename to its path
+
+        Returns:
+            int: Number of questions written
+        """
+        rows = sorted((tuple(row[:4]) for row in rows), key=lambda row: row[0])
+        index_offset = HEADER.size
+        records_offset = index_offset + len(rows) * INDEX_ENTRY.size
+
+        entries = []
+        blobs = {}      # image filename -> (offset, length)
+        temp_path = output_path + '.tmp'
+
+        with open(temp_path, 'wb') as f:
+            # Question records
+            f.seek(records_offset)
+            record_positions = []
+            for question_id, question, image_filename, answer in rows:
+                fields = [str(value or '').encode('utf-8') for value in (question, image_filename, answer)]
+                record = RECORD_HEADER.pack(*(len(field) for field in fields)) + b''.join(fields)
+                record_positions.append((f.tell(), len(record)))
+                f.write(record)
+
+            # Clue image blobs, each stored once
+            for (question_id, _question, image_filename, _answer), (offset, length) in zip(rows, record_positions):
+                if image_filename and image_filename not in blobs:
+                    image_path = clue_dir_lookup(image_filename)
+                    if os.path.exists(image_path):
+                        padding = -f.tell() % BLOB_ALIGNMENT
+                        f.write(b'\0' * padding)
+                        with open(image_path, 'rb') as image_file:
+                            blob = image_file.read()
+                        blobs[image_filename] = (f.tell(), len(blob))
+                        f.write(blob)
+                    else:
+                        print(f"Clue image missing, packing without it: {image_filename}")
+                        blobs[image_filename] = (0, 0)
+
+                image_offset, image_length = blobs.get(image_filename, (0, 0))
+                entries.append(INDEX_ENTRY.pack(question_id, offset, length, image_offset, image_length))
+
+            # Header and index
+            f.seek(0)
+            f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(rows), index_offset))
+            f.write(b''.join(entries))
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temp_path, output_path)
+        return len(rows)
+
+
+if __name__ == "__main__":
+    import argparse
+    from database_operations import DatabaseOperations
+
+    parser = argparse.ArgumentParser(description="Build a question pack from the quiz database.")
+    parser.add_argument('output', help="Path of the pack file to create")
+    args = parser.parse_args()
+
+    count = QuestionPack.build(DatabaseOperations().select_question(), args.output)
+    print(f"Wrote {count} questions to {args.output}")
@@ -0,0 +1,90 @@
+"""
+In-memory snapshot of the question bank for the Car Brand Quiz application.
+
+Gameplay reads are served from an immutable copy of the playable questions
+instead of the on-disk connection shared with score writes. Before each read
+the snapshot checks, without touching the disk, whether anything could have
+changed: PRAGMA data_version moves when another connection commits, and the
+connection's total_changes moves on its own writes. Only then is the question
+version counter read, and the copy is rebuilt only if that has moved.
+"""
+from utils.question_sources import MemoryQuestionSource
+
+
+class QuestionSnapshot(MemoryQuestionSource):
+    """Read-only question source backed by a DatabaseOperations instance."""
+
+    def __init__(self, db):
+        """
+        Load the snapshot.
+
+        Args:
+            db (DatabaseOperations): Database to copy questions from
+        """
+        self.db = db
+        self.version = None
+        self.seen = None
+        super().__init__()
+        self.refresh()
+
+    def _changes_seen(self):
+        """Cheap marker that moves whenever any connection may have written."""
+        data_version = self.db.conn.execute('PRAGMA data_version').fetchone()[0]
+        return data_version, self.db.conn.total_changes
+
+    def refresh(self):
+        """
+        Reload the questions if the question bank has changed.
+
+        Returns:
+            bool: True if the snapshot was reloaded
+        """
+        seen = self._changes_seen()
+        if seen == self.seen:
+            return False
+        self.seen = seen
+
+        # Read the version first: a write landing in between only causes a
+        # spare reload next time, never a stale snapshot
+        version = self.db.get_question_version()
+        if version is not None and version == self.version:
+            return False
+
+        self.load(self.db.select_playable_questions())
+        self.version = version
+        return True
+
+    def select_playable_questions(self):
+        """
+        Get every question whose clue image has not been flagged as broken.
+
+        Returns:
+            tuple: (id, question, image_filename, answer) tuples
+        """
+        self.refresh()
+        return self.questions
+
+    def question_ids(self):
+        self.refresh()
+        return list(self.by_id)
+
+    def count(self):
+        self.refresh()
+        return len(self.by_id)
+
+    def get_question(self, question_id):
+        """
+        Look up a playable question.
+
+        Returns:
+            tuple: (id, question, image_filename, answer), or None
+        """
+        self.refresh()
+        return self.by_id.get(question_id)
+
+    def open_clue(self, question_id, image_filename):
+        """Locate a question's clue image."""
+        return self.db.open_clue(question_id, image_filename)
+
+    def has_clue_levels(self, question_id):
+        return True
@@ -0,0 +1,377 @@
+"""
+Pluggable question sources for the Car Brand Quiz application.
+
+The game only needs a few things from wherever its questions live: the ids
+of the playable questions, a count, a random sample of ids, and one question
+or clue at a time by id. Every source below answers those without reading
+all of its questions into memory, so large or seasonal packs can be played
+without importing them into the main database.
+
+    SQLiteQuestionSource      the question table, queried directly
+    MemoryQuestionSource      a list of rows held in memory
+    PackDirectorySource       a directory of JSON Lines (.jsonl) and CSV packs
+    CompositeQuestionSource   several sources played as one
+
+QuestionPack (single-file .cbqpack) and QuestionSnapshot are sources too.
+"""
+import csv
+import json
+import os
+import random
+from abc import ABC, abstractmethod
+from array import array
+from config import get_clue_path
+
+# Composite ids are source index * stride + the source's own id, so the
+# first source (normally the database) keeps its ids and its statistics
+COMPOSITE_ID_STRIDE = 1 << 32
+
+# Pack file extensions read by PackDirectorySource
+PACK_FORMATS = ('.jsonl', '.csv')
+
+
+class QuestionSource(ABC):
+    """
+    Interface of a question source. Rows are (id, question, image_filename,
+    answer) tuples; only questions with a usable clue are playable.
+    """
+
+    @abstractmethod
+    def question_ids(self):
+        """
+        Get the ids of every playable question.
+
+        Returns:
+            list: Question ids
+        """
+
+    def count(self):
+        """Get the number of playable questions."""
+        return len(self.question_ids())
+
+    def sample(self, k):
+        """
+        Pick playable questions at random, without repeats.
+
+        Args:
+            k (int): Number of questions wanted
+
+        Returns:
+            list: Up to k question ids
+        """
+        ids = self.question_ids()
+        return random.sample(ids, min(k, len(ids)))
+
+    @abstractmethod
+    def get_question(self, question_id):
+        """
+        Get a question by id.
+
+        Returns:
+            tuple: (id, question, image_filename, answer), or None if not found
+        """
+
+    @abstractmethod
+    def open_clue(self, question_id, image_filename):
+        """
+        Open a question's clue image.
+
+        Returns:
+            Path or file-like object suitable for Image.open
+        """
+
+    def has_clue_levels(self, question_id):
+        """Check whether the question's clue is in the clues directory, with precomputed levels."""
+        return False
+
+    def select_playable_questions(self):
+        """
+        Retrieve every playable question. Reads the whole source; prefer
+        question_ids() and get_question() for large sources.
+
+        Returns:
+            list: List of (id, question, image_filename, answer) tuples
+        """
+        rows = (self.get_question(question_id) for question_id in self.question_ids())
+        return [row for row in rows if row is not None]
+
+    def refresh(self):
+        """
+        Pick up changes made since the source was opened.
+
+        Returns:
+            bool: True if anything was reloaded
+        """
+        return False
+
+    def close(self):
+        """Release any files held by the source."""
+
+
+class SQLiteQuestionSource(QuestionSource):
+    """The question table, queried on every call."""
+
+    def __init__(self, db):
+        """
+        Args:
+            db (DatabaseOperations): Database to read questions from
+        """
+        self.db = db
+
+    def question_ids(self):
+        return self.db.select_playable_question_ids()
+
+    def count(self):
+        return self.db.count_playable_questions()
+
+    def get_question(self, question_id):
+        return self.db.get_playable_question(question_id)
+
+    def open_clue(self, question_id, image_filename):
+        return self.db.open_clue(question_id, image_filename)
+
+    def has_clue_levels(self, question_id):
+        return True
+
+    def select_playable_questions(self):
+        return self.db.select_playable_questions()
+
+
+class MemoryQuestionSource(QuestionSource):
+    """Questions held in memory, e.g. built by a script or loaded from elsewhere."""
+
+    def __init__(self, rows=(), clue_lookup=get_clue_path):
+        """
+        Args:
+            rows (iterable): (id, question, image_filename, answer) tuples
+            clue_lookup: Function mapping an image filename to its path
+        """
+        self.clue_lookup = clue_lookup
+        self.load(rows)
+
+    def load(self, rows):
+        """Replace the questions held."""
+        self.questions = tuple(tuple(row[:4]) for row in rows)
+        self.by_id = {row[0]: row for row in self.questions}
+
+    def question_ids(self):
+        return list(self.by_id)
+
+    def count(self):
+        return len(self.by_id)
+
+    def get_question(self, question_id):
+        return self.by_id.get(question_id)
+
+    def open_clue(self, question_id, image_filename):
+        return self.clue_lookup(image_filename)
+
+    def select_playable_questions(self):
+        return self.questions
+
+
+class PackDirectorySource(QuestionSource):
+    """
+    Every pack file in a directory, read by offset.
+
+    Each line of a .jsonl pack is an object with question, image and answer
+    keys; a .csv pack has a header row naming the same columns, and one
+    question per line. Images are looked up next to the pack first, then in
+    the clues directory. Mounting reads the files once to note where each
+    playable question starts; questions are parsed again only when fetched.
+    Ids number the questions from 1 in file name order, so they are stable
+    as long as the packs are not edited.
+    """
+
+    def __init__(self, directory):
+        """
+        Index the packs in a directory.
+
+        Args:
+            directory (str): Directory holding the pack files
+        """
+        self.directory = directory
+        self.packs = []                 # (path, columns), columns None for JSON Lines
+        self.pack_numbers = array('H')  # Pack of each question
+        self.offsets = array('q')       # Byte offset of each question's line
+        self._index()
+
+    def _index(self):
+        """Note the pack and line offset of every playable question."""
+        try:
+            names = sorted(os.listdir(self.directory))
+        except OSError as e:
+            print(f"Error reading question pack directory {self.directory}: {e}")
+            return
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if os.path.splitext(name)[1].lower() not in PACK_FORMATS or not os.path.isfile(path):
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    columns = None
+                    if path.lower().endswith('.csv'):
+                        header = next(csv.reader([f.readline().decode('utf-8-sig')]), [])
+                        columns = [column.strip().lower() for column in header]
+                    pack = (path, columns)
+                    pack_number = len(self.packs)
+                    self.packs.append(pack)
+
+                    while True:
+                        offset = f.tell()
+                        line = f.readline()
+                        if not line:
+                            break
+                        record = self._parse(pack, line)
+                        if record and os.path.exists(self._clue_path(pack, record[1])):
+                            self.pack_numbers.append(pack_number)
+                            self.offsets.append(offset)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error reading question pack {path}: {e}")
+
+    @staticmethod
+    def _parse(pack, line):
+        """
+        Parse one line of a pack.
+
+        Returns:
+            tuple: (question, image, answer), or None if the line is blank or invalid
+        """
+        text = line.decode('utf-8').strip()
+        if not text:
+            return None
+        try:
+            if pack[1] is None:
+                record = json.loads(text)
+            else:
+                record = dict(zip(pack[1], next(csv.reader([text]))))
+            question = str(record['question']).strip()
+            image = str(record.get('image') or record.get('image_filename') or '').strip()
+            answer = str(record['answer']).strip()
+        except (ValueError, KeyError, TypeError, AttributeError, StopIteration):
+            return None
+        if not question or not image or not answer:
+            return None
+        return question, image, answer
+
+    @staticmethod
+    def _clue_path(pack, image):
+        """Resolve an image named in a pack: beside the pack, else in the clues directory."""
+        local_path = os.path.join(os.path.dirname(pack[0]), image)
+        return local_path if os.path.exists(local_path) else get_clue_path(image)
+
+    def _locate(self, question_id):
+        """Get the pack and line offset of a question, or None."""
+        position = question_id - 1
+        if not 0 <= position < len(self.offsets):
+            return None
+        return self.packs[self.pack_numbers[position]], self.offsets[position]
+
+    def question_ids(self):
+        return list(range(1, len(self.offsets) + 1))
+
+    def count(self):
+        return len(self.offsets)
+
+    def sample(self, k):
+        return random.sample(range(1, len(self.offsets) + 1), min(k, len(self.offsets)))
+
+    def get_question(self, question_id):
+        location = self._locate(question_id)
+        if location is None:
+            return None
+        pack, offset = location
+        try:
+            with open(pack[0], 'rb') as f:
+                f.seek(offset)
+                record = self._parse(pack, f.readline())
+        except OSError as e:
+            print(f"Error reading question pack {pack[0]}: {e}")
+            return None
+        return (question_id, *record) if record else None
+
+    def open_clue(self, question_id, image_filename):
+        location = self._locate(question_id)
+        if location is None:
+            raise FileNotFoundError(f"No question {question_id} in {self.directory}")
+        return self._clue_path(location[0], image_filename)
+
+
+class CompositeQuestionSource(QuestionSource):
+    """Several sources played as one deck."""
+
+    def __init__(self, sources):
+        """
+        Args:
+            sources (list): Question sources; the first keeps its own ids
+        """
+        self.sources = list(sources)
+
+    def _route(self, question_id):
+        """Split a composite id into its source and that source's id."""
+        index, local_id = divmod(question_id, COMPOSITE_ID_STRIDE)
+        if not 0 <= index < len(self.sources):
+            return None, None
+        return self.sources[index], local_id
+
+    def question_ids(self):
+        return [
+            index * COMPOSITE_ID_STRIDE + question_id
+            for index, source in enumerate(self.sources)
+            for question_id in source.question_ids()
+        ]
+
+    def count(self):
+        return sum(source.count() for source in self.sources)
+
+    def get_question(self, question_id):
+        source, local_id = self._route(question_id)
+        row = source.get_question(local_id) if source else None
+        return (question_id, *row[1:]) if row else None
+
+    def open_clue(self, question_id, image_filename):
+        source, local_id = self._route(question_id)
+        if source is None:
+            raise FileNotFoundError(f"No question source for question {question_id}")
+        return source.open_clue(local_id, image_filename)
+
+    def has_clue_levels(self, question_id):
+        source, local_id = self._route(question_id)
+        return source is not None and source.has_clue_levels(local_id)
+
+    def refresh(self):
+        return any([source.refresh() for source in self.sources])
+
+    def close(self):
+        for source in self.sources:
+            source.close()
+
+
+def open_question_source(db, pack_path=None, mount_dirs=(), snapshot=True):
+    """
+    Open the question source the game plays from.
+
+    Args:
+        db (DatabaseOperations): The quiz database
+        pack_path (str, optional): Question pack file to play instead of the database
+        mount_dirs (iterable): Directories of JSON Lines/CSV packs to play as well
+        snapshot (bool): Serve database questions from an in-memory snapshot
+
+    Returns:
+        QuestionSource: The source
+    """
+    # Imported here; both modules build on this one
+    from utils.question_pack import QuestionPack
+    from utils.question_snapshot import QuestionSnapshot
+
+    if pack_path:
+        main_source = QuestionPack(pack_path)
+    elif snapshot:
+        main_source = QuestionSnapshot(db)
+    else:
+        main_source = SQLiteQuestionSource(db)
+
+    mounted = [PackDirectorySource(directory) for directory in mount_dirs]
+    if not mounted:
+        return main_source
+    return CompositeQuestionSource([main_source, *mounted])
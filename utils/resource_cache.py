@@ -0,0 +1,86 @@
+"""
+Shared UI resources for the Car Brand Quiz application.
+
+Pages are rebuilt on every visit, so fonts and images are created once here
+and reused by every page and rebuild instead of being recreated each time.
+"""
+import os
+import customtkinter as ctk
+from PIL import Image
+from config import FONT_FAMILY, NORMAL_FONT_SIZE
+
+
+class ResourceCache:
+    """App-wide cache of CTkFont and CTkImage objects."""
+
+    def __init__(self, enabled=True):
+        """
+        Initialize the cache. Must be created after the root window.
+
+        Args:
+            enabled (bool): Whether to reuse resources; when disabled, fonts
+                are plain tuples and images are reopened on every call, as
+                before the cache existed, so its effect can be measured
+        """
+        self.enabled = enabled
+        self.fonts = {}
+        self.images = {}
+
+    def font(self, size=None, bold=False, family=FONT_FAMILY):
+        """
+        Get a shared font.
+
+        Args:
+            size (int, optional): Font size; defaults to NORMAL_FONT_SIZE
+            bold (bool): Whether the font is bold
+            family (str): Font family
+
+        Returns:
+            CTkFont: The font, or a font tuple when the cache is disabled
+        """
+        key = (family, size or NORMAL_FONT_SIZE, "bold" if bold else "normal")
+        if not self.enabled:
+            return key
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = ctk.CTkFont(family=key[0], size=key[1], weight=key[2])
+        return font
+
+    def image(self, path, size):
+        """
+        Get a shared image, loaded from disk the first time it is asked for.
+
+        Args:
+            path (str): Image file path
+            size (tuple): Display (width, height)
+
+        Returns:
+            CTkImage: The image
+
+        Raises:
+            OSError: If the image cannot be read
+        """
+        key = (path, tuple(size))
+        image = self.images.get(key)
+        if image is None:
+            with Image.open(path) as source:
+                source.load()
+                picture = source.copy()
+            image = ctk.CTkImage(light_image=picture, dark_image=picture, size=key[1])
+            if self.enabled:
+                self.images[key] = image
+        return image
+
+    def invalidate(self, directory=None):
+        """
+        Forget cached images, so they are reloaded from disk when next used.
+
+        Args:
+            directory (str, optional): Only forget images in this directory
+        """
+        if directory is None:
+            self.images.clear()
+            return
+        directory = os.path.abspath(directory)
+        for key in [key for key in self.images if os.path.dirname(os.path.abspath(key[0])) == directory]:
+            del self.images[key]
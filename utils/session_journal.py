@@ -0,0 +1,220 @@
+"""
+Crash-safe game session journal for the Car Brand Quiz application.
+
+The state of the game in progress is checkpointed to an append-only journal
+after every answer, so a game interrupted by a crash or power loss can be
+resumed. Each line is a JSON record prefixed with its CRC32, which lets a
+torn final write be detected and ignored. Writes and fsyncs happen on a
+background thread, and the journal is periodically compacted into a single
+snapshot record.
+"""
+import json
+import os
+import queue
+import threading
+import zlib
+from config import SESSION_JOURNAL_PATH, SESSION_COMPACT_EVERY
+
+
+def encode_record(record):
+    """Serialize a record as one checksummed journal line."""
+    payload = json.dumps(record, separators=(',', ':'))
+    return f"{zlib.crc32(payload.encode('utf-8')):08x} {payload}\n"
+
+
+def decode_record(line):
+    """
+    Parse a journal line.
+
+    Returns:
+        dict: The record, or None if the line is torn or corrupt
+    """
+    checksum, _, payload = line.rstrip('\n').partition(' ')
+    try:
+        if int(checksum, 16) != zlib.crc32(payload.encode('utf-8')):
+            return None
+        return json.loads(payload)
+    except ValueError:
+        return None
+
+
+def apply_record(state, record):
+    """
+    Fold a journal record into the session state.
+
+    Args:
+        state (dict): Current state, or None before the session starts
+        record (dict): Journal record
+
+    Returns:
+        dict: The new state, or None once the session has finished
+    """
+    kind = record.get('type')
+    if kind == 'start':
+        return {
+            'player': record['player'],
+            'deck': list(record['deck']),
+            'statistics': dict(record['statistics']),
+            'timed': record.get('timed', False)
+        }
+    if state is None:
+        return None
+    if kind == 'answer':
+        state['deck'] = [q for q in state['deck'] if q != record['question_id']]
+        state['statistics'] = dict(record['statistics'])
+        return state
+    if kind == 'finish':
+        return None
+    return state
+
+
+class SessionJournal:
+    """Checkpoints the game in progress from a background writer thread."""
+
+    def __init__(self, path=SESSION_JOURNAL_PATH, compact_every=SESSION_COMPACT_EVERY):
+        """
+        Initialize the journal.
+
+        Args:
+            path (str): Journal file path
+            compact_every (int): Records appended before the journal is compacted
+        """
+        self.path = path
+        self.compact_every = compact_every
+        self.records = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, name="session-journal", daemon=True)
+        self.writer.start()
+
+    @staticmethod
+    def load(path=SESSION_JOURNAL_PATH):
+        """
+        Read the unfinished session left in a journal, if any.
+
+        Returns:
+            dict: player, deck (remaining question ids), statistics
+                  (as from GameLogic.get_statistics) and timed, or None
+        """
+        state = None
+        try:
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    record = decode_record(line)
+                    if record is None:
+                        # A torn write can only be the last line
+                        break
+                    state = apply_record(state, record)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            print(f"Error reading session journal: {e}")
+            return None
+
+        if state and state['deck']:
+            return state
+        return None
+
+    def start(self, player, deck, statistics, timed=False):
+        """Begin journaling a new session, replacing any earlier one."""
+        self.records.put({
+            'type': 'start',
+            'player': player,
+            'deck': list(deck),
+            'statistics': statistics,
+            'timed': timed
+        })
+
+    def record_answer(self, question_id, statistics):
+        """Checkpoint an answered question and the statistics after it."""
+        self.records.put({
+            'type': 'answer',
+            'question_id': question_id,
+            'statistics': statistics
+        })
+
+    def finish(self):
+        """Mark the session finished; the journal is removed."""
+        self.records.put({'type': 'finish'})
+
+    def close(self):
+        """Write out pending records and stop the writer thread."""
+        self.records.put(None)
+        self.writer.join(timeout=5)
+
+    def _write_loop(self):
+        """Append queued records to the journal, fsyncing each batch."""
+        state = None
+        appended = 0
+        f = None
+        stopping = False
+        try:
+            while not stopping:
+                record = self.records.get()
+                batch = [record]
+                # Anything queued meanwhile goes out with the same fsync
+                while record is not None:
+                    try:
+                        record = self.records.get_nowait()
+                    except queue.Empty:
+                        break
+                    batch.append(record)
+
+                for record in batch:
+                    if record is None:
+                        stopping = True
+                        break
+                    try:
+                        state = apply_record(state, record)
+                        if record['type'] == 'start':
+                            f = self._rewrite(f, record)
+                            appended = 0
+                        elif record['type'] == 'finish':
+                            if f:
+                                f.close()
+                                f = None
+                            if os.path.exists(self.path):
+                                os.remove(self.path)
+                        elif f and state is not None:
+                            f.write(encode_record(record))
+                            appended += 1
+                            if appended >= self.compact_every:
+                                f.flush()
+                                f = self._rewrite(f, {'type': 'start', **state})
+                                appended = 0
+                    except OSError as e:
+                        print(f"Error writing session journal: {e}")
+
+                if f:
+                    try:
+                        f.flush()
+                        os.fsync(f.fileno())
+                    except OSError as e:
+                        print(f"Error syncing session journal: {e}")
+        finally:
+            if f:
+                f.close()
+
+    def _rewrite(self, f, snapshot):
+        """
+        Atomically replace the journal with a single snapshot record.
+
+        Returns:
+            file: The new journal, open for appending
+        """
+        if f:
+            f.close()
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as temp:
+            temp.write(encode_record(snapshot))
+            temp.flush()
+            os.fsync(temp.fileno())
+        os.replace(temp_path, self.path)
+
+        # Make the rename itself durable where directories can be synced
+        if hasattr(os, 'O_DIRECTORY'):
+            dir_fd = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+        return open(self.path, 'a', encoding='utf-8')
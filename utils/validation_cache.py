@@ -0,0 +1,206 @@
+"""
+Persistent image validation cache for the Car Brand Quiz application.
+
+Results of opening and verifying an image are stored in the database, keyed
+by the file's path, size and modification time. As long as a file has not
+changed, later checks only need an os.stat call.
+"""
+import os
+import sqlite3
+import threading
+from PIL import Image
+from config import DB_PATH
+
+
+class ImageValidationCache:
+    """Caches image validity, format and dimensions by path, size and mtime."""
+
+    def __init__(self, db_path=None):
+        """
+        Open the cache table, creating it if needed.
+
+        Args:
+            db_path (str, optional): Database file holding the cache
+        """
+        # Shared by the UI and background scanners, so access is serialized
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path or DB_PATH, check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS image_validation (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                valid INTEGER NOT NULL,
+                format TEXT,
+                mode TEXT,
+                width INTEGER,
+                height INTEGER
+            )
+        ''')
+        self.conn.commit()
+
+    @staticmethod
+    def _verify(path):
+        """
+        Open and verify an image file.
+
+        Returns:
+            dict: valid, format, mode, width and height of the image
+        """
+        try:
+            with Image.open(path) as img:
+                info = {
+                    'valid': True,
+                    'format': img.format,
+                    'mode': img.mode,
+                    'width': img.width,
+                    'height': img.height
+                }
+                img.verify()
+            return info
+        except Exception:
+            return {'valid': False, 'format': None, 'mode': None, 'width': None, 'height': None}
+
+    @staticmethod
+    def _row_to_info(row):
+        """Convert a cache row (valid, format, mode, width, height) to a dict."""
+        return {
+            'valid': bool(row[0]),
+            'format': row[1],
+            'mode': row[2],
+            'width': row[3],
+            'height': row[4]
+        }
+
+    def _store(self, entries):
+        """Write (path, size, mtime_ns, info) entries in one transaction."""
+        self.conn.executemany(
+            '''
+            INSERT OR REPLACE INTO image_validation
+                (path, size, mtime_ns, valid, format, mode, width, height)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''',
+            [
+                (path, size, mtime_ns, int(info['valid']), info['format'],
+                 info['mode'], info['width'], info['height'])
+                for path, size, mtime_ns, info in entries
+            ]
+        )
+        self.conn.commit()
+
+    def inspect(self, file_path):
+        """
+        Get an image's validity and properties, opening it only if it changed.
+
+        Args:
+            file_path (str): Path of the image
+
+        Returns:
+            dict: valid, format, mode, width and height of the image
+        """
+        path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return self._verify(path)
+
+        with self.lock:
+            row = self.conn.execute(
+                '''
+                SELECT valid, format, mode, width, height FROM image_validation
+                WHERE path = ? AND size = ? AND mtime_ns = ?
+                ''',
+                (path, stat.st_size, stat.st_mtime_ns)
+            ).fetchone()
+            if row:
+                return self._row_to_info(row)
+
+        info = self._verify(path)
+        with self.lock:
+            try:
+                self._store([(path, stat.st_size, stat.st_mtime_ns, info)])
+            except sqlite3.Error as e:
+                print(f"Error caching image validation: {e}")
+        return info
+
+    def scan_directory(self, directory):
+        """
+        Validate every file in a directory, re-checking only changed files.
+
+        Uses a single os.scandir pass and one range query over the cache,
+        so a scan of an unchanged directory does no image decoding at all.
+
+        Args:
+            directory (str): Directory to scan
+
+        Returns:
+            dict: Maps each filename to its validation info
+        """
+        directory = os.path.abspath(directory)
+        prefix = os.path.join(directory, '')
+
+        current = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    current[entry.name] = (stat.st_size, stat.st_mtime_ns)
+
+        with self.lock:
+            # Every cached path under the directory sorts between prefix and prefix + U+FFFF
+            rows = self.conn.execute(
+                '''
+                SELECT path, size, mtime_ns, valid, format, mode, width, height
+                FROM image_validation
+                WHERE path >= ? AND path < ?
+                ''',
+                (prefix, prefix + '\uffff')
+            ).fetchall()
+
+        cached = {}
+        for path, size, mtime_ns, *info in rows:
+            name = path[len(prefix):]
+            if os.sep not in name:
+                cached[name] = (size, mtime_ns, self._row_to_info(info))
+
+        results = {}
+        changed = []
+        for name, (size, mtime_ns) in current.items():
+            hit = cached.get(name)
+            if hit and hit[0] == size and hit[1] == mtime_ns:
+                results[name] = hit[2]
+            else:
+                info = self._verify(prefix + name)
+                results[name] = info
+                changed.append((prefix + name, size, mtime_ns, info))
+
+        removed = [(prefix + name,) for name in cached if name not in current]
+
+        with self.lock:
+            try:
+                if changed:
+                    self._store(changed)
+                if removed:
+                    self.conn.executemany('DELETE FROM image_validation WHERE path = ?', removed)
+                    self.conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error caching image validation: {e}")
+
+        return results
+
+    def invalidate(self, file_path=None):
+        """
+        Forget cached results for one file, or for every file.
+
+        Args:
+            file_path (str, optional): Path to forget; all paths if omitted
+        """
+        with self.lock:
+            if file_path is None:
+                self.conn.execute('DELETE FROM image_validation')
+            else:
+                self.conn.execute(
+                    'DELETE FROM image_validation WHERE path = ?',
+                    (os.path.abspath(file_path),)
+                )
+            self.conn.commit()